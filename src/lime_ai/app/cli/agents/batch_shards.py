@@ -0,0 +1,72 @@
+import asyncio
+import json
+import sys
+from collections.abc import Callable
+from time import perf_counter
+
+from lime_ai.entities.batch import BatchJob, BatchJobResult, BatchJobStatus, BatchSummary
+
+# Job results carry the final state, so a single line can be large.
+_LINE_LIMIT = 64 * 1024 * 1024
+
+
+async def run_shards(
+    jobs: list[BatchJob],
+    processes: int,
+    worker_args: list[str],
+    on_result: Callable[[BatchJobResult], None],
+) -> BatchSummary:
+    """Run `jobs` in `processes` worker processes and aggregate their results.
+
+    Every worker is this CLI started with `worker_args` plus `--shard I/N`. It
+    builds the same job list, runs its share with its own container and
+    Copilot client, and writes each result as a JSON line on stdout as soon as
+    the job finishes. Jobs of a worker that exits without reporting them are
+    marked FAILED.
+
+    Args:
+        jobs (list[BatchJob]): All jobs of the batch, as the workers will build them.
+        processes (int): The number of worker processes (N).
+        worker_args (list[str]): The CLI arguments that rebuild the batch, starting with the command name.
+        on_result (Callable): Called with each result as it arrives.
+    """
+    started = perf_counter()
+    results: dict[int, BatchJobResult] = {}
+
+    async def run_shard(shard: int):
+        shard_jobs = {job.index: job for job in jobs if job.index % processes == shard}
+        process = await asyncio.create_subprocess_exec(
+            *worker_command(),
+            *worker_args,
+            "--shard",
+            f"{shard}/{processes}",
+            stdout=asyncio.subprocess.PIPE,
+            limit=_LINE_LIMIT,
+        )
+        async for line in process.stdout:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            job = shard_jobs.get(data.get("index")) if isinstance(data, dict) else None
+            if job is None or job.index in results:
+                continue
+            results[job.index] = BatchJobResult.from_dict(job, data)
+            on_result(results[job.index])
+
+        code = await process.wait()
+        for job in shard_jobs.values():
+            if job.index not in results:
+                error = f"Worker {shard}/{processes} exited with code {code} before reporting this job."
+                results[job.index] = BatchJobResult(job=job, status=BatchJobStatus.FAILED, error=error)
+                on_result(results[job.index])
+
+    await asyncio.gather(*(run_shard(shard) for shard in range(processes)))
+    return BatchSummary(results=[results[job.index] for job in jobs], duration_ms=(perf_counter() - started) * 1000)
+
+
+def worker_command() -> list[str]:
+    """The command that starts this CLI again: the executable itself when frozen, else `python -m lime_ai.main`."""
+    if getattr(sys, "frozen", False):
+        return [sys.executable]
+    return [sys.executable, "-m", "lime_ai.main"]
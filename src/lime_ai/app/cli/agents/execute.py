@@ -1,56 +1,12 @@
 import asyncio
+import json
 import sys
 from pathlib import Path
+from typing import Any
 
 import click
 
-from lime_ai.app.container import container
-from lime_ai.app.lifecycle import with_lifecycle
-from lime_ai.core.agents.models import ExecutionModel
-from lime_ai.core.agents.operations.execute_agent_operation import ExecuteAgentOperation
-from lime_ai.core.agents.plugins.console import ConsoleLogPlugin
-from lime_ai.core.agents.plugins.context import ContextPlugin
-from lime_ai.core.agents.plugins.exec import ExecPlugin
-from lime_ai.core.agents.plugins.func import FuncPlugin
-from lime_ai.core.agents.plugins.input import InputPlugin
-from lime_ai.core.agents.plugins.run_agent import RunAgentPlugin
-from lime_ai.core.agents.plugins.tools import ToolsPlugin
-from lime_ai.core.agents.services.memory import MemoryService
-from lime_ai.core.interfaces.agent_plugin import AgentPlugin
-from lime_ai.core.interfaces.logger import LoggerService
-from lime_ai.core.interfaces.prompt_integrity import PromptIntegrity
-from lime_ai.core.interfaces.query_service import QueryService
-from lime_ai.core.interfaces.ui import UI
-from lime_ai.entities.prompt_integrity import (
-    PROMPT_LOCK_FILE_NAME,
-    PROMPT_MANIFEST_FILE_NAME,
-    PromptIntegrityError,
-)
-
-
-def make_plugins(
-    query_service: QueryService,
-    logger_service: LoggerService,
-    memory_service: MemoryService,
-    prompt_integrity: PromptIntegrity | None,
-    allow_unverified: bool,
-) -> list[AgentPlugin]:
-    return [
-        RunAgentPlugin(agent_service=query_service),
-        FuncPlugin(),
-        ToolsPlugin(),
-        ContextPlugin(),
-        ConsoleLogPlugin(logger_service=logger_service),
-        InputPlugin(),
-        ExecPlugin(
-            plugin_factory=lambda: make_plugins(
-                query_service, logger_service, memory_service, prompt_integrity, allow_unverified
-            ),
-            memory_service=memory_service,
-            prompt_integrity=prompt_integrity,
-            allow_unverified=allow_unverified,
-        ),
-    ]
+from lime_ai.app.paths import serve_socket_path
 
 
 @click.command()
@@ -58,71 +14,68 @@ def make_plugins(
 @click.option("--verify-prompts/--no-verify-prompts", default=None)
 @click.option("--allow-unverified", is_flag=True, default=False)
 @click.option("--headless/--no-headless", default=False)
-@with_lifecycle
-async def execute(file_name: str, verify_prompts: bool | None, allow_unverified: bool, headless: bool) -> None:
+@click.option("--output", type=click.Choice(["tui", "ndjson"]), default="tui", show_default=True)
+@click.option("--output-fd", type=int, default=1, show_default=True, help="File descriptor for --output ndjson.")
+@click.option("--coalesce-ms", type=float, default=50.0, show_default=True, help="Delta coalescing window for ndjson.")
+@click.option("--state", type=str, default=None, help="Initial state, as a JSON object.")
+@click.option(
+    "--remote",
+    is_flag=False,
+    flag_value="",
+    default=None,
+    help="Run on a `lime-ai serve` daemon: its socket path or host:port (default ~/.lime/lime.sock).",
+)
+def execute(
+    file_name: str,
+    verify_prompts: bool | None,
+    allow_unverified: bool,
+    headless: bool,
+    output: str,
+    output_fd: int,
+    coalesce_ms: float,
+    state: str | None,
+    remote: str | None,
+) -> None:
     """Execute an .mgx file with optional prompt integrity verification.
 
     Args:
         file_name (str): The path to the .mgx file.
         verify_prompts: Explicitly enable/disable prompt verification.
         allow_unverified: If True, allow unverified includes with a warning.
+        headless: If True, run without any UI.
+        output: "tui" for the interactive UI, "ndjson" to stream JSON events (implies no TUI).
+        output_fd: The file descriptor the ndjson events are written to.
+        coalesce_ms: How long ndjson waits to merge streamed deltas into one event.
+        state: Initial state variables, as a JSON object.
+        remote: The address of a `lime-ai serve` daemon to run the file on; "" for the default socket.
     """
     if not Path(file_name).is_file():
         raise click.ClickException(f"File '{file_name}' does not exist.")
 
-    base_path = Path(file_name).parent
-    manifest_path = Path(PROMPT_MANIFEST_FILE_NAME)
-    lock_path = Path(PROMPT_LOCK_FILE_NAME)
-    has_manifest = manifest_path.exists()
+    initial_state = _parse_state(state)
+    if remote is not None:
+        # The client only needs a socket; the Copilot SDK, the container and Textual are never imported.
+        from lime_ai.app.cli.agents.remote import run_remote
 
-    should_verify_prompts = verify_prompts if verify_prompts is not None else has_manifest
-
-    ui = await container.get(UI)
-    query_service = await container.get(QueryService)
-    logger_service = await container.get(LoggerService)
-    memory_service = await container.get(MemoryService)
-    prompt_integrity = None
-
-    if should_verify_prompts:
-        if not has_manifest:
-            raise click.ClickException(
-                f"Prompt verification is enabled, but '{PROMPT_MANIFEST_FILE_NAME}' was not found."
+        address = remote or str(serve_socket_path())
+        sys.exit(
+            asyncio.run(
+                run_remote(address, file_name, initial_state, output="ndjson" if output == "ndjson" else "text")
             )
-
-        prompt_integrity = await container.get(PromptIntegrity)
-        try:
-            prompt_integrity.load_policy(manifest_path=manifest_path, lock_path=lock_path)
-            prompt_integrity.check_against_lock()
-        except PromptIntegrityError as error:
-            raise click.ClickException(str(error)) from error
-
-    with open(file_name) as f:
-        mgx_code = f.read()
-
-        model = ExecutionModel()
-
-        operation = ExecuteAgentOperation(
-            plugins=make_plugins(query_service, logger_service, memory_service, prompt_integrity, allow_unverified),
-            memory_service=memory_service,
-            execution_model=model,
-            prompt_integrity=prompt_integrity,
-            allow_unverified=allow_unverified,
         )
 
-        ui_task = None
-        if not headless:
-            ui_task = asyncio.create_task(ui.render_ui(model))
+    from lime_ai.app.cli.agents.execute_local import execute_local
 
-        try:
-            await operation.execute_async(mgx_file=mgx_code, base_path=base_path)
-        except (PromptIntegrityError, ValueError, FileNotFoundError) as error:
-            raise click.ClickException(str(error)) from error
+    execute_local(file_name, verify_prompts, allow_unverified, headless, output, output_fd, coalesce_ms, initial_state)
 
-        # Prevent hanging in headless mode if the run requires user input or permission
-        if headless and (model.pending_input is not None or model.pending_permission is not None):
-            # mark done and exit with distinct code to indicate interactive prompt required
-            model.done = True
-            sys.exit(2)
 
-        if ui_task is not None:
-            await ui_task
+def _parse_state(state: str | None) -> dict[str, Any]:
+    if state is None:
+        return {}
+    try:
+        value = json.loads(state)
+    except json.JSONDecodeError as error:
+        raise click.ClickException(f"--state is not valid JSON: {error}") from error
+    if not isinstance(value, dict):
+        raise click.ClickException("--state must be a JSON object.")
+    return value
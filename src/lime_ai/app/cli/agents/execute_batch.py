@@ -0,0 +1,263 @@
+import asyncio
+import csv
+import json
+import os
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import click
+
+from lime_ai.app.cli.agents.batch_shards import run_shards
+from lime_ai.app.cli.agents.execute_local import load_prompt_integrity, make_plugins
+from lime_ai.app.config import AppConfig
+from lime_ai.app.container import container
+from lime_ai.app.lifecycle import app_lifecycle
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.operations.execute_agent_operation import ExecuteAgentOperation
+from lime_ai.core.agents.operations.execute_batch_operation import ExecuteBatchOperation
+from lime_ai.core.agents.services.func_cache import FuncResultCache
+from lime_ai.core.agents.services.memory import MemoryService
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
+from lime_ai.core.agents.services.worker_pool import WorkerPool
+from lime_ai.core.interfaces.logger import LoggerService
+from lime_ai.core.interfaces.prompt_integrity import PromptIntegrity
+from lime_ai.core.interfaces.query_service import QueryService
+from lime_ai.entities.batch import BatchJob, BatchJobResult, BatchSummary
+from lime_ai.libs.run_archive import get_run_archive
+
+SUMMARY_FILE_NAME = "summary.json"
+
+
+def load_matrix(path: Path) -> list[dict[str, Any]]:
+    """Read the rows of an input matrix: a .csv file with a header row, a .jsonl file or a .json list of objects.
+
+    Raises:
+        click.ClickException: The file is not a list of objects.
+    """
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".jsonl":
+        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        rows = json.loads(text)
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise click.ClickException(f"Input matrix '{path}' must be a list of objects.")
+    return rows
+
+
+def build_jobs(files: tuple[str, ...], matrix: str | None) -> list[BatchJob]:
+    """One job per file, or one job per matrix row for a single file.
+
+    Raises:
+        click.ClickException: A file does not exist, or a matrix is given with more than one file.
+    """
+    if not files:
+        raise click.ClickException("No .mgx files given.")
+    for file_name in files:
+        if not Path(file_name).is_file():
+            raise click.ClickException(f"File '{file_name}' does not exist.")
+
+    if matrix is None:
+        return [BatchJob(index=index, file=Path(file_name)) for index, file_name in enumerate(files)]
+
+    if len(files) != 1:
+        raise click.ClickException("--matrix runs a single .mgx file once per row.")
+    rows = load_matrix(Path(matrix))
+    return [BatchJob(index=index, file=Path(files[0]), inputs=row) for index, row in enumerate(rows)]
+
+
+def write_result(output_dir: Path, result: BatchJobResult):
+    """Write one job's result to `<output_dir>/<job name>.json` and echo a one-line status."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{result.job.name}.json"
+    path.write_text(json.dumps(result.to_dict(), indent=2, default=str), encoding="utf-8")
+
+    line = f"{result.job.name}  {result.status.value}  {result.duration_ms / 1000:.1f}s  {result.tokens:,} tok"
+    click.echo(line + (f"  {result.error}" if result.error else ""))
+
+
+def write_summary(output_dir: Path, summary: BatchSummary) -> dict[str, Any]:
+    """Write the aggregate of all jobs to `<output_dir>/summary.json` and return it."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    data = summary.to_dict()
+    (output_dir / SUMMARY_FILE_NAME).write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+    return data
+
+
+def shard_jobs(jobs: list[BatchJob], shard: str) -> list[BatchJob]:
+    """The jobs of shard `I/N`: every N-th job starting at I, so near-identical jobs spread evenly.
+
+    Raises:
+        click.ClickException: `shard` is not of the form I/N with 0 <= I < N.
+    """
+    try:
+        index, count = (int(part) for part in shard.split("/"))
+    except ValueError:
+        raise click.ClickException(f"Invalid shard '{shard}'. Expected I/N, e.g. 0/4.") from None
+    if not 0 <= index < count:
+        raise click.ClickException(f"Invalid shard '{shard}'. Expected 0 <= I < N.")
+    return [job for job in jobs if job.index % count == index]
+
+
+def stream_result(result: BatchJobResult):
+    """Write one job's result as a JSON line on stdout, for the coordinator of a sharded batch."""
+    sys.stdout.write(json.dumps({"index": result.job.index, **result.to_dict()}, default=str) + "\n")
+    sys.stdout.flush()
+
+
+@click.command(name="execute-batch")
+@click.argument("files", nargs=-1, type=str)
+@click.option("--matrix", type=click.Path(exists=True, dir_okay=False), help="CSV/JSON rows used as initial state.")
+@click.option("--workers", type=int, default=4, show_default=True, help="Jobs that run at the same time, per process.")
+@click.option("--processes", type=int, default=1, show_default=True, help="Worker processes; 0 uses one per core.")
+@click.option("--output-dir", type=click.Path(file_okay=False), default="batch-results", show_default=True)
+@click.option("--verify-prompts/--no-verify-prompts", default=None)
+@click.option("--allow-unverified", is_flag=True, default=False)
+@click.option("--shard", type=str, default=None, hidden=True)
+def execute_batch(
+    files: tuple[str, ...],
+    matrix: str | None,
+    workers: int,
+    processes: int,
+    output_dir: str,
+    verify_prompts: bool | None,
+    allow_unverified: bool,
+    shard: str | None,
+) -> None:
+    """Execute many .mgx files, or one file per row of an input matrix.
+
+    Jobs run headless and share the Copilot connection, the request scheduler,
+    the worker pool and the caches. With `--processes`, the jobs are sharded
+    across worker processes, each with its own Copilot client, and their
+    results are streamed back to this process. Each job's result is written to
+    `<output-dir>/<job>.json` and the aggregate to `<output-dir>/summary.json`.
+    Exits with code 1 when any job did not complete.
+
+    Args:
+        files: The .mgx files to run.
+        matrix: A .csv, .json or .jsonl file; each row is one job's initial state. Requires a single file.
+        workers: How many jobs run at the same time in each process.
+        processes: How many worker processes run the jobs; 1 runs them in this process.
+        output_dir: Where results are written.
+        verify_prompts: Explicitly enable/disable prompt verification.
+        allow_unverified: If True, allow unverified includes with a warning.
+        shard: Internal: run only shard I/N and stream the results to stdout.
+    """
+    jobs = build_jobs(files, matrix)
+    if shard is not None:
+        asyncio.run(_run_in_process(shard_jobs(jobs, shard), workers, verify_prompts, allow_unverified, stream_result))
+        return
+
+    results_path = Path(output_dir)
+    processes = processes if processes > 0 else os.cpu_count() or 1
+    processes = min(processes, len(jobs))
+    if processes > 1:
+        # Fail fast on prompt drift instead of once per worker.
+        asyncio.run(load_prompt_integrity(verify_prompts))
+        worker_args = _worker_args(files, matrix, workers, verify_prompts, allow_unverified)
+        summary = asyncio.run(
+            run_shards(jobs, processes, worker_args, on_result=lambda result: write_result(results_path, result))
+        )
+    else:
+        summary = asyncio.run(
+            _run_in_process(
+                jobs,
+                workers,
+                verify_prompts,
+                allow_unverified,
+                on_result=lambda result: write_result(results_path, result),
+            )
+        )
+
+    data = write_summary(results_path, summary)
+    click.echo(
+        f"{data['jobs']} jobs: {data['completed']} completed, {data['failed']} failed, "
+        f"{data['needs_input']} need input  {summary.duration_ms / 1000:.1f}s  "
+        f"{data['tokens']:,} tok  ${data['cost']:.4f}"
+    )
+    if not summary.succeeded:
+        sys.exit(1)
+
+
+async def create_batch_operation(
+    workers: int,
+    prompt_integrity: PromptIntegrity | None,
+    allow_unverified: bool,
+) -> ExecuteBatchOperation:
+    """Build a batch operation whose jobs share the container's services. Call it inside the app lifecycle.
+
+    The batch gets a run archive of its own: close it (`batch.run_archive.close()`) once the batch is done.
+
+    Args:
+        workers: How many jobs run at the same time.
+        prompt_integrity: The checked prompt policy (see load_prompt_integrity), or None to skip verification.
+        allow_unverified: If True, allow unverified includes with a warning.
+    """
+    query_service = await container.get(QueryService)
+    logger_service = await container.get(LoggerService)
+    memory_service = await container.get(MemoryService)
+    scheduler = await container.get(RequestScheduler)
+    worker_pool = await container.get(WorkerPool)
+    func_cache = await container.get(FuncResultCache)
+    app_config = await container.get(AppConfig)
+
+    def make_operation(model: ExecutionModel) -> ExecuteAgentOperation:
+        return ExecuteAgentOperation(
+            plugins=make_plugins(
+                query_service,
+                logger_service,
+                memory_service,
+                prompt_integrity,
+                allow_unverified,
+                scheduler,
+                worker_pool,
+                func_cache,
+            ),
+            memory_service=memory_service,
+            execution_model=model,
+            prompt_integrity=prompt_integrity,
+            allow_unverified=allow_unverified,
+        )
+
+    return ExecuteBatchOperation(
+        operation_factory=make_operation, workers=workers, run_archive=get_run_archive(app_config)
+    )
+
+
+async def _run_in_process(
+    jobs: list[BatchJob],
+    workers: int,
+    verify_prompts: bool | None,
+    allow_unverified: bool,
+    on_result: Callable[[BatchJobResult], None],
+) -> BatchSummary:
+    async with app_lifecycle():
+        prompt_integrity = await load_prompt_integrity(verify_prompts)
+        batch = await create_batch_operation(workers, prompt_integrity, allow_unverified)
+        try:
+            return await batch.execute_async(jobs, on_result=on_result)
+        finally:
+            batch.run_archive.close()
+
+
+def _worker_args(
+    files: tuple[str, ...],
+    matrix: str | None,
+    workers: int,
+    verify_prompts: bool | None,
+    allow_unverified: bool,
+) -> list[str]:
+    args = ["execute-batch", *files, "--workers", str(workers)]
+    if matrix is not None:
+        args += ["--matrix", matrix]
+    if verify_prompts is not None:
+        args.append("--verify-prompts" if verify_prompts else "--no-verify-prompts")
+    if allow_unverified:
+        args.append("--allow-unverified")
+    return args
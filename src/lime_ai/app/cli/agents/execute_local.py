@@ -0,0 +1,189 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+
+from lime_ai.app.cli.writers.ndjson import NdjsonWriter
+from lime_ai.app.container import container
+from lime_ai.app.lifecycle import with_lifecycle
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.operations.execute_agent_operation import ExecuteAgentOperation
+from lime_ai.core.agents.plugins.console import ConsoleLogPlugin
+from lime_ai.core.agents.plugins.context import ContextPlugin
+from lime_ai.core.agents.plugins.exec import ExecPlugin
+from lime_ai.core.agents.plugins.func import FuncPlugin
+from lime_ai.core.agents.plugins.input import InputPlugin
+from lime_ai.core.agents.plugins.run_agent import RunAgentPlugin
+from lime_ai.core.agents.plugins.tools import ToolsPlugin
+from lime_ai.core.agents.services.func_cache import FuncResultCache
+from lime_ai.core.agents.services.memory import MemoryService
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.core.agents.services.worker_pool import WorkerPool
+from lime_ai.core.interfaces.agent_plugin import AgentPlugin
+from lime_ai.core.interfaces.logger import LoggerService
+from lime_ai.core.interfaces.prompt_integrity import PromptIntegrity
+from lime_ai.core.interfaces.query_service import QueryService
+from lime_ai.core.interfaces.ui import UI
+from lime_ai.entities.prompt_integrity import (
+    PROMPT_LOCK_FILE_NAME,
+    PROMPT_MANIFEST_FILE_NAME,
+    PromptIntegrityError,
+)
+
+
+def make_plugins(
+    query_service: QueryService,
+    logger_service: LoggerService,
+    memory_service: MemoryService,
+    prompt_integrity: PromptIntegrity | None,
+    allow_unverified: bool,
+    scheduler: RequestScheduler | None = None,
+    worker_pool: WorkerPool | None = None,
+    func_cache: FuncResultCache | None = None,
+) -> list[AgentPlugin]:
+    return [
+        RunAgentPlugin(agent_service=query_service, scheduler=scheduler),
+        FuncPlugin(worker_pool=worker_pool, cache=func_cache),
+        ToolsPlugin(),
+        ContextPlugin(),
+        ConsoleLogPlugin(logger_service=logger_service),
+        InputPlugin(),
+        ExecPlugin(
+            plugin_factory=lambda: make_plugins(
+                query_service,
+                logger_service,
+                memory_service,
+                prompt_integrity,
+                allow_unverified,
+                scheduler,
+                worker_pool,
+                func_cache,
+            ),
+            memory_service=memory_service,
+            prompt_integrity=prompt_integrity,
+            allow_unverified=allow_unverified,
+        ),
+    ]
+
+
+def prompt_verification_enabled(verify_prompts: bool | None) -> bool:
+    """Whether prompts are verified: as requested, or by default when a manifest exists.
+
+    Args:
+        verify_prompts: Explicitly enable/disable prompt verification.
+    """
+    return verify_prompts if verify_prompts is not None else Path(PROMPT_MANIFEST_FILE_NAME).exists()
+
+
+async def load_prompt_integrity(verify_prompts: bool | None) -> PromptIntegrity | None:
+    """Load and check the prompt policy when verification is enabled (by default, when a manifest exists).
+
+    Args:
+        verify_prompts: Explicitly enable/disable prompt verification.
+
+    Raises:
+        click.ClickException: Verification is enabled but the manifest is missing, or the prompts drifted.
+    """
+    manifest_path = Path(PROMPT_MANIFEST_FILE_NAME)
+    lock_path = Path(PROMPT_LOCK_FILE_NAME)
+    if not prompt_verification_enabled(verify_prompts):
+        return None
+
+    if not manifest_path.exists():
+        raise click.ClickException(f"Prompt verification is enabled, but '{PROMPT_MANIFEST_FILE_NAME}' was not found.")
+
+    prompt_integrity = await container.get(PromptIntegrity)
+    try:
+        prompt_integrity.load_policy(manifest_path=manifest_path, lock_path=lock_path)
+        prompt_integrity.check_against_lock()
+    except PromptIntegrityError as error:
+        raise click.ClickException(str(error)) from error
+    return prompt_integrity
+
+
+@with_lifecycle
+async def execute_local(
+    file_name: str,
+    verify_prompts: bool | None,
+    allow_unverified: bool,
+    headless: bool,
+    output: str,
+    output_fd: int,
+    coalesce_ms: float,
+    initial_state: dict[str, Any],
+) -> None:
+    """Run `file_name` in this process, with the TUI or the ndjson event stream (see `execute`)."""
+    base_path = Path(file_name).parent
+
+    ndjson = output == "ndjson"
+    if ndjson:
+        ui = NdjsonWriter(_open_output(output_fd), coalesce_ms=coalesce_ms)
+    elif not headless:
+        ui = await container.get(UI)
+    query_service = await container.get(QueryService)
+    logger_service = await container.get(LoggerService)
+    memory_service = await container.get(MemoryService)
+    scheduler = await container.get(RequestScheduler)
+    worker_pool = await container.get(WorkerPool)
+    func_cache = await container.get(FuncResultCache)
+    run_archive = await container.get(RunArchive)
+    prompt_integrity = await load_prompt_integrity(verify_prompts)
+
+    with open(file_name) as f:
+        mgx_code = f.read()
+
+        model = ExecutionModel()
+        model.run_archive = run_archive
+        model.context.data.update(initial_state)
+
+        operation = ExecuteAgentOperation(
+            plugins=make_plugins(
+                query_service,
+                logger_service,
+                memory_service,
+                prompt_integrity,
+                allow_unverified,
+                scheduler,
+                worker_pool,
+                func_cache,
+            ),
+            memory_service=memory_service,
+            execution_model=model,
+            prompt_integrity=prompt_integrity,
+            allow_unverified=allow_unverified,
+        )
+
+        ui_task = None
+        if ndjson or not headless:
+            ui_task = asyncio.create_task(ui.render_ui(model))
+
+        try:
+            await operation.execute_async(mgx_file=mgx_code, base_path=base_path)
+        except (PromptIntegrityError, ValueError, FileNotFoundError) as error:
+            raise click.ClickException(str(error)) from error
+
+        # Prevent hanging in headless mode if the run requires user input or permission
+        if (headless or ndjson) and (model.pending_input is not None or model.pending_permission is not None):
+            # mark done and exit with distinct code to indicate interactive prompt required
+            model.done = True
+            if ndjson:
+                ui.flush()
+            sys.exit(2)
+
+        if ndjson:
+            # Ends the event stream even when the operation returned before marking itself done.
+            model.done = True
+
+        if ui_task is not None:
+            await ui_task
+
+
+def _open_output(fd: int):
+    """The text stream for `--output-fd`: stdout for 1, otherwise the inherited descriptor, left open on exit."""
+    if fd == 1:
+        return sys.stdout
+    return os.fdopen(fd, "w", encoding="utf-8", closefd=False)
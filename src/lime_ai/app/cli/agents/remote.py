@@ -0,0 +1,143 @@
+import asyncio
+import json
+import os
+import sys
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TextIO
+
+import click
+
+from lime_ai.app.paths import serve_token_path
+from lime_ai.entities.batch import BatchJobStatus
+
+# Events carry tool results and final state, so a single line can be large.
+LINE_LIMIT = 64 * 1024 * 1024
+
+_EXIT_CODES = {BatchJobStatus.COMPLETED.value: 0, BatchJobStatus.FAILED.value: 1, BatchJobStatus.NEEDS_INPUT.value: 2}
+
+StreamHandler = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+def parse_address(address: str) -> tuple[str, int] | str:
+    """`host:port` or `:port` (local TCP) as a (host, port) tuple; anything else is a unix socket path."""
+    host, separator, port = address.rpartition(":")
+    if separator and port.isdigit() and "/" not in address and "\\" not in address:
+        return host or "127.0.0.1", int(port)
+    return address
+
+
+async def open_connection(address: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Connect to a `lime-ai serve` address."""
+    target = parse_address(address)
+    if isinstance(target, tuple):
+        return await asyncio.open_connection(*target, limit=LINE_LIMIT)
+    return await asyncio.open_unix_connection(target, limit=LINE_LIMIT)
+
+
+async def start_server(handler: StreamHandler, address: str) -> asyncio.Server:
+    """Listen on a `lime-ai serve` address. A unix socket is only accessible to the current user."""
+    target = parse_address(address)
+    if isinstance(target, tuple):
+        return await asyncio.start_server(handler, *target, limit=LINE_LIMIT)
+
+    path = Path(target)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    # Bind with owner-only permissions, so there is no moment where other users can connect.
+    umask = os.umask(0o177)
+    try:
+        return await asyncio.start_unix_server(handler, path, limit=LINE_LIMIT)
+    finally:
+        os.umask(umask)
+
+
+def write_token(path: Path, token: str):
+    """Write the token of a TCP daemon to a file only the current user can read."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token)
+
+
+def read_token(address: str) -> str | None:
+    """The token a TCP daemon wrote at start-up, or None for a unix socket or when there is none."""
+    target = parse_address(address)
+    if not isinstance(target, tuple):
+        return None
+    try:
+        return serve_token_path(target[1]).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+async def run_remote(
+    address: str,
+    file_name: str,
+    state: dict[str, Any],
+    output: str = "text",
+    stream: TextIO | None = None,
+) -> int:
+    """Run an .mgx file on a `lime-ai serve` daemon and print its events.
+
+    Args:
+        address (str): The daemon's unix socket path or `host:port`.
+        file_name (str): The .mgx file, resolved to an absolute path for the daemon.
+        state (dict): The initial state of the run.
+        output (str): "ndjson" passes the daemon's events through; "text" prints the responses.
+        stream (TextIO | None): Where to print; stdout by default.
+
+    Returns:
+        The exit code: 0 when the run completed, 1 when it failed, 2 when it needed user input.
+
+    Raises:
+        click.ClickException: The daemon cannot be reached.
+    """
+    stream = stream or sys.stdout
+    try:
+        reader, writer = await open_connection(address)
+    except OSError as error:
+        raise click.ClickException(f"Cannot reach lime-ai serve at '{address}': {error}") from error
+
+    request = {
+        "type": "run",
+        "file": str(Path(file_name).resolve()),
+        "state": state,
+        "cwd": os.getcwd(),
+        "token": read_token(address),
+    }
+    writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+
+    code = 1
+    try:
+        async for line in reader:
+            event = json.loads(line)
+            if output == "ndjson":
+                stream.write(line.decode())
+                stream.flush()
+            else:
+                _print_event(event, stream)
+            if event.get("type") == "result":
+                code = _EXIT_CODES.get(event.get("status"), 1)
+    finally:
+        writer.close()
+    return code
+
+
+def _print_event(event: dict[str, Any], stream: TextIO):
+    kind = event.get("type")
+    if kind == "delta" and event.get("kind") == "response":
+        stream.write(event["text"])
+    elif kind == "run_end":
+        stream.write("\n")
+    elif kind == "tool_call":
+        stream.write(f"\n[{event['name']}]\n")
+    elif kind in ("error", "warning"):
+        click.echo(f"{kind}: {event.get('message')}", err=True)
+    elif kind == "result":
+        stream.write(f"\n{event['status']}  {event['duration_ms'] / 1000:.1f}s  {event['tokens']:,} tok\n")
+        if event.get("error"):
+            click.echo(event["error"], err=True)
+    stream.flush()
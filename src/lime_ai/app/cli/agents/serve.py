@@ -0,0 +1,307 @@
+import asyncio
+import hmac
+import json
+import os
+import secrets
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from lime_ai.app.cli.agents.execute_batch import create_batch_operation
+from lime_ai.app.cli.agents.execute_local import prompt_verification_enabled
+from lime_ai.app.cli.agents.remote import parse_address, start_server, write_token
+from lime_ai.app.cli.writers.ndjson import NdjsonWriter
+from lime_ai.app.config import AppConfig
+from lime_ai.app.container import container
+from lime_ai.app.lifecycle import app_lifecycle
+from lime_ai.app.paths import serve_socket_path, serve_token_path
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.operations.execute_batch_operation import ExecuteBatchOperation
+from lime_ai.core.agents.plugins.import_plugin import ImportPlugin
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.core.interfaces.prompt_integrity import PromptIntegrity
+from lime_ai.entities.batch import BatchJob
+from lime_ai.entities.prompt_integrity import PROMPT_LOCK_FILE_NAME, PROMPT_MANIFEST_FILE_NAME, PromptIntegrityError
+from lime_ai.libs.run_archive import get_run_archive
+
+# Bytes of events a client may fall behind by before it is disconnected.
+MAX_PENDING_BYTES = 16 * 1024 * 1024
+
+
+class _SocketStream:
+    """The text-stream interface NdjsonWriter writes to, over a client connection.
+
+    Writes are queued and sent by a pump that drains the connection after each
+    one, so a client that reads slowly holds back the run's events instead of
+    growing the transport buffer. A client more than `max_pending` bytes behind
+    is disconnected; its run goes on and its events are dropped.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, max_pending: int = MAX_PENDING_BYTES):
+        self._writer = writer
+        self._max_pending = max_pending
+        self._pending: deque[bytes] = deque()
+        self._pending_bytes = 0
+        self._ready = asyncio.Event()
+        self._closing = False
+        self._pump = asyncio.create_task(self._send_pending())
+
+    def write(self, text: str):
+        # A client that went away does not stop its run; its events are dropped.
+        if self._closing or self._writer.is_closing():
+            return
+        data = text.encode()
+        if self._pending and self._pending_bytes + len(data) > self._max_pending:
+            logger.warning("lime-ai serve: disconnecting a client that does not read its events.")
+            self._writer.close()
+            self._pending.clear()
+            return
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        self._ready.set()
+
+    def flush(self):
+        pass
+
+    async def aclose(self):
+        """Send what is still queued, then close the connection."""
+        self._closing = True
+        self._ready.set()
+        await self._pump
+        self._writer.close()
+
+    async def _send_pending(self):
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self._pending:
+                data = self._pending.popleft()
+                self._pending_bytes -= len(data)
+                if self._writer.is_closing():
+                    continue
+                self._writer.write(data)
+                try:
+                    await self._writer.drain()
+                except ConnectionError:
+                    self._writer.close()
+            if self._closing or self._writer.is_closing():
+                return
+
+
+class PromptPolicyCheck:
+    """Checks the prompts against the lock file before each run of a long-lived server.
+
+    The manifest and lock are parsed again only when one of them changed, so
+    the hashes verified by earlier runs are kept; the prompt files themselves
+    are hashed on every check, so drift is still caught per request.
+    """
+
+    def __init__(self, prompt_integrity: PromptIntegrity):
+        self.prompt_integrity = prompt_integrity
+        self._loaded: tuple[int | None, int | None] | None = None
+
+    def check(self):
+        """Raise click.ClickException when the policy files are missing or the prompts drifted from the lock."""
+        manifest_path, lock_path = Path(PROMPT_MANIFEST_FILE_NAME), Path(PROMPT_LOCK_FILE_NAME)
+        stamp = (self._mtime(manifest_path), self._mtime(lock_path))
+        try:
+            if stamp != self._loaded:
+                self._loaded = None
+                self.prompt_integrity.load_policy(manifest_path=manifest_path, lock_path=lock_path)
+                self._loaded = stamp
+            self.prompt_integrity.check_against_lock()
+        except PromptIntegrityError as error:
+            raise click.ClickException(str(error)) from error
+
+    @staticmethod
+    def _mtime(path: Path) -> int | None:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+class RunServer:
+    """Runs .mgx files for `lime-ai execute --remote` clients on warm, shared services.
+
+    Each connection sends one JSON line, `{"type": "run", "file": ..., "state": {...}, "cwd": ...}`,
+    and receives the run's NDJSON events (see NdjsonWriter) followed by a
+    `{"type": "result", ...}` line with the job result. `{"type": "ping"}` is
+    answered with `{"type": "pong"}`. At most `workers` runs execute at once;
+    later requests wait for a free slot.
+
+    All runs share one batch operation, `batch`, so its services and parsed
+    sources stay warm. Per request, `check_prompts` (if given) re-checks the
+    prompt policy, as `execute` does, and the run gets its own archive from
+    `create_archive`, closed when the run ends. Relative paths (prompt
+    manifest, imports) resolve against the daemon's directory, so a request
+    from another directory is rejected. On a TCP port, which any local user
+    can reach, every request must carry the `token` written to
+    `serve_token_path(port)` at start-up.
+
+    Examples
+    >>> server = RunServer(batch=await create_batch_operation(1, None, False))
+    >>> await server.serve("/home/me/.lime/lime.sock")
+    """
+
+    def __init__(
+        self,
+        batch: ExecuteBatchOperation,
+        check_prompts: Callable[[], None] | None = None,
+        create_archive: Callable[[], RunArchive] | None = None,
+        workers: int = 4,
+        coalesce_ms: float = 50.0,
+        token: str | None = None,
+    ):
+        self.batch = batch
+        self.check_prompts = check_prompts
+        self.create_archive = create_archive
+        self.coalesce_ms = coalesce_ms
+        self.token = token
+        self._slots = asyncio.Semaphore(max(workers, 1))
+        self._next_index = 0
+
+    async def serve(self, address: str):
+        """Accept connections on `address` until cancelled."""
+        tcp = isinstance(parse_address(address), tuple)
+        if tcp:
+            self.token = secrets.token_urlsafe(32)
+        server = await start_server(self.handle, address)
+        token_path = None
+        if tcp:
+            token_path = serve_token_path(server.sockets[0].getsockname()[1])
+            write_token(token_path, self.token)
+        click.echo(f"lime-ai serve listening on {address} (pid {os.getpid()})", err=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if token_path is not None:
+                token_path.unlink(missing_ok=True)
+            elif not tcp:
+                Path(address).unlink(missing_ok=True)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        stream = _SocketStream(writer)
+        try:
+            try:
+                request = json.loads(await reader.readline())
+                if not isinstance(request, dict):
+                    raise ValueError("The request must be a JSON object.")
+            except ValueError as error:
+                self._send(stream, {"type": "error", "message": f"Invalid request: {error}"})
+                return
+
+            if not self._authorized(request):
+                self._send(stream, {"type": "error", "message": "Invalid or missing token."})
+            elif request.get("type") == "ping":
+                self._send(stream, {"type": "pong", "pid": os.getpid()})
+            elif request.get("type") == "run" and isinstance(request.get("file"), str):
+                await self._run(request, stream)
+            else:
+                self._send(stream, {"type": "error", "message": "Expected a 'run' request with a 'file'."})
+        except Exception as error:
+            logger.exception(f"lime-ai serve: request failed: {error}")
+            self._send(stream, {"type": "error", "message": str(error)})
+        finally:
+            await stream.aclose()
+
+    def _authorized(self, request: dict) -> bool:
+        if self.token is None:
+            return True
+        token = request.get("token")
+        return isinstance(token, str) and hmac.compare_digest(token.encode(), self.token.encode())
+
+    async def _run(self, request: dict, stream: _SocketStream):
+        cwd = request.get("cwd")
+        if not isinstance(cwd, str) or Path(cwd).resolve() != Path.cwd().resolve():
+            self._send(
+                stream,
+                {
+                    "type": "error",
+                    "message": f"lime-ai serve runs in '{Path.cwd()}'; start a daemon in '{cwd}' to run files there.",
+                },
+            )
+            return
+
+        # Packages may have been installed or edited since the last request.
+        ImportPlugin.clear_cache()
+        if self.check_prompts is not None:
+            try:
+                self.check_prompts()
+            except click.ClickException as error:
+                # The prompt policy is missing or the prompts drifted since the last run.
+                self._send(stream, {"type": "error", "message": error.message})
+                return
+
+        job = BatchJob(index=self._next_index, file=Path(request["file"]), inputs=request.get("state") or {})
+        self._next_index += 1
+        events = NdjsonWriter(stream, coalesce_ms=self.coalesce_ms)
+        rendering: list[asyncio.Task] = []
+
+        def on_model(model: ExecutionModel):
+            rendering.append(asyncio.create_task(events.render_ui(model)))
+
+        run_archive = self.create_archive() if self.create_archive is not None else None
+        try:
+            async with self._slots:
+                result = await self.batch.run_job(job, on_model=on_model, run_archive=run_archive)
+        finally:
+            if run_archive is not None:
+                run_archive.close()
+        await asyncio.gather(*rendering)
+        self._send(stream, {"type": "result", **result.to_dict()})
+
+    @staticmethod
+    def _send(stream: _SocketStream, event: dict):
+        stream.write(json.dumps(event, default=str) + "\n")
+
+
+@click.command()
+@click.option(
+    "--socket", "socket_path", type=click.Path(dir_okay=False), default=None, help="Unix socket to listen on."
+)
+@click.option("--port", type=int, default=None, help="Listen on 127.0.0.1:PORT instead of a unix socket.")
+@click.option("--workers", type=int, default=4, show_default=True, help="Runs that execute at the same time.")
+@click.option("--verify-prompts/--no-verify-prompts", default=None)
+@click.option("--allow-unverified", is_flag=True, default=False)
+def serve(
+    socket_path: str | None,
+    port: int | None,
+    workers: int,
+    verify_prompts: bool | None,
+    allow_unverified: bool,
+) -> None:
+    """Keep the Copilot client, session pool, caches and prompt policy warm and run files for `execute --remote`.
+
+    Args:
+        socket_path: The unix socket to listen on; defaults to ~/.lime/lime.sock.
+        port: Listen on this local TCP port instead of a unix socket.
+        workers: How many runs execute at the same time.
+        verify_prompts: Explicitly enable/disable prompt verification, checked for every run.
+        allow_unverified: If True, allow unverified includes with a warning.
+    """
+    address = f"127.0.0.1:{port}" if port is not None else socket_path or str(serve_socket_path())
+
+    async def run():
+        async with app_lifecycle():
+            # Decided once: a manifest added while the daemon runs needs a restart to take effect.
+            prompt_integrity = (
+                await container.get(PromptIntegrity) if prompt_verification_enabled(verify_prompts) else None
+            )
+            app_config = await container.get(AppConfig)
+            server = RunServer(
+                batch=await create_batch_operation(1, prompt_integrity, allow_unverified),
+                check_prompts=PromptPolicyCheck(prompt_integrity).check if prompt_integrity is not None else None,
+                create_archive=lambda: get_run_archive(app_config),
+                workers=workers,
+            )
+            await server.serve(address)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,31 @@
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """A click group that imports a subcommand's module only when that subcommand runs.
+
+    Each command module pulls in its own dependencies (the container, the
+    Copilot SDK, Textual...), so `lime-ai prompts check` does not pay for
+    `execute` and `lime-ai execute --remote` does not pay for `serve`.
+
+    Examples
+    >>> @click.group(cls=LazyGroup, lazy_subcommands={"execute": "lime_ai.app.cli.agents.execute:execute"})
+    ... def cli():
+    ...     pass
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attribute)
+        return super().get_command(ctx, cmd_name)
@@ -3,7 +3,6 @@ from pathlib import Path
 
 import click
 
-from lime_ai.app.container import container
 from lime_ai.core.interfaces.prompt_integrity import PromptIntegrity
 from lime_ai.entities.prompt_integrity import (
     DEFAULT_PROMPT_MANIFEST_CONTENT,
@@ -17,7 +16,10 @@ PROMPT_LOCK_PATH = Path(PROMPT_LOCK_FILE_NAME)
 
 
 def _resolve_prompt_integrity_service() -> PromptIntegrity:
-    return asyncio.run(container.get(PromptIntegrity))
+    # Imported here so `prompts init` does not build a container; the one built here leaves out the Copilot SDK.
+    from lime_ai.app.container_factory import create_container
+
+    return asyncio.run(create_container().get(PromptIntegrity))
 
 
 @click.group()
@@ -0,0 +1,206 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, TextIO
+
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.interfaces.ui import UI
+from lime_ai.entities.change_feed import ChangeKind
+from lime_ai.entities.run import ContentBlockType, Run, RunStatus
+
+_STREAMED_BLOCKS = {ContentBlockType.RESPONSE: "response", ContentBlockType.REASONING: "reasoning"}
+
+
+@dataclass
+class _RunCursor:
+    """How much of a run has already been written."""
+
+    index: int
+    run: Run
+    started: bool = False
+    # Blocks before this index are final; later ones may still grow.
+    first_open_block: int = 0
+    block_offsets: dict[int, int] = field(default_factory=dict)
+    tool_calls_seen: int = 0
+    pending_tool_calls: dict[str, Any] = field(default_factory=dict)
+    errors_seen: int = 0
+
+
+class NdjsonWriter(UI):
+    """Streams an execution as newline-delimited JSON events, for CI and orchestration.
+
+    Every line is one JSON object with a `type` and a `time`:
+    run_start, delta, log, tool_call, tool_result, error, usage, run_end,
+    warning, input_requested, permission_requested and, last, done. Runs are
+    numbered in the order they appear (`run`), matching the TUI.
+
+    Streamed text is coalesced: changes published by the ExecutionModel wake
+    the writer, which waits `coalesce_ms` and then writes one delta per block
+    with everything that arrived meanwhile. 0 writes on the next loop tick.
+
+    Examples
+    >>> writer = NdjsonWriter(sys.stdout, coalesce_ms=100)
+    >>> await writer.render_ui(execution_model)  # returns once the execution is done
+    """
+
+    def __init__(self, stream: TextIO, coalesce_ms: float = 50.0):
+        self.stream = stream
+        self.coalesce = max(coalesce_ms, 0.0) / 1000
+        self._model: ExecutionModel | None = None
+        self._cursors: dict[int, _RunCursor] = {}
+        self._open: list[_RunCursor] = []
+        self._warnings_seen = 0
+        self._import_errors_seen = 0
+        self._last_input: object = None
+        self._last_permission: object = None
+        self._flush_handle: asyncio.Handle | None = None
+        self._finished: asyncio.Event | None = None
+
+    async def render_ui(self, execution_model: ExecutionModel):
+        """Write events for `execution_model` until it is done.
+
+        Args:
+            execution_model (ExecutionModel): The execution model for the current agent run.
+        """
+        self._model = execution_model
+        self._finished = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def wake():
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.coalesce, self.flush)
+
+        unsubscribe = execution_model.changes.subscribe(wake)
+        try:
+            self.flush(discover=True)
+            await self._finished.wait()
+        finally:
+            unsubscribe()
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+
+    def flush(self, discover: bool = False):
+        """Write the events for everything that changed since the last flush."""
+        self._flush_handle = None
+        model = self._model
+        if model is None:
+            return
+
+        changes = model.changes.drain()
+        if discover or ChangeKind.RUN_ADDED in changes.kinds or ChangeKind.DONE in changes.kinds:
+            self._discover_runs()
+
+        for cursor in list(self._open):
+            self._write_run_progress(cursor)
+
+        self._write_model_messages()
+
+        if model.done and self._finished is not None and not self._finished.is_set():
+            self._emit("done", runs=len(self._cursors))
+            self._finished.set()
+
+    def _discover_runs(self):
+        for turn in self._model.turns_with_runs:
+            if id(turn.run) not in self._cursors:
+                cursor = _RunCursor(index=len(self._cursors), run=turn.run)
+                self._cursors[id(turn.run)] = cursor
+                self._open.append(cursor)
+
+    def _write_run_progress(self, cursor: _RunCursor):
+        run = cursor.run
+        if not cursor.started:
+            cursor.started = True
+            self._emit(
+                "run_start",
+                run=cursor.index,
+                title=run.title,
+                provider=run.provider,
+                model=run.model,
+                sub_run=run.is_sub_run,
+            )
+
+        blocks = run.content_blocks
+        for position in range(cursor.first_open_block, len(blocks)):
+            self._write_block(cursor, position, blocks[position])
+        cursor.first_open_block = max(len(blocks) - 1, cursor.first_open_block)
+
+        for tool_call in run.tool_calls[cursor.tool_calls_seen :]:
+            if tool_call.tool_name == "report_intent":
+                continue
+            cursor.pending_tool_calls[tool_call.tool_call_id] = tool_call
+            self._emit(
+                "tool_call",
+                run=cursor.index,
+                id=tool_call.tool_call_id,
+                name=tool_call.tool_name,
+                arguments=tool_call.arguments,
+            )
+        cursor.tool_calls_seen = len(run.tool_calls)
+
+        for tool_call_id, tool_call in list(cursor.pending_tool_calls.items()):
+            if tool_call.success is not None:
+                del cursor.pending_tool_calls[tool_call_id]
+                self._emit(
+                    "tool_result",
+                    run=cursor.index,
+                    id=tool_call_id,
+                    success=tool_call.success,
+                    duration_ms=tool_call.duration_ms,
+                    result=tool_call.result,
+                )
+
+        for error in run.errors[cursor.errors_seen :]:
+            self._emit("error", run=cursor.index, message=error.message, code=error.code)
+        cursor.errors_seen = len(run.errors)
+
+        if run.status in (RunStatus.COMPLETED, RunStatus.ERROR):
+            self._emit(
+                "usage",
+                run=cursor.index,
+                input_tokens=run.tokens.input_tokens,
+                output_tokens=run.tokens.output_tokens,
+                cache_read_tokens=run.tokens.cache_read_tokens,
+                cost=run.total_cost,
+                requests=run.request_count,
+            )
+            self._emit("run_end", run=cursor.index, status=run.status.value, duration_ms=run.duration_ms)
+            self._open.remove(cursor)
+
+    def _write_block(self, cursor: _RunCursor, position: int, block):
+        offset = cursor.block_offsets.get(position)
+        if block.type in _STREAMED_BLOCKS:
+            text = block.buffer.tail(offset or 0)
+            if text:
+                self._emit("delta", run=cursor.index, block=position, kind=_STREAMED_BLOCKS[block.type], text=text)
+            cursor.block_offsets[position] = len(block.buffer)
+        elif block.type != ContentBlockType.TOOL_CALL and offset is None:
+            cursor.block_offsets[position] = len(block.buffer)
+            if block.buffer:
+                self._emit("log", run=cursor.index, kind=block.type.value, text=block.text)
+
+    def _write_model_messages(self):
+        model = self._model
+        for warning in model.warnings[self._warnings_seen :]:
+            self._emit("warning", message=warning)
+        self._warnings_seen = len(model.warnings)
+
+        for error in model.import_errors[self._import_errors_seen :]:
+            self._emit("error", message=error)
+        self._import_errors_seen = len(model.import_errors)
+
+        pending_input = model.pending_input
+        if pending_input is not None and pending_input is not self._last_input:
+            self._emit("input_requested", prompt=pending_input.prompt, source=pending_input.source)
+        self._last_input = pending_input
+
+        pending_permission = model.pending_permission
+        if pending_permission is not None and pending_permission is not self._last_permission:
+            self._emit("permission_requested", kind=pending_permission.kind, source=pending_permission.source)
+        self._last_permission = pending_permission
+
+    def _emit(self, event_type: str, **fields):
+        event = {"type": event_type, "time": datetime.now().isoformat(timespec="milliseconds"), **fields}
+        self.stream.write(json.dumps(event, default=str) + "\n")
+        self.stream.flush()
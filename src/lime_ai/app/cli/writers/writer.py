@@ -3,7 +3,6 @@ from typing import Any
 from wireup import injectable
 
 from lime_ai.app.config import AppConfig
-from lime_ai.app.ui.app import LimeApp
 from lime_ai.core.agents.models import ExecutionModel
 from lime_ai.core.interfaces.ui import UI
 
@@ -15,5 +14,8 @@ class CliWriter(UI):
         self._tool_call_cache: dict[str, Any] = {}
 
     async def render_ui(self, execution_model: ExecutionModel):
+        # Imported here so headless and NDJSON runs never load Textual.
+        from lime_ai.app.ui.app import LimeApp
+
         app = LimeApp(execution_model=execution_model, app_config=self.app_config)
         await app.run_async()
@@ -1,14 +1,17 @@
 import click
 
-from lime_ai.app.cli.agents.execute import execute
-from lime_ai.app.cli.prompts.commands import prompts
+from lime_ai.app.cli.lazy_group import LazyGroup
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "execute": "lime_ai.app.cli.agents.execute:execute",
+        "execute-batch": "lime_ai.app.cli.agents.execute_batch:execute_batch",
+        "serve": "lime_ai.app.cli.agents.serve:serve",
+        "prompts": "lime_ai.app.cli.prompts.commands:prompts",
+    },
+)
 def cli():
     """Lime - A tool for executing .mgx files and managing agents."""
     pass
-
-
-cli.add_command(execute)
-cli.add_command(prompts)
@@ -1,27 +1,37 @@
 import json
-import os
 from pathlib import Path
 
 from pydantic import BaseModel
 from wireup import injectable
 
+from lime_ai.app.paths import default_settings_path as _default_settings_path
+
 
 class AppConfig(BaseModel):
     show_context: bool = True
     theme: str = "textual-dark"
+    ui_max_fps: int = 30
+    ui_max_mounted_runs: int = 50
     use_existing_system_prompt: bool = True
     system_prompt: str = ""
     ignore_permissions: bool = False
-
-
-def _default_settings_path() -> Path:
-    # Windows roaming app data
-    appdata = os.getenv("APPDATA")
-    if appdata:
-        return Path(appdata) / "lime" / "settings.json"
-
-    # Fallback to a dotdir in the user's home (cross-platform)
-    return Path.home() / ".lime" / "settings.json"
+    session_pool_max_size: int = 8
+    session_idle_timeout: float = 600.0
+    max_concurrent_requests: int = 4
+    tokens_per_minute: int = 0
+    run_timeout: float = 300.0
+    run_idle_timeout: float = 120.0
+    run_max_attempts: int = 3
+    run_retry_backoff: float = 2.0
+    run_retry_backoff_max: float = 30.0
+    run_retry_on: list[str] = ["timeout", "rate_limit"]
+    hedge_percentile: float = 0.0
+    worker_mode: str = "thread"
+    worker_max_workers: int | None = None
+    func_cache_size: int = 256
+    func_cache_ttl: float = 0.0
+    func_cache_disk: bool = False
+    run_archive_keep: int = 20
 
 
 def _create_default_settings_file(path: Path) -> AppConfig:
@@ -1,10 +1,5 @@
-import wireup
+import lime_ai.libs.copilot as copilot
+from lime_ai.app.container_factory import create_container
 
-import lime_ai.app.cli.writers.logger as logger_writer
-import lime_ai.app.cli.writers.writer as writer
-import lime_ai.app.config as config
-from lime_ai import core, libs
-
-container = wireup.create_async_container(
-    injectables=[config, logger_writer, writer, core, libs],
-)
+# The container of the commands that run agents; they are the only ones that need the Copilot SDK.
+container = create_container(copilot)
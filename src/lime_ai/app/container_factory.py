@@ -0,0 +1,27 @@
+import importlib
+import pkgutil
+
+import wireup
+
+import lime_ai.app.cli.writers.logger as logger_writer
+import lime_ai.app.cli.writers.writer as writer
+import lime_ai.app.config as config
+from lime_ai import core, libs
+
+# Not scanned by default: the Copilot SDK is slow to import, so only commands that run agents register
+# `lime_ai.libs.copilot` (see lime_ai.app.container), and `lime_ai.libs.container` holds the lifecycle hooks.
+_LAZY_LIBS = {"copilot", "container"}
+
+
+def create_container(*injectables) -> wireup.AsyncContainer:
+    """Create a container with the app config, the writers, core and every library except Copilot.
+
+    Args:
+        *injectables: More modules or injectables to register, e.g. `lime_ai.libs.copilot`.
+    """
+    eager_libs = [
+        importlib.import_module(f"{libs.__name__}.{module.name}")
+        for module in pkgutil.iter_modules(libs.__path__)
+        if module.name not in _LAZY_LIBS
+    ]
+    return wireup.create_async_container(injectables=[config, logger_writer, writer, core, *eager_libs, *injectables])
@@ -0,0 +1,34 @@
+"""Where Lime keeps its files. Kept free of heavy imports so the CLI can resolve paths before loading anything else."""
+
+import os
+from pathlib import Path
+
+
+def default_settings_path() -> Path:
+    # Windows roaming app data
+    appdata = os.getenv("APPDATA")
+    if appdata:
+        return Path(appdata) / "lime" / "settings.json"
+
+    # Fallback to a dotdir in the user's home (cross-platform)
+    return Path.home() / ".lime" / "settings.json"
+
+
+def func_cache_dir() -> Path:
+    """Directory for `@effect func cached` results persisted across runs."""
+    return default_settings_path().parent / "func_cache"
+
+
+def run_archive_dir() -> Path:
+    """Directory for the journals of runs spilled to disk during an execution."""
+    return default_settings_path().parent / "runs"
+
+
+def serve_socket_path() -> Path:
+    """Default unix socket of `lime-ai serve` and `lime-ai execute --remote`."""
+    return default_settings_path().parent / "lime.sock"
+
+
+def serve_token_path(port: int) -> Path:
+    """File holding the token `lime-ai serve --port PORT` requires from its clients."""
+    return default_settings_path().parent / f"serve-{port}.token"
@@ -1,5 +1,6 @@
 import re
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from time import monotonic
 
@@ -9,7 +10,8 @@ from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
-from textual.events import Timer
+from textual.css.query import NoMatches
+from textual.events import Click, Timer
 from textual.widgets import Footer, Header, Input, Static
 
 from lime_ai.app.config import AppConfig, save_app_config
@@ -17,13 +19,26 @@ from lime_ai.app.ui.components.app_header import AppHeader
 from lime_ai.app.ui.components.input_overlay import InputOverlay
 from lime_ai.app.ui.components.permission_overlay import PermissionOverlay
 from lime_ai.app.ui.components.run_widget import RunWidget
-from lime_ai.app.ui.status_constants import SPINNER_FRAMES
+from lime_ai.app.ui.run_window import RunWindow
+from lime_ai.app.ui.status_constants import SPINNER_FRAMES, STATUS_REASONING_TAIL
 from lime_ai.core.agents.models import ExecutionModel
-from lime_ai.entities.run import ContentBlockType, RunStatus
+from lime_ai.entities.change_feed import ChangeKind
+from lime_ai.entities.run import ContentBlockType, Run, RunStatus, TokenUsage
+
+SPINNER_INTERVAL = 0.1
 
 
 class LimeApp(App):
-    """Textual app for lime execution output."""
+    """Textual app for lime execution output.
+
+    The app re-renders when the ExecutionModel publishes a change, at most
+    `ui_max_fps` times a second, and only touches the runs that changed. The
+    only timer is the status-line spinner, which runs while the agent executes.
+
+    Only a window of `ui_max_mounted_runs` runs has widgets (see RunWindow).
+    Runs outside it are summarized by a line above or below the list, and
+    scrolling past either end moves the window and rebinds the same widgets.
+    """
 
     CSS_PATH = (
         Path(getattr(sys, "_MEIPASS", Path(__file__).parent)) / "app/display/lime.tcss"
@@ -41,11 +56,26 @@ class LimeApp(App):
     def __init__(self, execution_model: ExecutionModel, app_config: AppConfig) -> None:
         super().__init__()
         self.app_config = app_config
-        self._poll_timer = Timer | None
+        self._spinner_timer: Timer | None = None
         self._model = execution_model
+        self._unsubscribe = None
+        self._frame_interval = 1 / max(app_config.ui_max_fps, 1)
+        self._frame_pending = False
+        self._last_frame = 0.0
+        # Reasoning snippet shown next to the spinner; None when the agent is not executing.
+        self._status_snippet: str | None = None
         self._auto_scroll = True
         self.theme = app_config.theme
+        # Mounted widgets by the index of the run they show, and by id() of that run.
         self._run_widgets: dict[int, RunWidget] = {}
+        self._widgets_by_run: dict[int, RunWidget] = {}
+        self._widget_pool: list[RunWidget] = []
+        self._runs: list[Run] = []
+        self._run_ids: set[int] = set()
+        # Status-line bookkeeping, updated from the runs each frame reports as added or changed.
+        self._unfinished: dict[int, Run] = {}
+        self._finished_tokens: dict[int, TokenUsage] = {}
+        self._window = RunWindow(size=max(app_config.ui_max_mounted_runs, 1))
         self._header_fp: tuple | None = None
         self._displayed_input: object = None
         self._displayed_permission: object = None
@@ -55,25 +85,58 @@ class LimeApp(App):
         yield Header(show_clock=True)
         with VerticalScroll(id="scroll"):
             yield Static(id="header-content")
-            yield Vertical(id="runs-container")
+            with Vertical(id="runs-container"):
+                yield Static(id="runs-before", classes="runs-hidden")
+                yield Static(id="runs-after", classes="runs-hidden")
             yield Static(id="status-line")
         yield PermissionOverlay(id="perm-overlay")
         yield InputOverlay(id="input-overlay")
         yield Footer()
 
-    def on_mount(self) -> None:
-        self._poll_timer = self.set_interval(0.016, self._poll)
+    async def on_mount(self) -> None:
+        self._unsubscribe = self._model.changes.subscribe(self._request_frame)
+        self._spinner_timer = self.set_interval(SPINNER_INTERVAL, self._render_spinner)
+        self.watch(self.query_one("#scroll", VerticalScroll), "scroll_y", self._on_scroll, init=False)
+        # Render whatever happened before the app subscribed.
+        self._model.changes.drain()
+        await self._render_frame(full=True)
+
+    def on_unmount(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+        if self._spinner_timer is not None:
+            self._spinner_timer.stop()
+            self._spinner_timer = None
 
     def watch_theme(self, theme: str) -> None:
         self.theme = theme
         self.app_config.theme = theme
         save_app_config(self.app_config)
 
-    async def _poll(self) -> None:
-        await self._sync_runs()
+    def _request_frame(self) -> None:
+        """Schedule a render for published changes, no sooner than one frame after the last one."""
+        if self._frame_pending:
+            return
+        self._frame_pending = True
+        delay = self._last_frame + self._frame_interval - monotonic()
+        if delay > 0:
+            self.set_timer(delay, self._render_frame)
+        else:
+            self.call_later(self._render_frame)
+
+    async def _render_frame(self, full: bool = False) -> None:
+        self._frame_pending = False
+        self._last_frame = monotonic()
+        changes = self._model.changes.drain()
+
+        if full or ChangeKind.RUN_ADDED in changes.kinds or ChangeKind.DONE in changes.kinds:
+            await self._sync_runs()
+        else:
+            self._sync_changed_runs(changes.runs.values())
+        self._track_runs(changes.runs.values())
 
         self._sync_header()
-        self._sync_status()
+        self._sync_status(changed=full or bool(changes.runs) or ChangeKind.DONE in changes.kinds)
 
         self._sync_input()
         self._sync_permission()
@@ -81,9 +144,6 @@ class LimeApp(App):
         if self._auto_scroll:
             self.query_one("#scroll", VerticalScroll).scroll_end(animate=False)
 
-        if self._model.done:
-            self._poll_timer.stop()
-
     def _sync_header(self) -> None:
         model = self._model
         memory_len = len(model.memory.get_items()) if model.memory else 0
@@ -96,52 +156,137 @@ class LimeApp(App):
         self.query_one("#header-content", Static).update(Group(*renderables))
 
     async def _sync_runs(self) -> None:
-        turns = self._model.turns_with_runs
-        container = self.query_one("#runs-container", Vertical)
+        runs = [turn.run for turn in self._model.turns_with_runs]
+        run_ids = {id(run) for run in runs}
+        # A turn may have swapped its run (e.g. a hedged attempt won) without reporting the new one as changed.
+        added = [run for run in runs if id(run) not in self._run_ids]
+        for key in self._run_ids - run_ids:
+            self._unfinished.pop(key, None)
+            self._finished_tokens.pop(key, None)
+        self._runs, self._run_ids = runs, run_ids
+        self._track_runs(added)
+        if self._auto_scroll:
+            self._window.follow_tail(len(self._runs))
+        await self._bind_window()
 
-        for i, turn in enumerate(turns):
-            if turn.run is None:
+    async def _bind_window(self) -> None:
+        """Bind the pooled widgets to the runs in the window, mounting more only while the pool is short."""
+        container = self.query_one("#runs-container", Vertical)
+        visible = self._window.visible(len(self._runs))
+
+        while len(self._widget_pool) < len(visible):
+            widget = RunWidget(visible.start + len(self._widget_pool), self.app_config)
+            self._widget_pool.append(widget)
+            await container.mount(widget, before="#runs-after")
+        while len(self._widget_pool) > len(visible):
+            await self._widget_pool.pop().remove()
+
+        self._run_widgets = {}
+        self._widgets_by_run = {}
+        for widget, index in zip(self._widget_pool, visible, strict=True):
+            run = self._runs[index]
+            widget.bind(index, run)
+            self._run_widgets[index] = widget
+            self._widgets_by_run[id(run)] = widget
+
+        self._update_hidden_runs()
+
+    def _update_hidden_runs(self) -> None:
+        before = self._window.hidden_before()
+        after = self._window.hidden_after(len(self._runs))
+        before_line = self.query_one("#runs-before", Static)
+        after_line = self.query_one("#runs-after", Static)
+        before_line.update(Text(f"▲ {before} earlier runs (scroll up or click to show)", style="dim"))
+        after_line.update(Text(f"▼ {after} later runs (scroll down or click to show)", style="dim"))
+        before_line.display = before > 0
+        after_line.display = after > 0
+
+    async def _move_window(self, delta: int) -> None:
+        if self._window.shift(delta, len(self._runs)):
+            await self._bind_window()
+
+    async def _on_scroll(self, scroll_y: float) -> None:
+        scroll = self.query_one("#scroll", VerticalScroll)
+        if scroll_y <= 0 and self._window.hidden_before():
+            self._auto_scroll = False
+            await self._move_window(-(self._window.size // 2))
+        elif scroll_y >= scroll.max_scroll_y and self._window.hidden_after(len(self._runs)):
+            await self._move_window(self._window.size // 2)
+
+    @on(Click, "#runs-before")
+    async def _on_runs_before_clicked(self) -> None:
+        self._auto_scroll = False
+        await self._move_window(-(self._window.size // 2))
+
+    @on(Click, "#runs-after")
+    async def _on_runs_after_clicked(self) -> None:
+        await self._move_window(self._window.size // 2)
+
+    def _sync_changed_runs(self, runs: Iterable[Run]) -> None:
+        for run in runs:
+            widget = self._widgets_by_run.get(id(run))
+            # A run without a widget (e.g. a hedged attempt) is not displayed.
+            if widget is not None and widget._run is run:
+                widget.sync(run)
+
+    def _track_runs(self, runs: Iterable[Run]) -> None:
+        """Record whether each displayed run among `runs` has finished, for the status line."""
+        for run in runs:
+            key = id(run)
+            # A run no turn shows (e.g. a hedged attempt) does not count.
+            if key not in self._run_ids:
                 continue
-
-            if i not in self._run_widgets:
-                widget = RunWidget(i, self.app_config)
-                self._run_widgets[i] = widget
-                await container.mount(widget)
-
-            self._run_widgets[i].sync(turn.run)
-
-    def _sync_status(self) -> None:
+            if run.status in (RunStatus.COMPLETED, RunStatus.ERROR):
+                self._unfinished.pop(key, None)
+                self._finished_tokens[key] = run.tokens
+            else:
+                self._finished_tokens.pop(key, None)
+                self._unfinished[key] = run
+
+    def _sync_status(self, changed: bool) -> None:
+        """Update the status line from the tracked runs.
+
+        Args:
+            changed (bool): Whether runs were added, changed or finished since the last frame; the
+                completed summary is only rebuilt then.
+        """
         model = self._model
-        has_runs = model.turns and any(t.run for t in model.turns)
-        if not has_runs:
+        if not self._run_ids:
+            self._status_snippet = None
             self.query_one("#status-line", Static).update("")
             return
 
-        all_done = all(t.run and t.run.status in (RunStatus.COMPLETED, RunStatus.ERROR) for t in model.turns if t.run)
-        if all_done:
+        if not self._unfinished:
             self._auto_scroll = False
+            if not changed and self._status_snippet is None:
+                return
+            self._status_snippet = None
+            if model.done and self._spinner_timer is not None:
+                self._spinner_timer.stop()
+                self._spinner_timer = None
 
             t = Text()
 
             t.append("● ", style="bold green")
             t.append("All turns completed  ", style="dim")
+
+            tokens = TokenUsage()
+            for run_tokens in self._finished_tokens.values():
+                tokens.accumulate(run_tokens)
+            if tokens.cache_hit_ratio is not None:
+                t.append(f"{tokens.cache_hit_ratio:.0%} prompt cache hits  ", style="dim")
             t.append("q", style="bold")
             t.append(" to quit", style="dim")
 
             self.query_one("#status-line", Static).update(t)
         else:
-            frame = SPINNER_FRAMES[int(monotonic() * 10) % len(SPINNER_FRAMES)]
-
-            t = Text()
-
-            t.append(f"{frame} ", style="green")
-            t.append("Executing…", style="dim")
-
+            self._status_snippet = ""
             run = model.current_run
             if run is not None:
-                reasoning_blocks = [b for b in run.content_blocks if b.type == ContentBlockType.REASONING and b.text]
+                reasoning_blocks = [b for b in run.content_blocks if b.type == ContentBlockType.REASONING and b.buffer]
                 if reasoning_blocks:
-                    latest = reasoning_blocks[-1].text
+                    # Only the newest reasoning matters for the status line; avoid joining the whole stream.
+                    latest = reasoning_blocks[-1].buffer.tail(-STATUS_REASONING_TAIL)
                     condensed = re.findall(r"\*\*(.+?)\*\*", latest)
 
                     snippet = condensed[-1] if condensed else latest
@@ -149,9 +294,30 @@ class LimeApp(App):
 
                     if len(snippet) > 80:
                         snippet = snippet[:77] + "…"
-                    t.append(f"  {snippet}", style="dim italic")
+                    self._status_snippet = snippet
 
-            self.query_one("#status-line", Static).update(t)
+            self._render_spinner()
+
+    def _render_spinner(self) -> None:
+        """Advance the spinner on the status line; a no-op unless the agent is executing."""
+        if self._status_snippet is None:
+            return
+
+        frame = SPINNER_FRAMES[int(monotonic() * 10) % len(SPINNER_FRAMES)]
+
+        t = Text()
+
+        t.append(f"{frame} ", style="green")
+        t.append("Executing…", style="dim")
+        if self._status_snippet:
+            t.append(f"  {self._status_snippet}", style="dim italic")
+
+        try:
+            status_line = self.query_one("#status-line", Static)
+        except NoMatches:
+            # A tick that fires while the app shuts down.
+            return
+        status_line.update(t)
 
     def _sync_input(self) -> None:
         pending = self._model.pending_input
@@ -183,19 +349,18 @@ class LimeApp(App):
         """When a parent run collapses, collapse all immediately-following sub-runs."""
         if event.expanded:
             return
-        sender = event.run_widget
-        widgets = [self._run_widgets[i] for i in sorted(self._run_widgets)]
-        found = False
-        for w in widgets:
-            if w is sender:
-                found = True
-                continue
-            if found:
-                if w._run and w._run.is_sub_run:
-                    w._run.is_expanded = False
-                    w.set_class(False, "-expanded")
-                else:
-                    break
+        sender = event.run_widget._run
+        start = next((i for i, run in enumerate(self._runs) if run is sender), None)
+        if start is None:
+            return
+        # Sub-runs outside the window have no widget; their flag is applied when they are bound.
+        for run in self._runs[start + 1 :]:
+            if not run.is_sub_run:
+                break
+            run.is_expanded = False
+            widget = self._widgets_by_run.get(id(run))
+            if widget is not None:
+                widget.sync(run)
 
     @on(PermissionOverlay.Resolved)
     def _on_permission_resolved(self, event: PermissionOverlay.Resolved) -> None:
@@ -215,8 +380,11 @@ class LimeApp(App):
 
     # -- Actions -------------------------------------------------------------
 
-    def action_toggle_auto_scroll(self) -> None:
+    async def action_toggle_auto_scroll(self) -> None:
         self._auto_scroll = not self._auto_scroll
+        if self._auto_scroll:
+            self._window.follow_tail(len(self._runs))
+            await self._bind_window()
         self.notify(f"Auto-scroll {'on' if self._auto_scroll else 'off'}")
 
     def action_toggle_permissions(self) -> None:
@@ -229,6 +397,8 @@ class LimeApp(App):
         config = self.app_config
         config.show_context = not config.show_context
         save_app_config(config)
+        for widget in self._run_widgets.values():
+            widget.invalidate_content()
         self.notify(f"Context {'off' if config.show_context else 'on'}")
 
     def on_key(self, event) -> None:
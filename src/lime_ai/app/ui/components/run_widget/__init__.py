@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from rich.console import Group
-from rich.text import Text
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -14,11 +13,17 @@ from lime_ai.app.ui.components.run_header import RunHeader
 from lime_ai.app.ui.components.run_widget.run_widget_content import RunWidgetContent
 from lime_ai.app.ui.components.run_widget.run_widget_header import RunWidgetHeader
 from lime_ai.app.ui.status_constants import NUM_SUB_COLORS
-from lime_ai.entities.run import Run
+from lime_ai.entities.run import Run, RunStatus
 
 
 class RunWidget(Vertical):
-    """A single execution turn: clickable header + collapsible content."""
+    """A single execution turn: clickable header + collapsible content.
+
+    The app recycles widgets: bind() points a widget at another run when the
+    visible window of runs moves. A collapsed, finished run keeps only its
+    header; its rendered content is dropped until it is expanded again. Runs
+    spilled to disk are loaded back when their content has to be drawn.
+    """
 
     DEFAULT_CLASSES = "block"
 
@@ -34,21 +39,31 @@ class RunWidget(Vertical):
         super().__init__()
         self._index = index
         self._run: Run | None = None
-        self._tool_call_cache: dict = {}
         self.app_config = app_config
         self._content: RunWidgetContent = RunWidgetContent()
         self._header: RunWidgetHeader | None = RunWidgetHeader(index=index)
+        # Section key -> (its Static, the parts it currently shows).
+        self._section_widgets: dict[str, tuple[Static, list]] = {}
 
     def compose(self) -> ComposeResult:
         yield RunHeader(id="run-header")
-        yield Static(id="run-content")
+        yield Vertical(id="run-content")
 
     def on_mount(self) -> None:
         self._refresh_header()
         self._refresh_content()
 
+    def bind(self, index: int, run: Run) -> None:
+        """Show `run` (number `index` in the session) in this widget, dropping what it rendered for its previous run."""
+        if self._run is not run or self._index != index:
+            self._index = index
+            self._header = RunWidgetHeader(index=index)
+            self._release_content()
+            self._content = RunWidgetContent()
+        self.sync(run)
+
     def sync(self, run: Run) -> None:
-        """Called every poll tick with the latest data for this turn."""
+        """Called when the run changed, with the latest data for this turn."""
         self._run = run
         self.set_class(run.is_sub_run, "-sub-run")
         self.set_class(run.is_expanded, "-expanded")
@@ -58,20 +73,36 @@ class RunWidget(Vertical):
             for i in range(NUM_SUB_COLORS):
                 self.set_class(i == color_idx, f"-sub-color-{i}")
 
+        if not run.is_expanded and run.status in (RunStatus.COMPLETED, RunStatus.ERROR):
+            self._release_content()
+
         self._refresh_header()
         self._refresh_content()
 
+    def invalidate_content(self) -> None:
+        """Re-render the content on the next sync, e.g. after a display setting changed."""
+        self._content.invalidate()
+
     @on(Click, "RunHeader")
     def _on_header_click(self, event: Click) -> None:
         event.stop()
         self._run.on_expanded()
         self.set_class(self._run.is_expanded, "-expanded")
-        self._content_fp = None
+        self._content.invalidate()
         self._refresh_header()
         self._refresh_content()
         if not self._run.is_sub_run:
             self.post_message(self.CollapseChanged(self, self._run.is_expanded))
 
+    def _release_content(self) -> None:
+        """Unmount the content sections and drop their cached renderables."""
+        if not self._section_widgets:
+            return
+        for static, _ in self._section_widgets.values():
+            static.remove()
+        self._section_widgets.clear()
+        self._content = RunWidgetContent()
+
     def _refresh_header(self) -> None:
         if self._run is None:
             return
@@ -99,16 +130,40 @@ class RunWidget(Vertical):
         if self._run is None or not self._run.is_expanded:
             return
 
+        if self._run.archived is not None:
+            # A spilled run is finished: keep what is shown, load it back only to draw it again.
+            if self._section_widgets and self._content.is_rendered:
+                return
+            self._run.ensure_content()
+
         if not self._content.should_render(run=self._run):
             return
 
         try:
-            content = self.query_one("#run-content", Static)
+            content = self.query_one("#run-content", Vertical)
         except Exception:
             return
 
-        parts: list = []
-
-        parts.extend(self._content.refresh_content(self._run, self.app_config))
-
-        content.update(Group(*parts) if parts else Text(""))
+        sections = self._content.render_sections(self._run, self.app_config)
+        keys = {key for key, _ in sections}
+        for key in [key for key in self._section_widgets if key not in keys]:
+            self._section_widgets.pop(key)[0].remove()
+
+        # Only sections whose parts changed are updated; a streamed delta touches the last block only.
+        previous: Static | None = None
+        for key, parts in sections:
+            existing = self._section_widgets.get(key)
+            if existing is None:
+                static = Static(Group(*parts))
+                if previous is not None:
+                    content.mount(static, after=previous)
+                elif content.children:
+                    content.mount(static, before=0)
+                else:
+                    content.mount(static)
+            else:
+                static, shown = existing
+                if shown is not parts:
+                    static.update(Group(*parts))
+            self._section_widgets[key] = (static, parts)
+            previous = static
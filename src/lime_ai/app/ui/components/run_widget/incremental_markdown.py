@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+
+from rich.console import RenderableType
+from rich.markdown import Markdown
+from rich.text import Text
+
+from lime_ai.entities.text_buffer import TextBuffer
+
+_FENCE = re.compile(r"^ {0,3}(```|~~~)")
+_LIST_ITEM = re.compile(r"^([-+*]|\d{1,9}[.)])(\s|$)")
+
+
+class IncrementalMarkdown:
+    """Markdown rendering for a streamed, append-only text.
+
+    The text is cut where a new top-level block starts: after a blank line
+    outside code fences, before a line at column 0 that does not continue a
+    list. Completed blocks are parsed once and kept. Each update re-parses
+    only the block still being streamed, so the cost of a delta does not grow
+    with the length of the response. Once the text is final it is parsed as a
+    whole, so what stays on screen is exactly the full render.
+
+    Examples
+    >>> buffer = TextBuffer("# Title\\n\\nFirst par")
+    >>> markdown = IncrementalMarkdown()
+    >>> len(markdown.update(buffer))  # the completed heading + the growing paragraph
+    2
+    """
+
+    def __init__(self):
+        # Text before this offset ends outside a code fence and is already parsed.
+        self._consumed = 0
+        self._completed: list[RenderableType] = []
+
+    def update(self, buffer: TextBuffer, final: bool = False) -> list[RenderableType]:
+        """Return the renderables for the current text of `buffer`.
+
+        Args:
+            buffer (TextBuffer): The streamed text.
+            final (bool): True once nothing more will be appended; the whole text is rendered in one piece.
+        """
+        if final:
+            self._consumed = 0
+            self._completed = []
+            return [_markdown(buffer.text)] if buffer.text.strip() else []
+
+        pending = buffer.tail(self._consumed)
+        cut = _last_boundary(pending)
+        if cut:
+            self._completed.append(_markdown(pending[:cut]))
+            self._consumed += cut
+            pending = pending[cut:]
+
+        if pending.strip():
+            return [*self._completed, _markdown(pending)]
+        return list(self._completed)
+
+
+def _last_boundary(text: str) -> int:
+    """Offset of the last complete line that starts a new top-level block after a blank line, or 0.
+
+    Such a line is outside a code fence, starts at column 0 and is neither a list item nor a fence:
+    an indented line after a blank line may continue a list item, so it is never a cut.
+    """
+    in_fence = False
+    after_blank = False
+    cut = 0
+    position = 0
+    for line in text.splitlines(keepends=True):
+        start = position
+        position += len(line)
+        if not line.endswith("\n"):
+            # The last line is still being streamed.
+            break
+        if _FENCE.match(line):
+            in_fence = not in_fence
+            after_blank = False
+        elif in_fence:
+            continue
+        elif not line.strip():
+            after_blank = True
+        else:
+            if after_blank and not line[0].isspace() and not _LIST_ITEM.match(line):
+                cut = start
+            after_blank = False
+    return cut
+
+
+def _markdown(text: str) -> RenderableType:
+    try:
+        return Markdown(text)
+    except Exception:
+        return Text(text)
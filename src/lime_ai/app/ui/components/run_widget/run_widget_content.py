@@ -8,111 +8,174 @@ from rich.table import Table
 from rich.text import Text
 
 from lime_ai.app.config import AppConfig
-from lime_ai.entities.function import FunctionCall
+from lime_ai.app.ui.components.run_widget.incremental_markdown import IncrementalMarkdown
 from lime_ai.entities.run import ContentBlock, ContentBlockType, Run, RunStatus, ToolCall
 
 
 class RunWidgetContent:
+    """Builds the renderables for a run's content, caching them per section.
+
+    The content is split into sections (the prompt, one per content block,
+    errors, usage and code changes). A section whose inputs did not change
+    returns the same list object as before, so the widget only updates the
+    sections that changed. Response blocks render through IncrementalMarkdown,
+    so a streamed delta re-parses only the paragraph being written.
+    """
+
     def __init__(self):
-        self.num_content_blocks = 0
-        self.tool_calls = 0
-        self.status = None
-        self.last_text_len: int = 0
-        self.completed_tool_calls: int = 0
+        self._fingerprint: tuple | None = None
         self._tool_call_cache: dict = {}
+        # Section key -> (fingerprint, parts); blocks also keep their IncrementalMarkdown.
+        self._sections: dict[str, tuple[tuple, list]] = {}
+        self._markdown: dict[int, tuple[ContentBlock, IncrementalMarkdown]] = {}
 
     def should_render(self, run: Run) -> bool:
-        num_content_blocks = len(run.content_blocks)
-        tool_calls = len(run.tool_calls)
-        status = run.status
-        last_text_len = len(run.content_blocks[-1].text) if run.content_blocks else 0
-        completed_tool_calls = sum(1 for tc in run.tool_calls if tc.success is not None)
-
-        if (num_content_blocks, tool_calls, status, last_text_len, completed_tool_calls) == (
-            self.num_content_blocks,
-            self.tool_calls,
-            self.status,
-            self.last_text_len,
-            self.completed_tool_calls,
-        ):
+        fingerprint = (
+            len(run.content_blocks),
+            run.tool_calls_started,
+            run.status,
+            len(run.content_blocks[-1].buffer) if run.content_blocks else 0,
+            run.tool_calls_completed,
+            len(run.errors),
+            run.tokens.total_tokens,
+            run.code_changes is not None,
+        )
+        if fingerprint == self._fingerprint:
             return False
 
+        self._fingerprint = fingerprint
         return True
 
-    def refresh_content(self, run: Run, app_config: AppConfig):
-        parts: list = []
+    @property
+    def is_rendered(self) -> bool:
+        """True once content was rendered and not invalidated since."""
+        return self._fingerprint is not None
 
-        parts.extend(self.render_run(run, app_config))
-
-        return parts
+    def invalidate(self):
+        """Force the next should_render() call to return True (e.g. after the run is re-expanded)."""
+        self._fingerprint = None
 
     def render_run(self, run: Run, app_config: AppConfig) -> list:
-        parts = []
+        return [part for _, section in self.render_sections(run, app_config) for part in section]
+
+    def render_sections(self, run: Run, app_config: AppConfig) -> list[tuple[str, list]]:
+        """Return (key, parts) for every non-empty section of the run, in display order."""
+        sections = []
 
         if app_config.show_context and run.provider != "local":
-            parts.append(Text("Prompt:", style="bold blue"))
-            parts.append(Text(run.prompt, style="dim"))
-
-        tool_call_map = {tc.tool_call_id: tc for tc in run.tool_calls}
-
-        for block in run.content_blocks:
-            if block.type == ContentBlockType.REASONING:
-                continue
-            elif block.type == ContentBlockType.RESPONSE:
-                if not block.text:
-                    continue
-                parts.append(Text("Response:", style="bold blue"))
-                try:
-                    parts.append(Markdown(block.text))
-                except Exception:
-                    parts.append(Text(block.text))
-            elif block.type == ContentBlockType.TOOL_CALL:
-                tc = tool_call_map.get(block.ref)
-                if tc:
-                    parts.append(self._get_or_render_tool_call(tc))
-            elif block.type == ContentBlockType.INPUT:
-                parts.append(self._render_input(block))
-            elif block.type == ContentBlockType.LOGGING:
-                if not block.text:
-                    continue
-                parts.append(Text(f"[INFO] {block.text}", style="cyan dim"))
-
-        # Errors
-        for err in run.errors:
-            parts.append(
-                Panel(
-                    Text(err.message, style="red"),
-                    title=f"Error{f' ({err.error_type})' if err.error_type else ''}",
-                    border_style="red",
-                    expand=True,
+            sections.append(
+                self._section(
+                    "prompt",
+                    (run.prompt,),
+                    lambda: [Text("Prompt:", style="bold blue"), Text(run.prompt, style="dim")],
                 )
             )
 
-        # Usage summary (only when run is done)
+        for index, block in enumerate(run.content_blocks):
+            section = self._render_block(index, block, run)
+            if section is not None:
+                sections.append(section)
+
+        if run.errors:
+            sections.append(self._section("errors", (len(run.errors),), lambda: self._render_errors(run)))
+
         if run.status == RunStatus.COMPLETED and run.tokens.total_tokens > 0:
-            usage = Table.grid(padding=(0, 2))
-            usage.add_row(
-                Text("Tokens:", style="dim"),
-                Text(f"{run.tokens.input_tokens:,} in", style="dim"),
-                Text(f"{run.tokens.output_tokens:,} out", style="dim"),
+            usage_fingerprint = (
+                run.tokens.input_tokens,
+                run.tokens.output_tokens,
+                run.tokens.cache_read_tokens,
+                run.request_count,
             )
-            if run.request_count > 0:
-                usage.add_row(
-                    Text("Requests:", style="dim"),
-                    Text(str(run.request_count), style="dim"),
-                )
-            parts.append(usage)
+            sections.append(self._section("usage", usage_fingerprint, lambda: [self._render_usage(run)]))
 
-        # Code changes
         if run.code_changes:
             cc = run.code_changes
-            changes_text = Text()
-            changes_text.append(f"{len(cc.files_modified)} files", style="dim")
-            changes_text.append(f"  +{cc.lines_added}", style="green")
-            changes_text.append(f"  -{cc.lines_removed}", style="red")
-            parts.append(changes_text)
+            changes_fingerprint = (len(cc.files_modified), cc.lines_added, cc.lines_removed)
+            sections.append(self._section("changes", changes_fingerprint, lambda: [self._render_code_changes(run)]))
+
+        return [(key, parts) for key, parts in sections if parts]
+
+    def _section(self, key: str, fingerprint: tuple, render) -> tuple[str, list]:
+        cached = self._sections.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return key, cached[1]
+        parts = render()
+        self._sections[key] = (fingerprint, parts)
+        return key, parts
+
+    def _render_block(self, index: int, block: ContentBlock, run: Run) -> tuple[str, list] | None:
+        key = f"block-{index}"
+        if block.type == ContentBlockType.RESPONSE:
+            if not block.buffer:
+                return None
+            final = run.status in (RunStatus.COMPLETED, RunStatus.ERROR)
+            return self._section(
+                key, (id(block), len(block.buffer), final), lambda: self._render_response(index, block, final)
+            )
+        elif block.type == ContentBlockType.TOOL_CALL:
+            tc = run.get_tool_call(block.ref)
+            if tc is None:
+                return None
+            fingerprint = (id(block), tc.success, tc.duration_ms, tc.result is not None)
+            return self._section(key, fingerprint, lambda: [self._get_or_render_tool_call(tc)])
+        elif block.type == ContentBlockType.INPUT:
+            return self._section(key, (id(block), len(block.buffer)), lambda: [self._render_input(block)])
+        elif block.type == ContentBlockType.LOGGING:
+            if not block.buffer:
+                return None
+            return self._section(
+                key, (id(block), len(block.buffer)), lambda: [Text(f"[INFO] {block.text}", style="cyan dim")]
+            )
+        return None
+
+    def _render_response(self, index: int, block: ContentBlock, final: bool) -> list:
+        cached = self._markdown.get(index)
+        if cached is None or cached[0] is not block:
+            cached = (block, IncrementalMarkdown())
+            self._markdown[index] = cached
+        return [Text("Response:", style="bold blue"), *cached[1].update(block.buffer, final=final)]
+
+    @staticmethod
+    def _render_errors(run: Run) -> list:
+        return [
+            Panel(
+                Text(err.message, style="red"),
+                title=f"Error{f' ({err.error_type})' if err.error_type else ''}",
+                border_style="red",
+                expand=True,
+            )
+            for err in run.errors
+        ]
+
+    @staticmethod
+    def _render_usage(run: Run) -> Table:
+        usage = Table.grid(padding=(0, 2))
+        usage.add_row(
+            Text("Tokens:", style="dim"),
+            Text(f"{run.tokens.input_tokens:,} in", style="dim"),
+            Text(f"{run.tokens.output_tokens:,} out", style="dim"),
+        )
+        if run.tokens.cache_hit_ratio is not None:
+            usage.add_row(
+                Text("Cache:", style="dim"),
+                Text(f"{run.tokens.cache_hit_ratio:.0%} hit", style="dim"),
+                Text(f"{run.tokens.cache_read_tokens:,} read", style="dim"),
+            )
+        if run.request_count > 0:
+            usage.add_row(
+                Text("Requests:", style="dim"),
+                Text(str(run.request_count), style="dim"),
+            )
+        return usage
 
-        return parts
+    @staticmethod
+    def _render_code_changes(run: Run) -> Text:
+        cc = run.code_changes
+        changes_text = Text()
+        changes_text.append(f"{len(cc.files_modified)} files", style="dim")
+        changes_text.append(f"  +{cc.lines_added}", style="green")
+        changes_text.append(f"  -{cc.lines_removed}", style="red")
+        return changes_text
 
     def _get_or_render_tool_call(self, tc: ToolCall) -> Panel:
         if tc.success is not None:
@@ -158,20 +221,3 @@ class RunWidgetContent:
     @staticmethod
     def _render_input(tc: ContentBlock) -> Panel:
         return Panel(Group(Markdown(tc.text)), border_style="dim", expand=True)
-
-    @staticmethod
-    def render_function_calls(function_calls: list[FunctionCall]) -> list:
-        return [
-            Panel(
-                Group(
-                    Text("❯  " + fc.method, style="bold cyan"),
-                    Syntax(fc.params, "python", theme="monokai", line_numbers=False),
-                    Text((fc.result or "")[0:150], style="dim"),
-                ),
-                title="fn",
-                border_style="cyan dim",
-                expand=True,
-                padding=(0, 1),
-            )
-            for fc in function_calls
-        ]
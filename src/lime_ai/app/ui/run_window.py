@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RunWindow:
+    """The range of runs that have a mounted RunWidget.
+
+    Only `size` runs are mounted at a time. The window follows the newest runs
+    while auto-scroll is on. It moves by half a window when the user scrolls
+    past either end, so the number of live widgets stays bounded however many
+    runs a session produces.
+
+    Examples
+    >>> window = RunWindow(size=50)
+    >>> window.follow_tail(total=1000)
+    >>> window.visible(total=1000)
+    range(950, 1000)
+    >>> window.shift(-25, total=1000)
+    True
+    >>> window.visible(total=1000)
+    range(925, 975)
+    """
+
+    size: int = 50
+    start: int = 0
+
+    def visible(self, total: int) -> range:
+        """Indexes of the runs to mount, out of `total` runs."""
+        return range(min(self.start, total), min(self.start + self.size, total))
+
+    def hidden_before(self) -> int:
+        return self.start
+
+    def hidden_after(self, total: int) -> int:
+        return max(total - self.start - self.size, 0)
+
+    def follow_tail(self, total: int):
+        """Move the window onto the newest runs."""
+        self.start = max(total - self.size, 0)
+
+    def shift(self, delta: int, total: int) -> bool:
+        """Move the window by `delta` runs, clamped to the run list. Returns True when it moved."""
+        start = min(max(self.start + delta, 0), max(total - self.size, 0))
+        moved = start != self.start
+        self.start = start
+        return moved
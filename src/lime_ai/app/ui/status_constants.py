@@ -20,5 +20,8 @@ STATUS_ICON: dict[RunStatus, str] = {
 
 SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
 
+# Characters of the latest reasoning block scanned for the status-line snippet
+STATUS_REASONING_TAIL = 2000
+
 SUB_RUN_PALETTE = ["#00d7ff", "#ff5fff", "#ffd700", "#87ff00", "#ff8700", "#af87ff"]
 NUM_SUB_COLORS = len(SUB_RUN_PALETTE)
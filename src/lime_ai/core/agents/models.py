@@ -4,6 +4,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.entities.budget import BudgetExceeded, BudgetPolicy
+from lime_ai.entities.change_feed import ChangeFeed, ChangeKind
 from lime_ai.entities.context import Context
 from lime_ai.entities.function import FunctionCall
 from lime_ai.entities.memory import Memory
@@ -73,6 +76,11 @@ class ExecutionModel:
     - add_function_call_log(method: str, params: dict) -> FunctionCall: Record a function call for auditing.
     - add_import_error(error: str) -> None: Record an import error.
     - add_warning(warning: str) -> None: Record a warning message.
+    - notify_run_changed(run: Run | None) -> None: Publish that a run's content or status changed.
+
+    Changes are published on `changes` (a ChangeFeed) so the UI re-renders on
+    demand instead of polling. When `run_archive` is set, starting a run spills
+    the content of older finished runs to disk.
 
     Examples
     >>> em = ExecutionModel()
@@ -85,8 +93,10 @@ class ExecutionModel:
     """
 
     def __init__(self):
-        self.pending_input: InputRequest | None = None
-        self.pending_permission: PermissionPrompt | None = None
+        self.changes = ChangeFeed()
+        self._pending_input: InputRequest | None = None
+        self._pending_permission: PermissionPrompt | None = None
+        self._done = False
         self._input_lock = asyncio.Lock()
         self._permission_lock = asyncio.Lock()
         self.header: str = ""
@@ -94,10 +104,45 @@ class ExecutionModel:
         self.import_errors = []
         self.warnings: list[str] = []
         self.metadata: dict[str, Any] = {}
+        self.budget = BudgetPolicy()
+        # Turn count at the start of each active for loop, outermost first.
+        self.loop_starts: list[int] = []
         self.turns: list[Turn] = []
         self.memory: Memory | None = None
+        # Spills finished runs to disk on long sessions; set by the caller.
+        self.run_archive: RunArchive | None = None
         self.globals_dict: dict[str, Any] = globals()
-        self.done: bool = False
+
+    @property
+    def pending_input(self) -> InputRequest | None:
+        return self._pending_input
+
+    @pending_input.setter
+    def pending_input(self, request: InputRequest | None):
+        self._pending_input = request
+        self.changes.publish(ChangeKind.OVERLAY)
+
+    @property
+    def pending_permission(self) -> PermissionPrompt | None:
+        return self._pending_permission
+
+    @pending_permission.setter
+    def pending_permission(self, prompt: PermissionPrompt | None):
+        self._pending_permission = prompt
+        self.changes.publish(ChangeKind.OVERLAY)
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @done.setter
+    def done(self, value: bool):
+        self._done = value
+        self.changes.publish(ChangeKind.DONE)
+
+    def notify_run_changed(self, run: Run | None = None):
+        """Publish that `run` (default: the current run) streamed content or changed status."""
+        self.changes.publish(ChangeKind.RUN_UPDATED, run if run is not None else self.current_run)
 
     def start(self):
         """Initialize the execution model for a new agent execution."""
@@ -111,6 +156,16 @@ class ExecutionModel:
 
         return turn
 
+    @property
+    def depth(self) -> int:
+        """Nesting level of this execution: 0 for the top-level agent, +1 per @effect exec."""
+        return 0
+
+    @property
+    def parent(self) -> "ExecutionModel | None":
+        """The execution that started this one with @effect exec, if any."""
+        return None
+
     @property
     def model(self) -> str | None:
         """Get the model specified in the .mgx front-matter, or None if absent."""
@@ -153,9 +208,56 @@ class ExecutionModel:
         )
 
         self.turns[-1].run = run
+        if self.run_archive is not None:
+            self.run_archive.track(run)
+            self.run_archive.spill()
+        self.changes.publish(ChangeKind.RUN_ADDED, run)
 
         return run
 
+    def usage(self, since_turn: int = 0) -> tuple[int, float]:
+        """Total tokens and cost of the runs in `turns[since_turn:]`, including mirrored sub-execution runs.
+
+        Args:
+            since_turn (int): Index of the first turn to count.
+        """
+        tokens, cost = 0, 0.0
+        for turn in self.turns[since_turn:]:
+            if turn.run is not None:
+                tokens += turn.run.tokens.total_tokens
+                cost += turn.run.total_cost
+        return tokens, cost
+
+    def apply_budget(self) -> None:
+        """Enforce the front-matter budgets of this execution and its parents before the next LLM run.
+
+        Switches to the fallback model once a budget is nearly used (see BudgetPolicy).
+
+        Raises:
+            BudgetExceeded: A budget is spent and the agent must stop.
+        """
+        model: ExecutionModel | None = self
+        while model is not None:
+            policy = model.budget
+            scopes = [("execution", policy.execution, model.usage())]
+            if model.loop_starts:
+                scopes.append(("loop", policy.loop, model.usage(since_turn=model.loop_starts[0])))
+
+            for scope, budget, (tokens, cost) in scopes:
+                fraction = budget.usage_fraction(tokens, cost)
+                if fraction >= 1:
+                    raise BudgetExceeded(
+                        f"Stopping: {scope} budget exceeded ({tokens:,} tokens, ${cost:.2f} used; "
+                        f"limits {budget.max_tokens or '-'} tokens, ${budget.max_cost or '-'})",
+                        owner=model,
+                    )
+                if policy.fallback_model and fraction >= policy.degrade_at and self.model != policy.fallback_model:
+                    self.metadata["model"] = policy.fallback_model
+                    self.add_warning(
+                        f"{fraction:.0%} of the {scope} budget used; switching to model '{policy.fallback_model}'"
+                    )
+            model = model.parent
+
     def add_function_call_log(self, method: str, params: dict) -> FunctionCall:
         """Add a function call log to the execution model.
 
@@ -166,6 +268,7 @@ class ExecutionModel:
         function_call = FunctionCall(method=method, params=json.dumps(params))
 
         self.turns[-1].function_calls.append(function_call)
+        self.notify_run_changed()
 
         return function_call
 
@@ -176,6 +279,7 @@ class ExecutionModel:
             error (str): The error message for the import error.
         """
         self.import_errors.append(error)
+        self.changes.publish(ChangeKind.HEADER)
 
     def add_warning(self, warning: str):
         """Add a warning message to the execution model.
@@ -184,6 +288,7 @@ class ExecutionModel:
             warning (str): The warning message.
         """
         self.warnings.append(warning)
+        self.changes.publish(ChangeKind.HEADER)
 
     async def request_input(self, request: InputRequest) -> None:
         """Expose an input request to the UI and wait for the user's response.
@@ -208,8 +313,10 @@ class ExecutionModel:
             self.pending_permission = None
 
     async def dismiss_all_overlays(self):
-        self.pending_permission.event.clear()
-        self.pending_input.event.clear()
+        """Release any pending input or permission request without an answer."""
+        for pending in (self.pending_permission, self.pending_input):
+            if pending is not None:
+                pending.event.set()
 
         self.pending_permission = None
         self.pending_input = None
@@ -223,6 +330,7 @@ class ExecutionModel:
         """
         if self.current_run:
             self.current_run.add_log(param)
+            self.notify_run_changed()
 
 
 class BreakSignal(Exception):
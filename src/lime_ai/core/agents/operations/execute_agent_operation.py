@@ -1,6 +1,8 @@
 import asyncio
+import inspect
 import json
 import re
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -27,10 +29,13 @@ from lime_ai.core.agents.plugins.import_plugin import ImportPlugin
 from lime_ai.core.agents.services.memory import MemoryService
 from lime_ai.core.interfaces.agent_plugin import AgentPlugin
 from lime_ai.core.interfaces.prompt_integrity import PromptIntegrity
+from lime_ai.entities.budget import BudgetExceeded, BudgetPolicy
 from lime_ai.entities.context import Context
 from lime_ai.entities.prompt_integrity import TRACKED_PROMPT_EXTENSIONS, PromptUnverifiedPathError
 from lime_ai.entities.run import ContentBlock, ContentBlockType
 
+PREFIX_CACHE_ASSEMBLY = "prefix_cache"
+
 EQUALITY_OR_LOGICAL_OPERATORS = ["==", "!=", ">", "<", ">=", "<=", " and ", " or ", " not ", " in ", " is ", "not "]
 
 
@@ -56,6 +61,8 @@ class ExecuteAgentOperation:
         self.prompt_integrity = prompt_integrity
         self.allow_unverified = allow_unverified
         self._kv_iterators: dict[tuple[str, str], str] = {}
+        # > 0 while processing loop or conditional blocks, whose text may differ between runs.
+        self._variant_depth = 0
 
     def _preprocess_kv_for_loops(self, content: str) -> str:
         """Replace 'for key, value in iterable:' with 'for key in iterable:' and
@@ -87,6 +94,13 @@ class ExecuteAgentOperation:
         metadata, nodes = parser.parse(self._preprocess_kv_for_loops(mgx_file))
 
         self.execution_model.metadata = metadata
+        self.execution_model.budget = BudgetPolicy.from_metadata(metadata)
+        assembly = str(metadata.get("context_assembly", "")).strip('"').strip("'")
+        self.execution_model.context.prefix_cache = assembly == PREFIX_CACHE_ASSEMBLY
+
+        for plugin in self.plugins:
+            if hasattr(plugin, "prepare"):
+                await plugin.prepare(self.execution_model)
 
         # Initialize execution and create a turn/run so plugins can record outputs
         self.execution_model.start()
@@ -99,7 +113,12 @@ class ExecuteAgentOperation:
             start_time=datetime.now(),
         )
 
-        await self._process_nodes_async(nodes, self.execution_model.context)
+        budget_stop: BudgetExceeded | None = None
+        try:
+            await self._process_nodes_async(nodes, self.execution_model.context)
+        except BudgetExceeded as error:
+            budget_stop = error
+            self.execution_model.add_warning(str(error))
 
         # Save the memory at the end of execution
         await self.memory_service.save_memory(self.execution_model.memory)
@@ -111,6 +130,24 @@ class ExecuteAgentOperation:
             run.duration_ms = (run.end_time - run.start_time).total_seconds() * 1000
         self.execution_model.done = True
 
+        if budget_stop is not None and self.execution_model.parent is not None:
+            self._report_budget_stop(budget_stop, run.title)
+
+    def _report_budget_stop(self, error: BudgetExceeded, title: str):
+        """Surface the budget stop of a sub-execution to the top-level execution, which headers and results show.
+
+        Raises:
+            BudgetExceeded: The budget of an enclosing execution is spent, so it must stop as well.
+        """
+        if error.owner is not None and error.owner is not self.execution_model:
+            # The owning execution reports it once the exception reaches it.
+            raise error
+
+        root = self.execution_model.parent
+        while root.parent is not None:
+            root = root.parent
+        root.add_warning(f"{title}: {error}" if title else str(error))
+
     async def _process_nodes_async(self, nodes: list[Node], context: Context | None = None):
         """Process a list of AST nodes, executing actions based on node type.
 
@@ -127,7 +164,8 @@ class ExecuteAgentOperation:
                     context = self.execution_model.context
 
                 final_content = context.replace_variables_in_content(node.content)
-                context.add_to_context_window(final_content)
+                stable = self._variant_depth == 0 and final_content == node.content
+                context.add_to_context_window(final_content, stable=stable)
 
             elif isinstance(node, VariableNode):
                 value = context.get_variable_value(node.name)
@@ -136,13 +174,18 @@ class ExecuteAgentOperation:
 
             elif isinstance(node, IfNode):
                 condition_value = self._evaluate_condition(node.condition, context)
-                if self._is_truthy(condition_value):
-                    await self._process_nodes_async(node.true_block, context)
-                elif node.false_block:
-                    await self._process_nodes_async(node.false_block, context)
+                self._variant_depth += 1
+                try:
+                    if self._is_truthy(condition_value):
+                        await self._process_nodes_async(node.true_block, context)
+                    elif node.false_block:
+                        await self._process_nodes_async(node.false_block, context)
+                finally:
+                    self._variant_depth -= 1
 
             elif isinstance(node, MemoryNode):
                 await self._handle_memory_node_async(node.params)
+                self.execution_model.notify_run_changed()
 
             elif isinstance(node, BreakNode):
                 raise BreakSignal()
@@ -152,22 +195,32 @@ class ExecuteAgentOperation:
                 if items:
                     value_var = self._kv_iterators.get((node.iterator, node.iterable))
                     if value_var is not None and isinstance(items, dict):
-                        pairs = list(items.items())
+                        pairs = _iterate_pairs(list(items.items()))
+                    elif isinstance(items, Iterator | AsyncIterator):
+                        # Streamed @effect func results are consumed lazily, one item per iteration.
+                        pairs = _iterate_pairs(items, with_values=False)
                     else:
-                        pairs = [(item, None) for item in items]
-
-                    for key, val in pairs:
-                        context.add_to_state(node.iterator, key)
-                        if value_var is not None:
-                            context.add_to_state(value_var, val)
-                        try:
-                            await self._process_nodes_async(node.block, context)
-                        except BreakSignal:
-                            break
-                        finally:
-                            context.remove_from_state(node.iterator)
+                        pairs = _iterate_pairs(list(items), with_values=False)
+
+                    self._variant_depth += 1
+                    self.execution_model.loop_starts.append(len(self.execution_model.turns))
+                    try:
+                        async for key, val in pairs:
+                            context.add_to_state(node.iterator, key)
                             if value_var is not None:
-                                context.remove_from_state(value_var)
+                                context.add_to_state(value_var, val)
+                            try:
+                                await self._process_nodes_async(node.block, context)
+                            except BreakSignal:
+                                break
+                            finally:
+                                context.remove_from_state(node.iterator)
+                                if value_var is not None:
+                                    context.remove_from_state(value_var)
+                    finally:
+                        await pairs.aclose()
+                        self._variant_depth -= 1
+                        self.execution_model.loop_starts.pop()
 
             elif isinstance(node, StateNode):
                 variable = json.loads(node.initial_value)
@@ -213,7 +266,7 @@ class ExecuteAgentOperation:
                 scoped_context = Context(resolved_params)
                 await self._process_nodes_async(include_nodes, scoped_context)
 
-                context.add_to_context_window(scoped_context.window)
+                context.merge_context_window(scoped_context)
 
             elif isinstance(node, AllAwaitNode):
                 self.execution_model.current_run.content_blocks.append(
@@ -227,10 +280,13 @@ class ExecuteAgentOperation:
                     return_exceptions=True,
                 )
                 for result in results:
+                    if isinstance(result, BudgetExceeded):
+                        raise result
                     if isinstance(result, BaseException):
                         self.execution_model.current_run.content_blocks.append(
                             ContentBlock(type=ContentBlockType.LOGGING, text=f"[AwaitAll] Child failed: {result}")
                         )
+                self.execution_model.notify_run_changed()
 
             elif isinstance(node, EffectNode):
                 await self._execute_effect_async(node.raw_content)
@@ -261,6 +317,8 @@ class ExecuteAgentOperation:
                     params=operation,
                     execution_model=self.execution_model,
                 )
+                # Plugins append log blocks to the current run; let the UI pick them up.
+                self.execution_model.notify_run_changed()
                 break
 
     async def _handle_memory_node_async(self, params: str):
@@ -360,3 +418,20 @@ class ExecuteAgentOperation:
             )
 
         return include_path
+
+
+async def _iterate_pairs(items, with_values: bool = True) -> AsyncIterator[tuple]:
+    """Yield (item, value) pairs from a list, a sync iterator or an async iterator."""
+    try:
+        if isinstance(items, AsyncIterator):
+            async for item in items:
+                yield item, None
+        else:
+            for item in items:
+                yield item if with_values else (item, None)
+    finally:
+        close = getattr(items, "aclose", None) or getattr(items, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.operations.execute_agent_operation import ExecuteAgentOperation
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.entities.batch import BatchJob, BatchJobResult, BatchJobStatus, BatchSummary
+from lime_ai.entities.run import RunStatus
+
+
+class ExecuteBatchOperation:
+    """Runs many .mgx executions concurrently in one process.
+
+    Every job gets its own ExecutionModel, seeded with the job's inputs as
+    initial state, and its own ExecuteAgentOperation built by
+    `operation_factory`. The factory is expected to hand the operations shared
+    services (Copilot client, request scheduler, worker pool, caches), so jobs
+    reuse connections instead of paying the start-up cost each time. At most
+    `workers` jobs run at once.
+
+    Jobs cannot prompt anyone: a job that asks for input or a permission is
+    cancelled and reported as NEEDS_INPUT.
+
+    Examples
+    >>> batch = ExecuteBatchOperation(operation_factory=make_operation, workers=8)
+    >>> summary = await batch.execute_async([BatchJob(0, Path("agent.mgx"), {"topic": "x"})])
+    >>> summary.count(BatchJobStatus.COMPLETED)
+    1
+    """
+
+    def __init__(
+        self,
+        operation_factory: Callable[[ExecutionModel], ExecuteAgentOperation],
+        workers: int = 4,
+        run_archive: RunArchive | None = None,
+    ):
+        self.operation_factory = operation_factory
+        self.workers = max(workers, 1)
+        self.run_archive = run_archive
+        # Path -> (modification time, size, source); a long-lived server sees edited files.
+        self._sources: dict[Path, tuple[int, int, str]] = {}
+
+    async def execute_async(
+        self,
+        jobs: list[BatchJob],
+        on_result: Callable[[BatchJobResult], None] | None = None,
+    ) -> BatchSummary:
+        """Run `jobs` and return their results, in job order.
+
+        Args:
+            jobs (list[BatchJob]): The jobs to run.
+            on_result (Callable | None): Called with each result as soon as its job finishes.
+        """
+        started = perf_counter()
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def run(job: BatchJob) -> BatchJobResult:
+            async with semaphore:
+                result = await self.run_job(job)
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        results = await asyncio.gather(*(run(job) for job in jobs))
+        return BatchSummary(results=list(results), duration_ms=(perf_counter() - started) * 1000)
+
+    async def run_job(
+        self,
+        job: BatchJob,
+        on_model: Callable[[ExecutionModel], None] | None = None,
+        run_archive: RunArchive | None = None,
+    ) -> BatchJobResult:
+        """Run a single job now, outside of the `workers` limit.
+
+        Args:
+            job (BatchJob): The job to run.
+            on_model (Callable | None): Called with the job's ExecutionModel before it starts, e.g. to stream its events.
+                The model is marked done when the job ends, whatever its outcome.
+            run_archive (RunArchive | None): Spills this job's runs instead of the batch's archive.
+        """
+        started = perf_counter()
+        try:
+            source = self._read(job.file)
+        except OSError as error:
+            return BatchJobResult(job=job, status=BatchJobStatus.FAILED, error=str(error))
+
+        model = ExecutionModel()
+        model.run_archive = run_archive if run_archive is not None else self.run_archive
+        model.context.data.update(job.inputs)
+        if on_model is not None:
+            on_model(model)
+        operation = self.operation_factory(model)
+        task = asyncio.create_task(operation.execute_async(mgx_file=source, base_path=job.file.parent))
+        blocked = False
+
+        def on_change():
+            nonlocal blocked
+            if (model.pending_input is not None or model.pending_permission is not None) and not task.done():
+                blocked = True
+                task.cancel()
+
+        unsubscribe = model.changes.subscribe(on_change, every_change=True)
+        status, error = BatchJobStatus.COMPLETED, None
+        try:
+            await task
+        except asyncio.CancelledError:
+            if not blocked:
+                raise
+            status, error = BatchJobStatus.NEEDS_INPUT, "The agent asked for user input or a permission."
+        except Exception as exception:
+            status, error = BatchJobStatus.FAILED, str(exception) or type(exception).__name__
+        finally:
+            unsubscribe()
+            if not model.done:
+                model.done = True
+
+        return self._result(job, model, status, error, started)
+
+    def _read(self, file: Path) -> str:
+        # Matrix batches and servers run one file many times; read it again only when it changed.
+        stat = file.stat()
+        cached = self._sources.get(file)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            cached = (stat.st_mtime_ns, stat.st_size, file.read_text())
+            self._sources[file] = cached
+        return cached[2]
+
+    @staticmethod
+    def _result(
+        job: BatchJob,
+        model: ExecutionModel,
+        status: BatchJobStatus,
+        error: str | None,
+        started: float,
+    ) -> BatchJobResult:
+        runs = [turn.run for turn in model.turns_with_runs if turn.run.provider != "local"]
+        failed = next((run for run in runs if run.status == RunStatus.ERROR), None)
+        if status == BatchJobStatus.COMPLETED and failed is not None:
+            status = BatchJobStatus.FAILED
+            error = failed.errors[-1].message if failed.errors else f"Run '{failed.title}' failed."
+
+        tokens, cost = model.usage()
+        return BatchJobResult(
+            job=job,
+            status=status,
+            duration_ms=(perf_counter() - started) * 1000,
+            runs=len(runs),
+            tokens=tokens,
+            cost=cost,
+            error=error,
+            warnings=[*model.warnings, *model.import_errors],
+            results=[run.result for run in runs],
+            state=dict(model.context.data),
+        )
@@ -41,8 +41,19 @@ class _SubExecutionModel(ExecutionModel):
         super().__init__()
         self._exec_title = exec_title
         self._parent_model = parent_model
+        # Runs of the sub-execution are shown by the parent's UI, so publish on its feed.
+        self.changes = parent_model.changes
+        self.run_archive = parent_model.run_archive
         self._color_hex = ""  # resolved on first start_run, once position in parent is known
 
+    @property
+    def depth(self) -> int:
+        return self._parent_model.depth + 1
+
+    @property
+    def parent(self) -> ExecutionModel:
+        return self._parent_model
+
     async def request_input(self, request: InputRequest) -> None:
         """Request input from the parent model. Blocks until parent model lock is free.
 
@@ -1,6 +1,11 @@
+import ast
+import inspect
 import re
+from collections.abc import AsyncIterator
 
 from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.services.func_cache import FuncResultCache
+from lime_ai.core.agents.services.worker_pool import WorkerPool
 from lime_ai.core.interfaces.agent_plugin import AgentPlugin
 
 
@@ -9,8 +14,26 @@ class FuncPlugin(AgentPlugin):
 
     The plugin runs allowed Python functions in the agent's execution context and
     stores results back into the execution model state.
+
+    With a WorkerPool, sync functions run off the event loop and coroutine
+    functions are awaited; without one they are called inline.
+
+    Generator results (sync or async) are consumed into a list that is stored
+    in state up front and filled as items arrive. With a trailing `stream`
+    (`@effect func read_rows(path) => rows stream`) the generator itself is
+    stored instead, so a following `for row in rows:` consumes it lazily.
+
+    A leading `cached` memoizes the result by function and arguments
+    (`@effect func cached load_files(dir) => files`, or `cached ttl=600 ...` to
+    expire it), and `@effect func invalidate load_files` drops cached results.
+    Cached results are shared between calls, so treat them as read-only.
     """
 
+    def __init__(self, worker_pool: WorkerPool | None = None, cache: FuncResultCache | None = None):
+        super().__init__()
+        self.worker_pool = worker_pool
+        self.cache = cache if cache is not None else FuncResultCache()
+
     def is_match(self, token: str) -> bool:
         """Determine if the plugin matches the given token.
 
@@ -28,10 +51,26 @@ class FuncPlugin(AgentPlugin):
         """
         params = params.strip()
 
+        invalidate = re.match(r"^invalidate(?:\s+([\w\.]+))?$", params)
+        if invalidate:
+            self.cache.invalidate(invalidate.group(1))
+            return
+
+        cached = re.match(r"^cached(?:\s+ttl=(\d+(?:\.\d+)?))?\s+(.*)$", params)
+        cache_ttl = None
+        if cached:
+            cache_ttl = float(cached.group(1)) if cached.group(1) else None
+            params = cached.group(2)
+
         result = re.match(r"^(.*?)\s*=>\s*(.+)$", params)
 
         method_value = result.groups()[0]
         result_value = result.groups()[1] if len(result.groups()) > 1 else None
+        stream = False
+        if result_value:
+            stream_match = re.match(r"^(\w+)\s+stream$", result_value.strip())
+            if stream_match:
+                result_value, stream = stream_match.group(1), True
 
         match = re.search(r"([A-Za-z_][\w\.]*)\(\s*(.*?)\s*\)", method_value)
         func_param_str = match.groups()[1] if match and len(match.groups()) > 1 else None
@@ -47,12 +86,97 @@ class FuncPlugin(AgentPlugin):
         call = execution_model.add_function_call_log(method=method_value, params=all_params)
 
         try:
-            results = eval(method_value, execution_model.globals_dict, all_params)
+            call_node = _parse_call(method_value)
+            if call_node is None:
+                if cached:
+                    execution_model.add_warning(f"'{method_value}' is not a plain function call and is not cached")
+                results = await self._evaluate(method_value, execution_model.globals_dict, all_params)
+                cache_key = None
+            else:
+                fn, args, kwargs = _resolve_call(call_node, execution_model.globals_dict, all_params)
+                cache_key = self.cache.key_for(fn, args, kwargs) if cached and not stream else None
+                hit, results = self.cache.get(cache_key) if cache_key else (False, None)
+                if hit:
+                    cache_key = None
+                else:
+                    results = await self._call(fn, args, kwargs)
+
+            if _is_generator(results) and not stream:
+                items: list = []
+                if result_value:
+                    # Store the list first so the state shows items as they arrive.
+                    execution_model.context.set_variable(result_value, items)
+                async for item in self._iterate(results):
+                    items.append(item)
+                results = items
+
+            if cache_key:
+                self.cache.set(cache_key, results, ttl=cache_ttl)
         except Exception as e:
-            execution_model.import_errors.append(f"Error calling function '{method_value}': {str(e)}")
+            execution_model.add_import_error(f"Error calling function '{method_value}': {str(e)}")
             return
 
         call.result = results
 
         if result_value:
             execution_model.context.set_variable(result_value, results)
+
+    async def _iterate(self, generator) -> AsyncIterator:
+        if inspect.isasyncgen(generator):
+            async for item in generator:
+                yield item
+            return
+
+        if self.worker_pool is None:
+            for item in generator:
+                yield item
+            return
+
+        # Each step of a sync generator may block, so advance it on the worker pool.
+        done = object()
+        while (item := await self.worker_pool.run_in_thread(next, generator, done)) is not done:
+            yield item
+
+    async def _evaluate(self, method_value: str, globals_dict: dict, all_params: dict):
+        """Evaluate an expression that is not a plain call, on a worker thread when a pool is set."""
+        if self.worker_pool is None:
+            result = eval(method_value, globals_dict, all_params)
+        else:
+            result = await self.worker_pool.run_in_thread(eval, method_value, globals_dict, all_params)
+        return await result if inspect.isawaitable(result) else result
+
+    async def _call(self, fn, args: list, kwargs: dict):
+        if self.worker_pool is None:
+            result = fn(*args, **kwargs)
+            return await result if inspect.isawaitable(result) else result
+        # Only the call itself is shipped to the worker, so it can go to a process pool.
+        return await self.worker_pool.call(fn, *args, **kwargs)
+
+
+def _is_generator(value) -> bool:
+    return inspect.isgenerator(value) or inspect.isasyncgen(value)
+
+
+def _resolve_call(call: ast.Call, globals_dict: dict, all_params: dict) -> tuple:
+    """Evaluate the function and arguments of `call` (cheap) and return (fn, args, kwargs)."""
+
+    def resolve(node: ast.expr):
+        return eval(compile(ast.Expression(node), "<func>", "eval"), globals_dict, all_params)
+
+    fn = resolve(call.func)
+    args = [resolve(arg) for arg in call.args]
+    kwargs = {keyword.arg: resolve(keyword.value) for keyword in call.keywords}
+    return fn, args, kwargs
+
+
+def _parse_call(expression: str) -> ast.Call | None:
+    """Return the call node when `expression` is a single call without *args/**kwargs unpacking."""
+    try:
+        node = ast.parse(expression.strip(), mode="eval").body
+    except SyntaxError:
+        return None
+    if not isinstance(node, ast.Call):
+        return None
+    if any(isinstance(arg, ast.Starred) for arg in node.args) or any(k.arg is None for k in node.keywords):
+        return None
+    return node
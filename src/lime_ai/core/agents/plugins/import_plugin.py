@@ -3,21 +3,99 @@ import importlib
 import importlib.util
 import os
 import sys
+from dataclasses import dataclass, field
+from typing import Any
 
 from lime_ai.core.agents.models import ExecutionModel
 
 
+@dataclass
+class _ResolvedImport:
+    """The names an import statement binds, and the logs and errors resolving it produced.
+
+    `watched` maps the files and directories the resolution depends on to their modification
+    times: the working-directory modules it loaded or, for a failed lookup, the directories it
+    searched. A failed lookup also depends on `search_path`, the sys.path it searched.
+    """
+
+    bindings: dict[str, Any] = field(default_factory=dict)
+    # ("log" | "error", message), in the order they happened.
+    messages: list[tuple[str, str]] = field(default_factory=list)
+    # The dotted module names the statement imports.
+    modules: list[str] = field(default_factory=list)
+    watched: dict[str, int | None] = field(default_factory=dict)
+    search_path: tuple[str, ...] | None = None
+
+    def add_log(self, message: str):
+        self.messages.append(("log", message))
+
+    def add_import_error(self, error: str):
+        self.messages.append(("error", error))
+
+    @property
+    def failed(self) -> bool:
+        return any(kind == "error" for kind, _ in self.messages)
+
+    @property
+    def is_current(self) -> bool:
+        """Whether resolving the statement again would give the same result."""
+        if self.search_path is not None and self.search_path != tuple(sys.path):
+            return False
+        return all(_mtime(path) == mtime for path, mtime in self.watched.items())
+
+    def edited_files(self) -> list[str]:
+        """The watched module files that changed since the statement was resolved."""
+        return [path for path, mtime in self.watched.items() if path.endswith(".py") and _mtime(path) != mtime]
+
+    def watch(self):
+        """Record what the resolution depends on, once it is done."""
+        cwd = os.getcwd()
+        for name in self.modules:
+            parts = name.split(".")
+            for end in range(1, len(parts) + 1):
+                module = sys.modules.get(".".join(parts[:end]))
+                path = getattr(module, "__file__", None)
+                if path and path.startswith(cwd + os.sep):
+                    self.watched[path] = _mtime(path)
+                if self.failed:
+                    # Creating the package or module adds an entry to one of these directories.
+                    package_dir = os.path.join(cwd, *parts[:end])
+                    self.watched[package_dir] = _mtime(package_dir)
+
+        if self.failed:
+            # Installing a package adds an entry to a directory on the import path.
+            self.search_path = tuple(sys.path)
+            for entry in (cwd, *sys.path):
+                directory = entry or cwd
+                self.watched[directory] = _mtime(directory)
+
+    def apply(self, execution_model: ExecutionModel):
+        for kind, message in self.messages:
+            if kind == "log":
+                execution_model.add_log(message)
+            else:
+                execution_model.add_import_error(message)
+        execution_model.globals_dict.update(self.bindings)
+
+
 class ImportPlugin:
     """Handles import statements found in .mgx files.
 
     Validates and executes dynamic Python imports required by agent runs.
     """
 
+    # (import statement, working directory) -> resolution
+    _cache: dict[tuple[str, str], _ResolvedImport] = {}
+    # Path of each module loaded from the working directory -> its modification time when it was executed.
+    _loaded_files: dict[str, int] = {}
+
     @staticmethod
     def _load_package_from_cwd(top_level: str, fullname: str | None = None):
         """Load a package (and optional dotted submodule) from the current working directory.
 
-        Registers loaded modules in sys.modules. Raises ModuleNotFoundError if not found.
+        Registers loaded modules in sys.modules and reuses the ones already loaded from the same
+        files, so a package's module bodies run once per process unless a file is edited.
+        Raises ModuleNotFoundError if not found.
         """
         cwd = os.getcwd()
         pkg_dir = os.path.join(cwd, top_level)
@@ -26,12 +104,7 @@ class ImportPlugin:
             raise ModuleNotFoundError(f"Package {top_level!r} not found in cwd")
 
         # load top-level package
-        spec = importlib.util.spec_from_file_location(top_level, init_py)
-        if spec is None or spec.loader is None:
-            raise ModuleNotFoundError(f"Cannot create spec to load package {top_level!r} from cwd")
-        pkg = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(pkg)  # type: ignore
-        sys.modules[top_level] = pkg
+        pkg = ImportPlugin._load_module_file(top_level, init_py)
 
         # if fullname requests a submodule (e.g. top.sub.mod), walk and load pieces
         if fullname and fullname != top_level:
@@ -45,20 +118,10 @@ class ImportPlugin:
                 candidate_py = os.path.join(base_dir, part + ".py")
 
                 if os.path.isfile(candidate_init):
-                    spec = importlib.util.spec_from_file_location(cur_name, candidate_init)
-                    if spec is None or spec.loader is None:
-                        raise ModuleNotFoundError(f"Cannot create spec for {cur_name!r}")
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)  # type: ignore
-                    sys.modules[cur_name] = mod
+                    ImportPlugin._load_module_file(cur_name, candidate_init)
                     base_dir = candidate_pkg
                 elif os.path.isfile(candidate_py):
-                    spec = importlib.util.spec_from_file_location(cur_name, candidate_py)
-                    if spec is None or spec.loader is None:
-                        raise ModuleNotFoundError(f"Cannot create spec for {cur_name!r}")
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)  # type: ignore
-                    sys.modules[cur_name] = mod
+                    ImportPlugin._load_module_file(cur_name, candidate_py)
                     base_dir = os.path.dirname(candidate_py)
                 else:
                     raise ModuleNotFoundError(f"Submodule {cur_name!r} not found in cwd package")
@@ -67,6 +130,27 @@ class ImportPlugin:
 
         return pkg
 
+    @staticmethod
+    def _load_module_file(name: str, path: str):
+        """Execute the module at `path` as `name`, unless sys.modules already holds it from that file, unedited."""
+        mtime = os.stat(path).st_mtime_ns
+        loaded = sys.modules.get(name)
+        if (
+            loaded is not None
+            and getattr(loaded, "__file__", None) == path
+            and ImportPlugin._loaded_files.setdefault(path, mtime) == mtime
+        ):
+            return loaded
+
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise ModuleNotFoundError(f"Cannot create spec to load {name!r} from cwd")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)  # type: ignore
+        sys.modules[name] = module
+        ImportPlugin._loaded_files[path] = mtime
+        return module
+
     @staticmethod
     def _maybe_add_active_venv_sitepackages() -> bool:
         """If a virtualenv/conda prefix is active, add its site-packages to sys.path.
@@ -98,16 +182,54 @@ class ImportPlugin:
     def execute_import(import_stmt: str, execution_model: ExecutionModel) -> dict:
         """Execute an import statement and update the provided globals dictionary.
 
+        Resolutions are cached per statement and working directory, failures included, so an import
+        inside a loop or repeated by every `@effect exec` child is resolved only once. A cached
+        resolution is redone when what it depends on changes: a module it loaded from the working
+        directory was edited or, for a failed lookup, sys.path or a searched directory changed
+        (e.g. the package was installed or created).
+
         Args:
             import_stmt (str): The import statement to execute.
             execution_model (ExecutionModel): The execution model for the current agent run.
         """
+        key = (import_stmt, os.getcwd())
+        resolved = ImportPlugin._cache.get(key)
+        if resolved is None or not resolved.is_current:
+            if resolved is not None:
+                ImportPlugin._forget_modules(resolved.edited_files())
+            resolved = ImportPlugin._resolve(import_stmt)
+            resolved.watch()
+            ImportPlugin._cache[key] = resolved
+
+        resolved.apply(execution_model)
+        return execution_model.globals_dict
+
+    @staticmethod
+    def _forget_modules(paths: list[str]):
+        """Drop the modules loaded from `paths` from sys.modules, so importing them executes the edited files."""
+        if not paths:
+            return
+        for name, module in list(sys.modules.items()):
+            if getattr(module, "__file__", None) in paths:
+                del sys.modules[name]
+        for path in paths:
+            ImportPlugin._loaded_files.pop(path, None)
+
+    @staticmethod
+    def clear_cache():
+        """Forget resolved imports, e.g. after installing a package or creating one in the working directory."""
+        ImportPlugin._cache.clear()
+
+    @staticmethod
+    def _resolve(import_stmt: str) -> _ResolvedImport:
+        resolved = _ResolvedImport()
         tree = ast.parse(import_stmt)
 
         for node in tree.body:
             module = None
             if isinstance(node, ast.Import):
                 for alias in node.names:
+                    resolved.modules.append(alias.name)
                     try:
                         module = importlib.import_module(str(alias.name))
                     except ModuleNotFoundError:
@@ -123,10 +245,8 @@ class ImportPlugin:
                             except ModuleNotFoundError:
                                 module = None
                             except Exception as e:
-                                execution_model.add_log(
-                                    f"Error importing {alias.name} after adding venv site-packages: {e}"
-                                )
-                                execution_model.add_import_error(str(e))
+                                resolved.add_log(f"Error importing {alias.name} after adding venv site-packages: {e}")
+                                resolved.add_import_error(str(e))
                                 continue
 
                         if module is None:
@@ -135,27 +255,28 @@ class ImportPlugin:
                             try:
                                 module = ImportPlugin._load_package_from_cwd(top, alias.name)
                             except ModuleNotFoundError as e:
-                                execution_model.add_log(f"Module not found: {alias.name}")
-                                execution_model.add_import_error(str(e))
+                                resolved.add_log(f"Module not found: {alias.name}")
+                                resolved.add_import_error(str(e))
                                 continue
                             except Exception as e:
-                                execution_model.add_log(f"Error loading {alias.name} from cwd: {e}")
-                                execution_model.add_import_error(str(e))
+                                resolved.add_log(f"Error loading {alias.name} from cwd: {e}")
+                                resolved.add_import_error(str(e))
                                 continue
                     except Exception as e:
-                        execution_model.add_log(f"Error importing {alias.name}: {e}")
-                        execution_model.add_import_error(str(e))
+                        resolved.add_log(f"Error importing {alias.name}: {e}")
+                        resolved.add_import_error(str(e))
                         continue
 
                     name = alias.asname or alias.name
-                    execution_model.globals_dict[name] = module
+                    resolved.bindings[name] = module
 
             elif isinstance(node, ast.ImportFrom):
                 if not node.module:
-                    execution_model.add_log("Empty module name in ImportFrom")
-                    execution_model.add_import_error("Empty module name in ImportFrom")
+                    resolved.add_log("Empty module name in ImportFrom")
+                    resolved.add_import_error("Empty module name in ImportFrom")
                     continue
 
+                resolved.modules.append(node.module)
                 module = None
                 try:
                     module = importlib.import_module(str(node.module))
@@ -172,10 +293,8 @@ class ImportPlugin:
                         except ModuleNotFoundError:
                             module = None
                         except Exception as e:
-                            execution_model.add_log(
-                                f"Error importing {node.module} after adding venv site-packages: {e}"
-                            )
-                            execution_model.add_import_error(str(e))
+                            resolved.add_log(f"Error importing {node.module} after adding venv site-packages: {e}")
+                            resolved.add_import_error(str(e))
                             continue
 
                     if module is None:
@@ -184,31 +303,38 @@ class ImportPlugin:
                             ImportPlugin._load_package_from_cwd(top, node.module)
                             module = importlib.import_module(str(node.module))
                         except ModuleNotFoundError as e:
-                            execution_model.add_log(f"Module not found: {node.module}")
-                            execution_model.add_import_error(str(e))
+                            resolved.add_log(f"Module not found: {node.module}")
+                            resolved.add_import_error(str(e))
                             continue
                         except Exception as e:
-                            execution_model.add_log(f"Error importing {node.module}: {e}")
-                            execution_model.add_import_error(str(e))
+                            resolved.add_log(f"Error importing {node.module}: {e}")
+                            resolved.add_import_error(str(e))
                             continue
                 except Exception as e:
-                    execution_model.add_log(f"Error importing {node.module}: {e}")
-                    execution_model.add_import_error(str(e))
+                    resolved.add_log(f"Error importing {node.module}: {e}")
+                    resolved.add_import_error(str(e))
                     continue
 
                 for alias in node.names:
                     try:
                         obj = getattr(module, alias.name)
                         name = alias.asname or alias.name
-                        execution_model.globals_dict[name] = obj
+                        resolved.bindings[name] = obj
                     except AttributeError as e:
-                        execution_model.add_log(f"{alias.name} not found in {node.module}")
-                        execution_model.add_import_error(str(e))
+                        resolved.add_log(f"{alias.name} not found in {node.module}")
+                        resolved.add_import_error(str(e))
                     except Exception as e:
-                        execution_model.add_log(f"Error loading {alias.name} from {node.module}: {e}")
-                        execution_model.add_import_error(str(e))
+                        resolved.add_log(f"Error loading {alias.name} from {node.module}: {e}")
+                        resolved.add_import_error(str(e))
             else:
-                execution_model.add_log("Only import statements are allowed")
-                execution_model.add_import_error("Only import statements are allowed")
+                resolved.add_log("Only import statements are allowed")
+                resolved.add_import_error("Only import statements are allowed")
 
-        return execution_model.globals_dict
+        return resolved
+
+
+def _mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
@@ -1,6 +1,8 @@
 from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
 from lime_ai.core.interfaces.agent_plugin import AgentPlugin
 from lime_ai.core.interfaces.query_service import QueryService
+from lime_ai.entities.run import Run, RunError
 
 
 class RunAgentPlugin(AgentPlugin):
@@ -8,11 +10,19 @@ class RunAgentPlugin(AgentPlugin):
 
     Translates @effect run tokens into calls to the configured QueryService and
     integrates streaming responses back into the execution model.
+
+    `key=value` pairs after the token (e.g. `@effect run timeout=60 idle_timeout=15`)
+    are passed to the QueryService as that run's `options`.
+
+    When a RequestScheduler is given, every query waits for a slot first; the
+    run's token usage and whether it was rate-limited are reported back so the
+    scheduler can adapt.
     """
 
-    def __init__(self, agent_service: QueryService):
+    def __init__(self, agent_service: QueryService, scheduler: RequestScheduler | None = None):
         super().__init__()
         self.agent_service = agent_service
+        self.scheduler = scheduler
 
     def is_match(self, token: str) -> bool:
         """Determine if the plugin matches the given token.
@@ -22,6 +32,14 @@ class RunAgentPlugin(AgentPlugin):
         """
         return token == "run"
 
+    async def prepare(self, execution_model: ExecutionModel):
+        """Warm up the query service once the agent's front-matter is known.
+
+        Args:
+            execution_model (ExecutionModel): The execution model for the current agent run.
+        """
+        await self.agent_service.prewarm(execution_model=execution_model)
+
     async def handle(self, params: str, execution_model: ExecutionModel):
         """Handle a request for the plugin.
 
@@ -29,6 +47,46 @@ class RunAgentPlugin(AgentPlugin):
             params (str): The parameters for the request.
             execution_model (ExecutionModel): The execution model for the current agent run.
         """
-        await self.agent_service.execute_query(execution_model=execution_model)
+        execution_model.apply_budget()
+        # Passed along rather than stored on the model: AllAwait children share it and run concurrently.
+        options = self._parse_options(params, execution_model)
+        if self.scheduler is None:
+            await self.agent_service.execute_query(execution_model=execution_model, options=options)
+        else:
+            await self._execute_scheduled(execution_model, options)
 
         execution_model.start_turn()
+
+    @staticmethod
+    def _parse_options(params: str | None, execution_model: ExecutionModel) -> dict[str, str]:
+        options: dict[str, str] = {}
+        for part in (params or "").split():
+            name, sep, value = part.partition("=")
+            if not sep or not name or not value:
+                execution_model.add_warning(f"Ignoring invalid @effect run option '{part}', expected key=value")
+                continue
+            options[name] = value.strip('"').strip("'")
+        return options
+
+    async def _execute_scheduled(self, execution_model: ExecutionModel, options: dict[str, str]):
+        # Rough estimate (~4 characters per token) until the run reports real usage.
+        estimated_tokens = len(execution_model.context.window or "") // 4
+        previous_run = execution_model.current_run
+        async with self.scheduler.slot(priority=execution_model.depth, estimated_tokens=estimated_tokens) as ticket:
+            try:
+                await self.agent_service.execute_query(execution_model=execution_model, options=options)
+            except Exception:
+                ticket.throttled = self._rate_limited(execution_model.current_run, previous_run)
+                raise
+
+            run = execution_model.current_run
+            if run is not None and run is not previous_run:
+                ticket.tokens = run.tokens.total_tokens or None
+            ticket.throttled = self._rate_limited(run, previous_run)
+
+    @staticmethod
+    def _rate_limited(run: Run | None, previous_run: Run | None) -> bool:
+        """Whether the provider rate-limited `run`; other failures do not lower the scheduler's concurrency."""
+        if run is None or run is previous_run:
+            return False
+        return any(isinstance(error, RunError) and error.is_rate_limit for error in run.errors)
@@ -0,0 +1,173 @@
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from time import time
+from typing import Any
+
+from loguru import logger
+
+_MISSING = object()
+
+
+class FuncResultCache:
+    """Memoizes results of `@effect func cached ...` calls.
+
+    Entries are keyed by the function's qualified name, a hash of its source
+    (so editing the function invalidates its results) and a hash of the
+    pickled arguments. They live in an in-memory LRU and, when `directory` is
+    set, in pickle files that survive across runs.
+
+    Examples
+    >>> cache = FuncResultCache(max_size=128, ttl=3600)
+    >>> key = cache.key_for(sorted, ([3, 1, 2],), {})
+    >>> cache.set(key, [1, 2, 3])
+    >>> cache.get(key)
+    (True, [1, 2, 3])
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        directory: Path | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time,
+    ):
+        self.max_size = max_size
+        self.directory = directory
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float | None, str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key_for(self, fn: Callable, args: tuple, kwargs: dict) -> str | None:
+        """Build the cache key for calling `fn(*args, **kwargs)`, or None when the arguments cannot be hashed."""
+        try:
+            arguments = pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            logger.debug(f"Not caching {qualname(fn)}: arguments cannot be pickled ({error})")
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(qualname(fn).encode())
+        digest.update(_source_hash(fn).encode())
+        digest.update(arguments)
+        return f"{qualname(fn)}-{digest.hexdigest()}"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (True, value) for a live entry, (False, None) on a miss or an expired entry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is None:
+                return False, None
+            self._remember(key, entry)
+
+        expires_at, _, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            self._forget(key)
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        """Store `value` under `key`.
+
+        Args:
+            key (str): A key returned by key_for().
+            value (Any): The function result.
+            ttl (float | None): Seconds until the entry expires; defaults to the cache's `ttl`.
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = self._clock() + ttl if ttl else None
+        entry = (expires_at, key.rsplit("-", 1)[0], value)
+        self._remember(key, entry)
+        self._write(key, entry)
+
+    def invalidate(self, name: str | None = None) -> int:
+        """Drop cached results for the function `name` (its qualified name or its bare name), or everything.
+
+        Returns:
+            The number of in-memory and on-disk entries removed.
+        """
+        keys = {key for key in self._entries if _matches(key, name)}
+        if self.directory is not None and self.directory.is_dir():
+            keys.update(path.stem for path in self.directory.glob("*.pkl") if _matches(path.stem, name))
+
+        for key in keys:
+            self._forget(key)
+        return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    def _remember(self, key: str, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _forget(self, key: str):
+        self._entries.pop(key, None)
+        if self.directory is not None:
+            (self.directory / f"{key}.pkl").unlink(missing_ok=True)
+
+    def _read(self, key: str) -> tuple | None:
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.pkl"
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logger.warning(f"Discarding unreadable cache entry {path}: {error}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write(self, key: str, entry: tuple):
+        if self.directory is None:
+            return
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            logger.debug(f"Keeping {key} in memory only: result cannot be pickled ({error})")
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so a concurrent reader never sees a partial entry.
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_name, self.directory / f"{key}.pkl")
+
+
+def qualname(fn: Callable) -> str:
+    """The `module.qualname` of `fn`, used to group and invalidate its cached results."""
+    module = getattr(fn, "__module__", None) or ""
+    name = getattr(fn, "__qualname__", None) or getattr(fn, "__name__", None) or type(fn).__qualname__
+    return f"{module}.{name}".lstrip(".").replace("<", "").replace(">", "")
+
+
+def _source_hash(fn: Callable) -> str:
+    try:
+        source = inspect.getsource(fn)
+    except (OSError, TypeError):
+        code = getattr(fn, "__code__", None)
+        source = repr((code.co_code, code.co_consts)) if code is not None else ""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _matches(key: str, name: str | None) -> bool:
+    if name is None:
+        return True
+    function = key.rsplit("-", 1)[0]
+    return function == name or function.endswith(f".{name}")
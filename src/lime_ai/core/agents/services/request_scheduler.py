@@ -0,0 +1,167 @@
+import asyncio
+import heapq
+import itertools
+import math
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from time import monotonic
+
+TOKEN_WINDOW_SECONDS = 60.0
+
+
+@dataclass
+class RequestTicket:
+    """A granted request slot.
+
+    The caller fills in `tokens` and `throttled` once the request finished so
+    the scheduler can account for the real usage and adapt its concurrency.
+    """
+
+    priority: int
+    estimated_tokens: int
+    tokens: int | None = None
+    throttled: bool = False
+
+
+class RequestScheduler:
+    """Global gate in front of every LLM request.
+
+    - At most `limit` requests are in flight. The limit adapts with AIMD: it
+      grows by 1/limit for every request that completes cleanly, up to
+      `max_concurrency`, and halves whenever a request reports throttling.
+    - With `tokens_per_minute` set, requests wait until the tokens used in
+      the last minute (plus estimates for those in flight) leave room for them.
+    - Waiting requests are granted by priority, lowest value first, then in
+      arrival order; a parent run (priority 0) goes ahead of its sub-runs.
+
+    Examples
+    >>> scheduler = RequestScheduler(max_concurrency=2)
+    >>> async def ask():
+    ...     async with scheduler.slot(priority=0, estimated_tokens=100) as ticket:
+    ...         ticket.tokens = 120
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        tokens_per_minute: int = 0,
+        min_concurrency: int = 1,
+        clock: Callable[[], float] = monotonic,
+    ):
+        self.max_concurrency = max(max_concurrency, 1)
+        self.min_concurrency = max(min(min_concurrency, self.max_concurrency), 1)
+        self.tokens_per_minute = tokens_per_minute
+        self.limit: float = float(self.max_concurrency)
+        self.in_flight = 0
+        self._clock = clock
+        self._waiters: list[tuple[int, int, asyncio.Future, RequestTicket]] = []
+        self._sequence = itertools.count()
+        self._usage: deque[tuple[float, int]] = deque()
+        self._reserved_tokens = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len([w for w in self._waiters if not w[2].done()])
+
+    def tokens_in_window(self) -> int:
+        """Tokens used by requests that finished within the last minute."""
+        self._expire_usage()
+        return sum(tokens for _, tokens in self._usage)
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0, estimated_tokens: int = 0) -> AsyncIterator[RequestTicket]:
+        """Wait for a request slot and hold it for the duration of the block.
+
+        Args:
+            priority (int): Lower values are granted first.
+            estimated_tokens (int): Expected token usage, reserved against the per-minute budget.
+        """
+        ticket = await self._acquire(priority, estimated_tokens)
+        try:
+            yield ticket
+        finally:
+            self._release(ticket)
+
+    async def _acquire(self, priority: int, estimated_tokens: int) -> RequestTicket:
+        ticket = RequestTicket(priority=priority, estimated_tokens=max(estimated_tokens, 0))
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future, ticket))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted and cancelled in the same tick: hand the slot back.
+                self._release(ticket, record=False)
+            raise
+        return ticket
+
+    def _release(self, ticket: RequestTicket, record: bool = True):
+        self.in_flight -= 1
+        self._reserved_tokens -= ticket.estimated_tokens
+
+        if record:
+            tokens = ticket.tokens if ticket.tokens is not None else ticket.estimated_tokens
+            if tokens:
+                self._usage.append((self._clock(), tokens))
+            if ticket.throttled:
+                self.limit = max(self.limit / 2, float(self.min_concurrency))
+            else:
+                self.limit = min(self.limit + 1 / self.limit, float(self.max_concurrency))
+
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._waiters:
+            _, _, future, ticket = self._waiters[0]
+            if future.done():
+                # The waiter was cancelled while queued.
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= math.floor(self.limit):
+                return
+
+            wait = self._budget_wait(ticket.estimated_tokens)
+            if wait > 0:
+                self._schedule_dispatch(wait)
+                return
+
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            self._reserved_tokens += ticket.estimated_tokens
+            future.set_result(None)
+
+    def _budget_wait(self, estimated_tokens: int) -> float:
+        """Seconds until `estimated_tokens` fit in the per-minute budget; 0 when they fit now."""
+        if self.tokens_per_minute <= 0:
+            return 0.0
+
+        used = self.tokens_in_window() + self._reserved_tokens
+        if used + estimated_tokens <= self.tokens_per_minute or (used == 0 and self.in_flight == 0):
+            # An oversized request is still let through once the window is empty.
+            return 0.0
+        if not self._usage:
+            # Only in-flight reservations are using the budget; their release re-dispatches.
+            return math.inf
+
+        return max(self._usage[0][0] + TOKEN_WINDOW_SECONDS - self._clock(), 0.01)
+
+    def _schedule_dispatch(self, delay: float):
+        if math.isinf(delay) or (self._timer is not None and not self._timer.cancelled()):
+            return
+
+        def _fire():
+            self._timer = None
+            self._dispatch()
+
+        self._timer = asyncio.get_running_loop().call_later(delay, _fire)
+
+    def _expire_usage(self):
+        cutoff = self._clock() - TOKEN_WINDOW_SECONDS
+        while self._usage and self._usage[0][0] <= cutoff:
+            self._usage.popleft()
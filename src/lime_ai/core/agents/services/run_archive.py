@@ -0,0 +1,165 @@
+import pickle
+import tempfile
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from loguru import logger
+
+from lime_ai.entities.run import Run, RunStatus
+
+# The parts of a run that grow with its size; everything else (status, usage, result...) stays in memory.
+_SPILLED_FIELDS = ("prompt", "responses", "reasoning", "content_blocks", "tool_calls")
+
+
+@dataclass
+class ArchivedRun:
+    """Where the content of a spilled run lives in the journal."""
+
+    archive: "RunArchive"
+    offset: int
+    length: int
+    fingerprint: tuple
+
+    def restore(self, run: Run):
+        self.archive.restore(run)
+
+
+class RunArchive:
+    """Spills the content of finished runs to an on-disk journal.
+
+    Runs are tracked in the order they start. Once more than `keep` runs are
+    in memory, the oldest finished ones have their prompt, responses,
+    reasoning, content blocks and tool calls written to a compressed,
+    append-only journal and dropped; the Run itself stays as a summary
+    (status, title, usage, result). `restore()` (or `Run.ensure_content()`)
+    loads the content back, e.g. when the UI expands the run.
+
+    The journal is an anonymous temporary file, so it disappears with the
+    process even if it is not closed.
+
+    Examples
+    >>> archive = RunArchive(keep=20)
+    >>> archive.track(run)
+    >>> archive.spill()  # number of runs spilled
+    0
+    """
+
+    def __init__(self, keep: int = 20, directory: Path | None = None, compression: int = 1):
+        self.keep = keep
+        self.directory = directory
+        self.compression = compression
+        self._resident: OrderedDict[int, Run] = OrderedDict()
+        # Records of restored runs, reused when they are spilled again unchanged.
+        self._records: dict[int, ArchivedRun] = {}
+        self._journal: IO[bytes] | None = None
+        self._size = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.keep > 0
+
+    @property
+    def journal_size(self) -> int:
+        """Bytes written to the journal so far."""
+        return self._size
+
+    def track(self, run: Run):
+        """Start tracking a run, as the most recent one."""
+        if self.enabled:
+            self._resident[id(run)] = run
+            self._resident.move_to_end(id(run))
+
+    def untrack(self, run: Run):
+        """Stop tracking a run that was discarded, e.g. the losing branch of a hedged request."""
+        self._resident.pop(id(run), None)
+        self._records.pop(id(run), None)
+
+    def spill(self) -> int:
+        """Spill finished runs beyond the `keep` most recent ones.
+
+        Returns:
+            The number of runs spilled.
+        """
+        excess = len(self._resident) - self.keep
+        if not self.enabled or excess <= 0:
+            return 0
+
+        spilled = 0
+        for key, run in list(self._resident.items())[:excess]:
+            if run.status not in (RunStatus.COMPLETED, RunStatus.ERROR):
+                continue
+            try:
+                self._spill(run)
+            except Exception as error:
+                logger.warning(f"Keeping run '{run.title}' in memory: {error}")
+                continue
+            del self._resident[key]
+            spilled += 1
+        return spilled
+
+    def restore(self, run: Run) -> bool:
+        """Load the content of a spilled run back into it.
+
+        Returns:
+            True when the run was spilled and is now back in memory.
+        """
+        record = run.archived
+        if record is None or self._journal is None:
+            return False
+
+        self._journal.seek(record.offset)
+        content = pickle.loads(zlib.decompress(self._journal.read(record.length)))
+        for name in _SPILLED_FIELDS:
+            setattr(run, name, content[name])
+        run.tool_calls_by_id = {tool_call.tool_call_id: tool_call for tool_call in run.tool_calls}
+        run.archived = None
+
+        self._records[id(run)] = record
+        self.track(run)
+        return True
+
+    def close(self):
+        """Delete the journal. Spilled runs can no longer be restored."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _spill(self, run: Run):
+        fingerprint = _fingerprint(run)
+        record = self._records.pop(id(run), None)
+        if record is None or record.fingerprint != fingerprint:
+            content = {name: getattr(run, name) for name in _SPILLED_FIELDS}
+            data = zlib.compress(pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL), self.compression)
+            record = ArchivedRun(archive=self, offset=self._append(data), length=len(data), fingerprint=fingerprint)
+
+        run.prompt = None
+        run.responses = None
+        run.reasoning = None
+        run.content_blocks = []
+        run.tool_calls = []
+        run.tool_calls_by_id = {}
+        run.archived = record
+
+    def _append(self, data: bytes) -> int:
+        if self._journal is None:
+            if self.directory is not None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+            self._journal = tempfile.TemporaryFile(dir=self.directory, prefix="runs-", suffix=".journal")
+        offset = self._size
+        self._journal.seek(offset)
+        self._journal.write(data)
+        self._size += len(data)
+        return offset
+
+
+def _fingerprint(run: Run) -> tuple:
+    return (
+        len(run.prompt or ""),
+        len(run.content_blocks),
+        len(run.content_blocks[-1].buffer) if run.content_blocks else 0,
+        len(run.tool_calls),
+        run.tool_calls_completed,
+    )
@@ -0,0 +1,148 @@
+import asyncio
+import functools
+import inspect
+import pickle
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+WORKER_THREAD = "thread"
+WORKER_PROCESS = "process"
+WORKER_INLINE = "inline"
+
+
+class WorkerPool:
+    """Runs user functions (tools and @effect func calls) off the event loop.
+
+    - Coroutine functions are awaited on the loop.
+    - Sync functions run in a thread pool, or in a process pool when `mode` is
+      "process". Calls that cannot be pickled (lambdas, closures, modules
+      loaded from a path, arguments such as open files) and generator
+      functions fall back to the thread pool.
+    - "inline" calls sync functions directly on the loop, as before.
+
+    Streaming, parallel runs and the UI keep running while a blocking helper works.
+
+    Examples
+    >>> pool = WorkerPool(mode="thread", max_workers=4)
+    >>> async def main():
+    ...     return await pool.call(sum, [1, 2, 3])
+    """
+
+    def __init__(self, mode: str = WORKER_THREAD, max_workers: int | None = None):
+        if mode not in (WORKER_THREAD, WORKER_PROCESS, WORKER_INLINE):
+            raise ValueError(f"Unknown worker pool mode '{mode}', expected thread, process or inline")
+        self.mode = mode
+        self.max_workers = max_workers
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self._picklable: weakref.WeakKeyDictionary[Callable, bool] = weakref.WeakKeyDictionary()
+
+    async def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call `fn` without blocking the event loop and return its result.
+
+        Args:
+            fn (Callable): A sync or coroutine function.
+            *args: Positional arguments for `fn`.
+            **kwargs: Keyword arguments for `fn`.
+        """
+        if inspect.iscoroutinefunction(fn) or self.mode == WORKER_INLINE:
+            result = fn(*args, **kwargs)
+        else:
+            executor, job = self._submission(fn, functools.partial(fn, *args, **kwargs))
+            result = await asyncio.get_running_loop().run_in_executor(executor, job)
+
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def run_in_thread(self, fn: Callable[..., Any], *args) -> Any:
+        """Call sync `fn` on a worker thread regardless of `mode`.
+
+        For work tied to objects that cannot cross a process boundary, such as
+        advancing a generator or evaluating against the agent's globals.
+        """
+        if self.mode == WORKER_INLINE:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._thread_executor(), functools.partial(fn, *args))
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return a coroutine function with the signature of `fn` that runs it through call().
+
+        Wrappers are memoized on the function itself, so caches keyed by handler identity keep
+        hitting and a wrapper lives exactly as long as its function.
+        """
+        if inspect.iscoroutinefunction(fn) or self.mode == WORKER_INLINE:
+            return fn
+
+        cached = getattr(fn, "__lime_wrapped__", None)
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await self.call(fn, *args, **kwargs)
+
+        try:
+            fn.__lime_wrapped__ = (self, wrapper)
+        except (AttributeError, TypeError):
+            # Builtins and bound methods take no attributes; skip memoization.
+            pass
+        return wrapper
+
+    def shutdown(self):
+        """Stop the worker threads and processes. Running calls are allowed to finish."""
+        for executor in (self._threads, self._processes):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._threads = None
+        self._processes = None
+
+    def _submission(self, fn: Callable, job: functools.partial) -> tuple[Executor, Callable[[], Any]]:
+        """The executor to run `job` on, and the callable to hand it.
+
+        In process mode the job is pickled here, once; the worker receives the bytes. A job that
+        cannot be pickled runs on a thread instead.
+        """
+        # Generators cannot be sent back from a worker process, so generator functions stay on threads.
+        if self.mode == WORKER_PROCESS and not inspect.isgeneratorfunction(fn) and self._is_picklable(fn):
+            try:
+                payload = pickle.dumps(job, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                return self._thread_executor(), job
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes, functools.partial(_call_pickled, payload)
+        return self._thread_executor(), job
+
+    def _thread_executor(self) -> Executor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="lime-worker")
+        return self._threads
+
+    def _is_picklable(self, fn: Callable) -> bool:
+        try:
+            return self._picklable[fn]
+        except (KeyError, TypeError):
+            pass
+
+        picklable = _can_pickle(fn)
+        try:
+            self._picklable[fn] = picklable
+        except TypeError:
+            pass
+        return picklable
+
+
+def _call_pickled(payload: bytes) -> Any:
+    """Run a job pickled by WorkerPool._submission, in a worker process."""
+    return pickle.loads(payload)()
+
+
+def _can_pickle(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
@@ -10,13 +10,22 @@ class QueryService(ABC):
     """
 
     @abstractmethod
-    async def execute_query(self, execution_model: ExecutionModel) -> str:
+    async def execute_query(self, execution_model: ExecutionModel, options: dict[str, str] | None = None) -> str:
         """Execute the agent with the given context.
 
         Args:
             execution_model (ExecutionModel): The execution model for the current agent run.
+            options (dict[str, str] | None): The `key=value` options of this `@effect run` (e.g. timeout).
         """
 
+    async def prewarm(self, execution_model: ExecutionModel):
+        """Prepare resources for the next query ahead of time. Optional; does nothing by default.
+
+        Args:
+            execution_model (ExecutionModel): The execution model for the current agent run.
+        """
+        return None
+
     @abstractmethod
     async def clear_session(self):
         """Clear any session or context data associated with the query service."""
@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+
+class BatchJobStatus(Enum):
+    COMPLETED = "completed"
+    FAILED = "failed"
+    # The job asked for user input or a permission; batches cannot answer, so it was stopped.
+    NEEDS_INPUT = "needs_input"
+
+
+@dataclass
+class BatchJob:
+    """One execution of a batch: an .mgx file and the state it starts with."""
+
+    index: int
+    file: Path
+    inputs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return f"{self.index:04d}-{self.file.stem}"
+
+
+@dataclass
+class BatchJobResult:
+    """Outcome of one batch job."""
+
+    job: BatchJob
+    status: BatchJobStatus
+    duration_ms: float = 0.0
+    runs: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+    error: str | None = None
+    warnings: list[str] = field(default_factory=list)
+    # The result of each agent run, in order.
+    results: list[str | None] = field(default_factory=list)
+    state: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job": self.job.name,
+            "file": str(self.job.file),
+            "inputs": self.job.inputs,
+            "status": self.status.value,
+            "duration_ms": round(self.duration_ms, 1),
+            "runs": self.runs,
+            "tokens": self.tokens,
+            "cost": self.cost,
+            "error": self.error,
+            "warnings": self.warnings,
+            "results": self.results,
+            "state": self.state,
+        }
+
+    @classmethod
+    def from_dict(cls, job: BatchJob, data: dict[str, Any]) -> "BatchJobResult":
+        """Rebuild a result of `job` written by to_dict(), e.g. by a worker process."""
+        return cls(
+            job=job,
+            status=BatchJobStatus(data["status"]),
+            duration_ms=data.get("duration_ms", 0.0),
+            runs=data.get("runs", 0),
+            tokens=data.get("tokens", 0),
+            cost=data.get("cost", 0.0),
+            error=data.get("error"),
+            warnings=data.get("warnings", []),
+            results=data.get("results", []),
+            state=data.get("state", {}),
+        )
+
+
+@dataclass
+class BatchSummary:
+    """Aggregate of a batch's job results."""
+
+    results: list[BatchJobResult] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+    def count(self, status: BatchJobStatus) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def succeeded(self) -> bool:
+        return all(result.status == BatchJobStatus.COMPLETED for result in self.results)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "jobs": len(self.results),
+            **{status.value: self.count(status) for status in BatchJobStatus},
+            "duration_ms": round(self.duration_ms, 1),
+            "tokens": sum(result.tokens for result in self.results),
+            "cost": sum(result.cost for result in self.results),
+            "failures": [
+                {"job": result.job.name, "status": result.status.value, "error": result.error}
+                for result in self.results
+                if result.status != BatchJobStatus.COMPLETED
+            ],
+        }
@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class Budget:
+    """Token and cost limits for one scope (an execution, a single run or a loop).
+
+    A limit of None is not enforced.
+    """
+
+    max_tokens: int | None = None
+    max_cost: float | None = None
+
+    @property
+    def is_set(self) -> bool:
+        return self.max_tokens is not None or self.max_cost is not None
+
+    def usage_fraction(self, tokens: int, cost: float) -> float:
+        """The largest share of any limit that `tokens`/`cost` use up; 0 when no limit is set."""
+        fractions = [0.0]
+        if self.max_tokens is not None:
+            fractions.append(tokens / self.max_tokens if self.max_tokens > 0 else float("inf"))
+        if self.max_cost is not None:
+            fractions.append(cost / self.max_cost if self.max_cost > 0 else float("inf"))
+        return max(fractions)
+
+
+@dataclass
+class BudgetPolicy:
+    """Budgets declared in an agent's front-matter.
+
+    - `max_tokens` / `max_cost`: the whole execution, including its sub-executions.
+    - `max_run_tokens` / `max_run_cost`: a single `@effect run`.
+    - `max_loop_tokens` / `max_loop_cost`: all runs of one `for` loop.
+    - `fallback_model`: when set, runs switch to this model once `budget_degrade_at`
+      (default 0.8) of a budget is used; the agent stops when a budget is exceeded.
+
+    Examples
+    >>> policy = BudgetPolicy.from_metadata({"max_cost": '"2.5"', "fallback_model": "gpt-5-mini"})
+    >>> policy.execution.max_cost, policy.fallback_model
+    (2.5, 'gpt-5-mini')
+    """
+
+    execution: Budget = field(default_factory=Budget)
+    run: Budget = field(default_factory=Budget)
+    loop: Budget = field(default_factory=Budget)
+    fallback_model: str | None = None
+    degrade_at: float = 0.8
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, Any]) -> "BudgetPolicy":
+        """Build the policy from front-matter values, which arrive as (possibly quoted) strings.
+
+        Raises:
+            ValueError: A budget value is not a number.
+        """
+        return cls(
+            execution=Budget(_number(metadata, "max_tokens", int), _number(metadata, "max_cost", float)),
+            run=Budget(_number(metadata, "max_run_tokens", int), _number(metadata, "max_run_cost", float)),
+            loop=Budget(_number(metadata, "max_loop_tokens", int), _number(metadata, "max_loop_cost", float)),
+            fallback_model=_unquote(metadata.get("fallback_model")) or None,
+            degrade_at=_number(metadata, "budget_degrade_at", float) or 0.8,
+        )
+
+
+class BudgetExceeded(Exception):
+    """Raised before an LLM run when a budget is spent, to stop the agent cleanly.
+
+    Args:
+        message (str): Which budget was exceeded, and by how much.
+        owner (Any): The execution whose budget is spent; a budget of a parent execution stops its sub-executions too.
+    """
+
+    def __init__(self, message: str, owner: Any = None):
+        super().__init__(message)
+        self.owner = owner
+
+
+def _unquote(value: Any) -> str:
+    return str(value).strip().strip('"').strip("'") if value is not None else ""
+
+
+def _number(metadata: dict[str, Any], key: str, kind: type):
+    raw = _unquote(metadata.get(key))
+    if not raw:
+        return None
+    try:
+        return kind(float(raw)) if kind is int else kind(raw)
+    except ValueError as error:
+        raise ValueError(f"Invalid front-matter value for '{key}': {raw!r} is not a number") from error
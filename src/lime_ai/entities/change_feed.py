@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+
+class ChangeKind(Enum):
+    """What changed in an execution, so subscribers refresh only the affected parts."""
+
+    RUN_ADDED = "run_added"
+    RUN_UPDATED = "run_updated"
+    HEADER = "header"
+    OVERLAY = "overlay"
+    DONE = "done"
+
+
+@dataclass
+class ChangeSet:
+    """Changes accumulated since the last drain()."""
+
+    kinds: set[ChangeKind] = field(default_factory=set)
+    runs: dict[int, Any] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.kinds)
+
+
+class ChangeFeed:
+    """Coalescing change notifications published by an execution and read by the UI.
+
+    Publishing only records what changed. Subscribers are called once when the
+    first change arrives after a drain(), not once per change, so a burst of
+    streamed deltas wakes the UI once; the UI then drains the accumulated set
+    when it renders its next frame.
+
+    Examples
+    >>> feed = ChangeFeed()
+    >>> wakes = []
+    >>> unsubscribe = feed.subscribe(lambda: wakes.append(1))
+    >>> feed.publish(ChangeKind.RUN_UPDATED); feed.publish(ChangeKind.HEADER)
+    >>> len(wakes), sorted(k.value for k in feed.drain().kinds)
+    (1, ['header', 'run_updated'])
+    """
+
+    def __init__(self):
+        self._pending = ChangeSet()
+        self._subscribers: list[Callable[[], None]] = []
+        self._watchers: list[Callable[[], None]] = []
+
+    def subscribe(self, callback: Callable[[], None], every_change: bool = False) -> Callable[[], None]:
+        """Call `callback` whenever changes become pending. Returns a function that unsubscribes.
+
+        Args:
+            callback (Callable): Called without arguments.
+            every_change (bool): Call it on every publish instead, for observers that watch the
+                execution without draining the feed.
+        """
+        callbacks = self._watchers if every_change else self._subscribers
+        callbacks.append(callback)
+        return lambda: callbacks.remove(callback) if callback in callbacks else None
+
+    def publish(self, kind: ChangeKind, run: Any = None):
+        """Record a change.
+
+        Args:
+            kind (ChangeKind): What changed.
+            run (Run | None): The run that changed, for RUN_ADDED and RUN_UPDATED.
+        """
+        wake = not self._pending
+        self._pending.kinds.add(kind)
+        if run is not None:
+            self._pending.runs[id(run)] = run
+        if wake:
+            for callback in list(self._subscribers):
+                callback()
+        for callback in list(self._watchers):
+            callback()
+
+    def drain(self) -> ChangeSet:
+        """Return and clear the pending changes."""
+        pending, self._pending = self._pending, ChangeSet()
+        return pending
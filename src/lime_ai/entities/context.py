@@ -17,7 +17,8 @@ class Context:
 
     Public API
     - __init__(initial_data: dict[str, Any] | None = None) -> None: Initialize context with optional data.
-    - add_to_context_window(content: str) -> None: Append content to the context window.
+    - add_to_context_window(content: str, stable: bool = False) -> None: Append content to the context window.
+    - merge_context_window(other: Context) -> None: Append another context's window, keeping its fragments.
     - get_variable_value(name: str) -> Any: Retrieve variable values supporting dotted notation, slicing and range().
     - set_variable(name: str, value: Any) -> None: Set a variable in state.
     - add_tool(tool: Tool) -> None: Register a tool for agent use.
@@ -32,20 +33,67 @@ class Context:
 
     Notes
     - Docstring focuses on external behavior; internal implementation details are omitted.
+    - The window is kept as fragments flagged stable (identical on every run,
+      e.g. static instructions) or variant. With `prefix_cache` enabled the
+      stable fragments are placed first, so consecutive prompts share the
+      longest possible prefix and hit the model's prompt cache.
     """
 
     def __init__(self, initial_data: dict[str, Any] | None = None):
         self.data = initial_data or {}
-        self.window = ""
         self.tools: list[Tool] = []
+        self._prefix_cache = False
+        self._fragments: list[tuple[str, bool]] = []
+        self._window: str | None = ""
+
+    @property
+    def prefix_cache(self) -> bool:
+        """Whether stable fragments are moved to the front of the window."""
+        return self._prefix_cache
+
+    @prefix_cache.setter
+    def prefix_cache(self, value: bool):
+        self._prefix_cache = value
+        self._window = None
+
+    @property
+    def window(self) -> str:
+        """The text sent to the LLM, assembled from the window fragments."""
+        if self._window is None:
+            if self.prefix_cache:
+                ordered = [c for c, stable in self._fragments if stable] + [
+                    c for c, stable in self._fragments if not stable
+                ]
+            else:
+                ordered = [c for c, _ in self._fragments]
+            self._window = "".join(ordered)
+        return self._window
+
+    @window.setter
+    def window(self, value: str):
+        self._fragments = [(value, False)] if value else []
+        self._window = value
 
-    def add_to_context_window(self, content: str):
+    def add_to_context_window(self, content: str, stable: bool = False):
         """Add content to the agent's context.
 
         Args:
             content (str): The content to add to the context.
+            stable (bool): True when the content does not depend on state, so it may be pinned at the front.
+        """
+        if not content:
+            return
+        self._fragments.append((content, stable))
+        self._window = None
+
+    def merge_context_window(self, other: "Context"):
+        """Append the window of another context (e.g. an include's scoped context), keeping its fragment flags.
+
+        Args:
+            other (Context): The context whose window to append.
         """
-        self.window += content
+        self._fragments.extend(other._fragments)
+        self._window = None
 
     def get_variable_value(self, name: str) -> Any:
         """Get a variable value from context, supporting dotted notation, range, and indexing.
@@ -189,7 +237,8 @@ class Context:
 
     def clear_context(self):
         """Clear the agent's context."""
-        self.window = ""
+        self._fragments = []
+        self._window = ""
 
     def replace_variables_in_content(self, content: str) -> str:
         pattern = r"\$\{([a-zA-Z_][\w\.]*)\}"
@@ -3,6 +3,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from lime_ai.entities.text_buffer import TextBuffer
+
+# RunError.error_type of a request the provider rejected for exceeding its rate limit.
+RATE_LIMIT_ERROR_TYPE = "rate_limit"
+
 
 class ContentBlockType(Enum):
     """Enumeration of content block types used in run outputs.
@@ -21,20 +26,41 @@ class ContentBlockType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(init=False)
 class ContentBlock:
     """Represents a single block of content produced during a run.
 
     Attributes:
         type: The ContentBlockType of this block.
-        text: The textual content of this block.
+        text: The textual content of this block, backed by `buffer`.
         ref: An optional reference string (e.g. tool name, function name) associated with this block.
     """
 
     """A single block of content generated during a run, with a type and optional reference."""
     type: ContentBlockType
-    text: str = ""
-    ref: str | None = None
+    buffer: TextBuffer
+    ref: str | None
+
+    def __init__(self, type: ContentBlockType, text: str = "", ref: str | None = None):
+        self.type = type
+        self.buffer = TextBuffer(text)
+        self.ref = ref
+
+    @property
+    def text(self) -> str:
+        return self.buffer.text
+
+    @text.setter
+    def text(self, value: str):
+        self.buffer = TextBuffer(value)
+
+    def append(self, delta: str):
+        """Append streamed text to this block.
+
+        Args:
+            delta (str): The text chunk to append.
+        """
+        self.buffer.append(delta)
 
 
 class RunStatus(Enum):
@@ -69,6 +95,20 @@ class TokenUsage:
     def total_tokens(self) -> int:
         return self.input_tokens + self.output_tokens
 
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Share of prompt tokens served from the prompt cache, or None before any input was reported.
+
+        Providers differ on whether `input_tokens` already includes cached
+        tokens; when cached tokens exceed it they are treated as additional.
+        """
+        prompt_tokens = self.input_tokens
+        if self.cache_read_tokens > prompt_tokens:
+            prompt_tokens += self.cache_read_tokens
+        if prompt_tokens <= 0:
+            return None
+        return self.cache_read_tokens / prompt_tokens
+
     def accumulate(self, other: "TokenUsage"):
         self.input_tokens += other.input_tokens
         self.output_tokens += other.output_tokens
@@ -127,6 +167,10 @@ class RunError:
     stack: str | None = None
     error_type: str | None = None
 
+    @property
+    def is_rate_limit(self) -> bool:
+        return self.error_type == RATE_LIMIT_ERROR_TYPE
+
 
 @dataclass
 class RunContext:
@@ -166,12 +210,18 @@ class Run:
 
     # Content
     prompt: str | None = None
-    responses: list[str] | None = None
-    reasoning: list[str] | None = None
+    responses: list[TextBuffer] | None = None
+    reasoning: list[TextBuffer] | None = None
     content_blocks: list[ContentBlock] = field(default_factory=list)
 
-    # Tool execution
+    # Tool execution (tool_calls keeps start order; the index and counters are maintained by
+    # start_tool_call/complete_tool_call so lookups and UI refreshes are O(1) per event)
     tool_calls: list[ToolCall] = field(default_factory=list)
+    tool_calls_by_id: dict[str, ToolCall] = field(default_factory=dict, repr=False)
+    tool_calls_started: int = 0
+    tool_calls_completed: int = 0
+    tool_calls_failed: int = 0
+    tool_calls_duration_ms: float = 0.0
 
     # Code impact
     code_changes: CodeChanges | None = None
@@ -199,6 +249,97 @@ class Run:
     # DEBUG
     event_name: RunEventEnum | None = None
 
+    # Set while the content of this finished run is spilled to disk (see RunArchive)
+    archived: Any = field(default=None, repr=False)
+
+    def __post_init__(self):
+        for tool_call in self.tool_calls:
+            self._index_tool_call(tool_call)
+
+    def start_tool_call(self, tool_call: ToolCall) -> ToolCall:
+        """Record a tool call that has started executing.
+
+        Args:
+            tool_call (ToolCall): The tool call to record.
+        """
+        self.tool_calls.append(tool_call)
+        self._index_tool_call(tool_call)
+        return tool_call
+
+    def complete_tool_call(
+        self,
+        tool_call_id: str,
+        result: str | None,
+        success: bool | None,
+        duration_ms: float | None,
+    ) -> ToolCall | None:
+        """Record the outcome of a previously started tool call.
+
+        Args:
+            tool_call_id (str): The id of the tool call that completed.
+            result (str | None): The tool's result content.
+            success (bool | None): Whether the tool call succeeded.
+            duration_ms (float | None): How long the tool call took.
+
+        Returns:
+            The updated ToolCall, or None if no call with that id was started in this run.
+        """
+        tool_call = self.tool_calls_by_id.get(tool_call_id)
+        if tool_call is None:
+            return None
+
+        was_complete = tool_call.success is not None
+        tool_call.result = result
+        tool_call.success = success
+        tool_call.duration_ms = duration_ms
+
+        if not was_complete and success is not None:
+            self.tool_calls_completed += 1
+            if not success:
+                self.tool_calls_failed += 1
+            self.tool_calls_duration_ms += duration_ms or 0.0
+
+        return tool_call
+
+    def get_tool_call(self, tool_call_id: str | None) -> ToolCall | None:
+        """Look up a tool call by id."""
+        return self.tool_calls_by_id.get(tool_call_id) if tool_call_id is not None else None
+
+    def _index_tool_call(self, tool_call: ToolCall):
+        self.tool_calls_by_id[tool_call.tool_call_id] = tool_call
+        self.tool_calls_started += 1
+        if tool_call.success is not None:
+            self.tool_calls_completed += 1
+            if not tool_call.success:
+                self.tool_calls_failed += 1
+            self.tool_calls_duration_ms += tool_call.duration_ms or 0.0
+
+    def clear_output(self) -> None:
+        """Drop the content and tool calls streamed so far, e.g. before the run is attempted again.
+
+        Usage and errors are kept: the failed attempt still cost tokens, and its error explains the retry.
+        """
+        self.responses = None
+        self.reasoning = None
+        self.content_blocks = []
+        self.tool_calls = []
+        self.tool_calls_by_id = {}
+        self.tool_calls_started = 0
+        self.tool_calls_completed = 0
+        self.tool_calls_failed = 0
+        self.tool_calls_duration_ms = 0.0
+        self.result = None
+
+    @property
+    def has_side_effects(self) -> bool:
+        """Whether the run called a tool or asked the user something, which must not happen twice."""
+        return self.tool_calls_started > 0 or any(block.type == ContentBlockType.INPUT for block in self.content_blocks)
+
+    def ensure_content(self) -> None:
+        """Load the prompt, responses, content blocks and tool calls back if they were spilled to disk."""
+        if self.archived is not None:
+            self.archived.restore(self)
+
     def on_expanded(self) -> None:
         self.is_user_toggled = True
         self.is_expanded = not self.is_expanded
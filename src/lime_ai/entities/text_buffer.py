@@ -0,0 +1,87 @@
+class TextBuffer:
+    """Append-only text built from streamed chunks.
+
+    Appending is O(1); the joined text is built lazily and cached until the
+    next append, so a stream of n characters costs O(n) instead of the O(n^2)
+    of repeated string concatenation. `tail()` lets readers fetch only the
+    text added since an offset they already consumed.
+
+    Examples
+    >>> buf = TextBuffer("Hel")
+    >>> buf.append("lo")
+    >>> buf.text, len(buf), buf.tail(3)
+    ('Hello', 5, 'lo')
+    """
+
+    __slots__ = ("_chunks", "_length", "_joined")
+
+    def __init__(self, text: str = ""):
+        self._chunks: list[str] = [text] if text else []
+        self._length = len(text)
+        self._joined: str | None = text
+
+    def append(self, chunk: str):
+        """Append a chunk of text.
+
+        Args:
+            chunk (str): The text to append. Empty chunks are ignored.
+        """
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        self._joined = None
+
+    @property
+    def text(self) -> str:
+        """The full text. Joined once per batch of appends and cached."""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+            # Collapse into a single chunk so the next join only copies new text once.
+            self._chunks = [self._joined]
+        return self._joined
+
+    def tail(self, start: int) -> str:
+        """Return the text from character offset `start` to the end without joining the whole buffer.
+
+        Args:
+            start (int): Offset of the first character to return. Negative values count from the end.
+        """
+        if start < 0:
+            start = max(self._length + start, 0)
+        if start >= self._length:
+            return ""
+        if self._joined is not None:
+            return self._joined[start:]
+
+        # Walk back from the newest chunk until the requested offset is covered.
+        pieces: list[str] = []
+        offset = self._length
+        for chunk in reversed(self._chunks):
+            offset -= len(chunk)
+            if offset <= start:
+                pieces.append(chunk[start - offset :])
+                break
+            pieces.append(chunk)
+        return "".join(reversed(pieces))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"TextBuffer({self.text!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TextBuffer):
+            return self._length == other._length and self.text == other.text
+        if isinstance(other, str):
+            return self._length == len(other) and self.text == other
+        return NotImplemented
+
+    __hash__ = None  # mutable
@@ -1,23 +1,34 @@
 from wireup import AsyncContainer
 
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.core.agents.services.worker_pool import WorkerPool
 from lime_ai.libs.copilot.client import GithubCopilotClient
 
 
 async def startup(container: AsyncContainer):
-    """Initialize and connect the Copilot client.
+    """Start connecting the Copilot client in the background.
+
+    The connection is awaited at the first @effect run, so file checks, prompt
+    verification and parsing are not blocked on spawning the Copilot CLI.
 
     Args:
         container (AsyncContainer): The dependency injection container to retrieve the CopilotClient instance.
     """
     client = await container.get(GithubCopilotClient)
-    await client.connect()
+    client.start_connecting()
 
 
 async def shutdown(container: AsyncContainer):
-    """Disconnect the Copilot client.
+    """Disconnect the Copilot client, stop the worker pool and delete the run journal.
 
     Args:
         container (AsyncContainer): The dependency injection container to retrieve the CopilotClient instance.
     """
     client = await container.get(GithubCopilotClient)
     await client.disconnect()
+
+    worker_pool = await container.get(WorkerPool)
+    worker_pool.shutdown()
+
+    run_archive = await container.get(RunArchive)
+    run_archive.close()
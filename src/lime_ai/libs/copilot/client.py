@@ -1,36 +1,72 @@
+import asyncio
+from contextlib import suppress
+
 from copilot import CopilotClient, CopilotSession, SessionConfig
 from wireup import injectable
 
+from lime_ai.app.config import AppConfig
+from lime_ai.libs.copilot.session_pool import CopilotSessionPool
+
 
 @injectable
 class GithubCopilotClient:
     """Wrapper around the GitHub Copilot SDK client used by the adapter.
 
     Provides convenience methods for opening sessions, sending events, and
-    translating SDK errors into the project's error types.
+    translating SDK errors into the project's error types. Sessions are owned
+    by `sessions`, a pool keyed by model, system message and tool set.
+
+    The connection is made by a background task (`start_connecting`) that is
+    awaited lazily by `ensure_connected`, so spawning the Copilot CLI overlaps
+    with whatever the caller does next instead of blocking startup.
     """
 
-    def __init__(self):
+    def __init__(self, app_config: AppConfig | None = None):
+        app_config = app_config or AppConfig()
         self.con: CopilotClient | None = None
-        self.session: CopilotSession | None = None
+        self._connect_task: asyncio.Task | None = None
+        self.sessions = CopilotSessionPool(
+            max_size=app_config.session_pool_max_size,
+            idle_timeout=app_config.session_idle_timeout,
+        )
 
     async def connect(self):
         self.con = CopilotClient()
         await self.con.start()
 
+    def start_connecting(self) -> asyncio.Task:
+        """Schedule connect() as a background task, if it is not already scheduled.
+
+        The task only runs once the event loop next yields, so callers that fail
+        before awaiting anything never spawn the Copilot CLI process.
+        """
+        if self._connect_task is None:
+            self._connect_task = asyncio.create_task(self.connect())
+        return self._connect_task
+
+    async def ensure_connected(self):
+        """Wait for the background connection, starting it first if needed.
+
+        Raises:
+            Exception: Whatever connect() raised; the failure is re-raised on every call.
+        """
+        await self.start_connecting()
+
     async def disconnect(self):
+        if self._connect_task is not None:
+            # No-op when the task already finished; prevents a spawn when it never ran.
+            self._connect_task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await self._connect_task
+
+        await self.sessions.clear()
         if self.con:
             await self.con.force_stop()
 
-    async def create_session(self, session_config: SessionConfig):
-        if not self.con:
-            raise RuntimeError("Copilot client is not connected")
-
-        self.session = await self.con.create_session(session_config)
+    async def create_session(self, session_config: SessionConfig) -> CopilotSession:
+        await self.ensure_connected()
 
-    async def destroy_current_session(self):
-        if not self.con:
-            raise RuntimeError("Copilot client is not connected")
+        return await self.con.create_session(session_config)
 
-        await self.session.destroy()
-        self.session = None
+    async def destroy_sessions(self):
+        await self.sessions.clear()
@@ -1,6 +1,9 @@
+import asyncio
+from contextlib import suppress
 from datetime import UTC, datetime
+from time import monotonic
 
-from copilot import MessageOptions, SessionConfig, define_tool
+from copilot import MessageOptions, SessionConfig
 from copilot.generated.session_events import SessionEventType
 from copilot.types import (
     InfiniteSessionConfig,
@@ -13,7 +16,8 @@ from copilot.types import (
 from wireup import injectable
 
 from lime_ai.app.config import AppConfig
-from lime_ai.core.agents.models import ExecutionModel, InputRequest, PermissionPrompt
+from lime_ai.core.agents.models import ExecutionModel, InputRequest, PermissionPrompt, Turn
+from lime_ai.core.agents.services.worker_pool import WorkerPool
 from lime_ai.core.interfaces.logger import LoggerService
 from lime_ai.core.interfaces.query_service import QueryService
 from lime_ai.entities.run import (
@@ -21,6 +25,7 @@ from lime_ai.entities.run import (
     ContentBlock,
     ContentBlockType,
     ModelUsage,
+    Run,
     RunContext,
     RunError,
     RunEventEnum,
@@ -29,11 +34,22 @@ from lime_ai.entities.run import (
     TokenUsage,
     ToolCall,
 )
+from lime_ai.entities.text_buffer import TextBuffer
 from lime_ai.libs.copilot.client import GithubCopilotClient
-from lime_ai.libs.copilot.tools.get_variable_from_state import create_get_variable_tool
+from lime_ai.libs.copilot.retry import (
+    ERROR_RATE_LIMIT,
+    ERROR_TIMEOUT,
+    LatencyTracker,
+    RetryPolicy,
+    classify_error,
+    classify_session_error,
+)
+from lime_ai.libs.copilot.session_pool import PooledSession, SessionKey
+from lime_ai.libs.copilot.tools.get_variable_from_state import create_get_variable_tool, create_list_variables_tool
 from lime_ai.libs.copilot.tools.set_variable_in_state import (
     create_set_variable_tool,
 )
+from lime_ai.libs.copilot.tools.tool_cache import ToolDefinitionCache
 
 SYSTEM_PROMPT = """# Role
 You are an autonomous coding agent with explicit access to two extra tools for shared state:
@@ -51,8 +67,12 @@ If you must store structured data, store it as JSON under a clear name.
 - Do not prompt the user for missing values; act autonomously using available tools.
 
 Tool call format (follow this pattern when requesting a tool):
-- Read: CALL_TOOL: get_variable with arguments { "name": "<variable_name>" }
+- Read: CALL_TOOL: get_variable with arguments { "variable": "<variable_name>" }
+- Read several: CALL_TOOL: get_variable with arguments { "variables": ["<a>", "<b>"] }
+- Read part of a large value: CALL_TOOL: get_variable with arguments { "variable": "<name>", "path": "$.items[*].id", "offset": 0, "limit": 50 }
+- List variables with their sizes: CALL_TOOL: list_variables with arguments {}
 - Write: CALL_TOOL: set_variable with arguments { "name": "<variable_name>", "value": <value> }
+- Write several: CALL_TOOL: set_variable with arguments { "values": { "<a>": <value>, "<b>": <value> } }
 
 Behavior after actions:
 - Summarize the action taken and any state changes (variable names and values) in the assistant message
@@ -60,11 +80,15 @@ so the run log is clear.
 - Use temporary names like `temp_<short_desc>` if you need ephemeral storage.
 
 Examples:
-- To read build status: CALL_TOOL: get_variable { "name": "build_status" }
+- To read build status: CALL_TOOL: get_variable { "variable": "build_status" }
 - To record an error: CALL_TOOL: set_variable { "name": "latest_error", "value": "stacktrace..." }
 
 Always follow these rules for each run so the shared state remains accurate and consistent."""
 
+DEFAULT_MODEL = "gpt-5-mini"
+
+_INTERNAL_TOOLS = {"get_variable", "set_variable", "list_variables"}
+
 SESSION_EVENT_TYPE_MAP: dict[SessionEventType, RunEventEnum] = {
     SessionEventType.SESSION_IDLE: RunEventEnum.THINKING,
     SessionEventType.SESSION_START: RunEventEnum.RUNNING,
@@ -88,53 +112,111 @@ class CopilotQuery(QueryService):
         copilot_client: GithubCopilotClient,
         app_config: AppConfig | None = None,
         logger: LoggerService | None = None,
+        worker_pool: WorkerPool | None = None,
     ):
         self.client = copilot_client
         # Allow omission in tests; default to a basic AppConfig when not provided.
         self.app_config = app_config or AppConfig()
         self.logger_service = logger
+        self.tool_cache = ToolDefinitionCache()
+        self.worker_pool = worker_pool or WorkerPool()
+        self.retry_policy = RetryPolicy.from_config(self.app_config)
+        self.latencies = LatencyTracker()
 
-    async def execute_query(self, execution_model: ExecutionModel) -> str:
+    async def execute_query(self, execution_model: ExecutionModel, options: dict[str, str] | None = None) -> str:
         """Execute a query using the Copilot client.
 
+        Failed attempts are retried according to `retry_policy`, unless the
+        attempt already called a tool or asked the user something: starting
+        over would repeat those side effects. When
+        `hedge_percentile` is configured, an attempt that runs longer than that
+        percentile of recent runs is raced against a second one on another
+        session, and the first to finish is kept.
+
         Args:
             execution_model (ExecutionModel): The execution model for the current agent run.
+            options (dict[str, str] | None): The `@effect run` options of this run (timeout, idle_timeout).
         """
-        if not self.client.con:
-            raise Exception("Copilot client is not connected")
+        options = options or {}
+        await self.client.ensure_connected()
 
-        async def on_user_input_request(request: UserInputRequest, properties: dict[str, str]) -> UserInputResponse:
-            """Handle a user input request from the Copilot session.
+        extra_tools, tool_signatures = self._build_user_tools(execution_model)
+        key = self._session_key(execution_model, tool_signatures)
 
-            This method is called when the agent uses the get-variable tool to request a variable that has not been set yet.
-            The prompt argument contains the message from the agent describing what information it needs.
+        if self.logger_service:
+            self.logger_service.print(
+                f"[Run started]\n"
+                f" model={execution_model.model}"
+                f" prompt={execution_model.context.window},\n"
+                f" state=f{execution_model.context.data}\n"
+                f" tools={['set_variable', 'get_variable', 'list_variables'] + [t.name for t in extra_tools]}"
+            )
 
-            Args:
-                request (UserInputRequest): The user input request from the Copilot session, containing the prompt.
-                properties (dict[str, str]): Additional properties related to the request.
-            """
-            request = InputRequest(prompt=request["question"])
-            await execution_model.request_input(request)
-            user_input = request.response or ""
+        self._start_run(execution_model)
+        # Taken before any await: under AllAwait, sibling runs start turns on the same model meanwhile.
+        turn = execution_model.current_turn
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._attempt(key, extra_tools, execution_model, turn, options)
+            except Exception as error:
+                # The failed attempt's run; a hedge that failed after calling a tool replaces the primary's.
+                run = turn.run
+                error_kind = classify_error(error)
+                if run.has_side_effects and self.logger_service:
+                    self.logger_service.print(f"[Run not retried] error={error_kind} the attempt had side effects")
+                if run.has_side_effects or not self.retry_policy.should_retry(attempt, error_kind):
+                    if error_kind != ERROR_TIMEOUT:
+                        # Recorded so callers (e.g. the request scheduler) can tell why the run failed.
+                        run.errors.append(RunError(message=str(error), code=error_kind, error_type=error_kind))
+                        raise
+                    return await self._fail_with_timeout(execution_model, run)
+
+                delay = self.retry_policy.delay(attempt)
+                # The next attempt starts over on a new session; keep only its output.
+                run.clear_output()
+                run.errors.append(
+                    RunError(
+                        message=f"Attempt {attempt} failed ({error}); retrying in {delay:.1f}s",
+                        code=error_kind,
+                        error_type=error_kind,
+                    )
+                )
+                if self.logger_service:
+                    self.logger_service.print(f"[Run retry] attempt={attempt} error={error_kind} delay={delay:.1f}s")
+                await asyncio.sleep(delay)
 
-            return UserInputResponse(answer=user_input, wasFreeform=True)
+    async def prewarm(self, execution_model: ExecutionModel):
+        """Start creating a session for the execution model's current configuration in the background.
 
-        _INTERNAL_TOOLS = {"get_variable", "set_variable"}
+        This is also the point where the Copilot CLI is first spawned: the agent
+        file has been read, verified and parsed, so a failing agent never pays for it.
 
-        async def on_permission_request(request, properties):
-            if self.app_config.ignore_permissions:
-                return {"kind": "approved"}
-            if request.get("toolName") in _INTERNAL_TOOLS:
-                return {"kind": "approved"}
-            prompt = PermissionPrompt(kind=request.get("kind", "unknown"), details=dict(request))
-            await execution_model.request_permission(prompt)
-            if prompt.approved:
-                return {"kind": "approved"}
-            return {"kind": "denied-interactively-by-user"}
+        Args:
+            execution_model (ExecutionModel): The execution model whose next run should find a warm session.
+        """
+        extra_tools, tool_signatures = self._build_user_tools(execution_model)
+        key = self._session_key(execution_model, tool_signatures)
+        await self.client.sessions.prewarm(
+            key, lambda entry: self._create_session(entry, extra_tools), owner=execution_model
+        )
+
+        # Yield once so the connect task spawns the CLI now and it boots while local nodes are processed.
+        await asyncio.sleep(0)
+
+    def _build_user_tools(self, execution_model: ExecutionModel) -> tuple[list[Tool], list[str]]:
+        """Convert the context's Tool descriptors into Copilot SDK Tool objects.
 
-        # Convert any internal Tool descriptors into Copilot SDK Tool objects.
-        # We'll build a list of extra tools and pass them into the session.
+        Compiled tools are served from `tool_cache`, so repeated runs exposing the
+        same functions do not regenerate their JSON schemas. Sync handlers are
+        wrapped to run on `worker_pool` instead of the event loop.
+
+        Returns:
+            The SDK tools and one signature string per tool, used to key the session pool.
+        """
         extra_tools: list[Tool] = []
+        signatures: list[str] = []
         if execution_model.context.tools:
             for tool in execution_model.context.tools:
                 name = tool.name
@@ -153,84 +235,267 @@ class CopilotQuery(QueryService):
                             "Invalid tool parameter type: (Did you forget to import this type?)" + params[0].type
                         )
 
-                    tool = define_tool(
-                        name=name,
-                        description=description or "",
-                        params_type=params_type,
-                        handler=funct,
+                    extra_tools.append(
+                        self.tool_cache.get(name, description or "", self.worker_pool.wrap(funct), params_type)
+                    )
+                    signatures.append(
+                        f"{name}|{description or ''}|{_qualified_name(params_type)}|{_qualified_name(funct)}"
                     )
 
-                    extra_tools.append(tool)
-
-        get_var_tool = await create_get_variable_tool(execution_model=execution_model)
-        set_var_tool = await create_set_variable_tool(execution_model=execution_model)
+        return extra_tools, signatures
 
-        # Build tool list for the session (set and get variable tools first)
-        session_tools = [set_var_tool, get_var_tool] + extra_tools
+    def _system_message(self) -> SystemMessageAppendConfig | SystemMessageReplaceConfig:
+        if self.app_config.use_existing_system_prompt:
+            return SystemMessageAppendConfig(content=SYSTEM_PROMPT)
+        return SystemMessageReplaceConfig(
+            mode="replace",
+            content=self.app_config.system_prompt + SYSTEM_PROMPT,
+        )
 
+    def _session_key(self, execution_model: ExecutionModel, tool_signatures: list[str]) -> SessionKey:
         model_value = execution_model.model
         if isinstance(model_value, str):
             # Strip surrounding quotes if parser preserved them in front-matter
             model_value = model_value.strip('"').strip("'")
 
-        system_message = SystemMessageAppendConfig(content=SYSTEM_PROMPT)
-        if not self.app_config.use_existing_system_prompt:
-            system_message = SystemMessageReplaceConfig(
-                mode="replace",
-                content=self.app_config.system_prompt + SYSTEM_PROMPT,
-            )
+        system_message = self._system_message()
+        return SessionKey(
+            model=model_value or DEFAULT_MODEL,
+            system_message=f"{system_message.get('mode', 'append')}:{system_message.get('content', '')}",
+            tools_signature=SessionKey.hash_tools(tool_signatures),
+        )
 
-        session_attr = getattr(self.client, "session", None)
-        if not session_attr:
-            try:
-                session_config = SessionConfig(
-                    system_message=system_message,
-                    model=model_value or "gpt-5-mini",
-                    streaming=True,
-                    on_user_input_request=on_user_input_request,
-                    on_permission_request=on_permission_request,
-                    infinite_sessions=InfiniteSessionConfig(
-                        enabled=True,
-                    ),
-                    tools=session_tools,
-                )
-            except TypeError:
-                # Fallback for test doubles that accept a simpler signature
-                session_config = SessionConfig(
-                    system_message=SystemMessageAppendConfig(content=SYSTEM_PROMPT),
-                    model=model_value or "gpt-5-mini",
-                    streaming=True,
-                    tools=session_tools,
-                )
-            # Prefer client.create_session when available, otherwise fall back to client.con.create_session
-            if hasattr(self.client, "create_session"):
-                await self.client.create_session(session_config)
-            elif hasattr(self.client, "con") and hasattr(self.client.con, "create_session"):
-                session = await self.client.con.create_session(session_config)
-                self.client.session = session
-            else:
-                raise RuntimeError("Copilot client does not support session creation")
+    async def _create_session(self, pooled: PooledSession, extra_tools: list[Tool]):
+        """Create the Copilot session backing a pool entry.
 
-        if self.logger_service:
-            self.logger_service.print(
-                f"[Run started]\n"
-                f" model={execution_model.model}"
-                f" prompt={execution_model.context.window},\n"
-                f" state=f{execution_model.context.data}\n tools={[tool.name for tool in session_tools]}"
+        Handlers and state tools resolve the execution model through `pooled`,
+        so the session serves whichever execution currently holds the lease.
+        """
+
+        async def on_user_input_request(request: UserInputRequest, properties: dict[str, str]) -> UserInputResponse:
+            """Handle a user input request from the Copilot session.
+
+            This method is called when the agent uses the get-variable tool to request a variable that has not been set yet.
+            The prompt argument contains the message from the agent describing what information it needs.
+
+            Args:
+                request (UserInputRequest): The user input request from the Copilot session, containing the prompt.
+                properties (dict[str, str]): Additional properties related to the request.
+            """
+            request = InputRequest(prompt=request["question"])
+            await pooled.execution_model.request_input(request)
+            user_input = request.response or ""
+
+            return UserInputResponse(answer=user_input, wasFreeform=True)
+
+        async def on_permission_request(request, properties):
+            if self.app_config.ignore_permissions:
+                return {"kind": "approved"}
+            if request.get("toolName") in _INTERNAL_TOOLS:
+                return {"kind": "approved"}
+            prompt = PermissionPrompt(kind=request.get("kind", "unknown"), details=dict(request))
+            await pooled.execution_model.request_permission(prompt)
+            if prompt.approved:
+                return {"kind": "approved"}
+            return {"kind": "denied-interactively-by-user"}
+
+        get_var_tool = await create_get_variable_tool(lambda: pooled.execution_model)
+        set_var_tool = await create_set_variable_tool(lambda: pooled.execution_model)
+        list_vars_tool = await create_list_variables_tool(lambda: pooled.execution_model)
+
+        # Build tool list for the session (state tools first)
+        session_tools = [set_var_tool, get_var_tool, list_vars_tool] + extra_tools
+
+        try:
+            session_config = SessionConfig(
+                system_message=self._system_message(),
+                model=pooled.key.model,
+                streaming=True,
+                on_user_input_request=on_user_input_request,
+                on_permission_request=on_permission_request,
+                infinite_sessions=InfiniteSessionConfig(
+                    enabled=True,
+                ),
+                tools=session_tools,
+            )
+        except TypeError:
+            # Fallback for test doubles that accept a simpler signature
+            session_config = SessionConfig(
+                system_message=SystemMessageAppendConfig(content=SYSTEM_PROMPT),
+                model=pooled.key.model,
+                streaming=True,
+                tools=session_tools,
             )
 
-        run = execution_model.start_run(
+        # Prefer client.create_session when available, otherwise fall back to client.con.create_session
+        if hasattr(self.client, "create_session"):
+            return await self.client.create_session(session_config)
+        elif hasattr(self.client, "con") and hasattr(self.client.con, "create_session"):
+            return await self.client.con.create_session(session_config)
+        raise RuntimeError("Copilot client does not support session creation")
+
+    @staticmethod
+    def _start_run(execution_model: ExecutionModel) -> Run:
+        return execution_model.start_run(
             prompt=execution_model.context.window,
             provider="copilot",
             status=RunStatus.RUNNING,
             start_time=datetime.now(UTC),
         )
 
+    async def _attempt(
+        self,
+        key: SessionKey,
+        extra_tools: list[Tool],
+        execution_model: ExecutionModel,
+        turn: Turn,
+        options: dict[str, str],
+    ):
+        """Run one attempt on `turn.run`, hedging it with a second session if it exceeds the latency threshold.
+
+        Both branches act on the same execution model, so at most one of them may have side effects: the
+        hedge only starts while the primary has not called a tool, and as soon as either branch calls a
+        tool (or asks the user something) the other one is cancelled. When the attempt fails, `turn.run`
+        is the run of the branch whose error is raised.
+        """
+        run = turn.run
+        primary = asyncio.create_task(self._run_leased(key, extra_tools, execution_model, run, options))
+        hedge_after = self.latencies.percentile(self.app_config.hedge_percentile)
+        if not self.app_config.hedge_percentile or hedge_after is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        if done or run.has_side_effects:
+            return await primary
+
+        # Stream the hedge into its own run and keep showing the primary until one of them wins. start_run
+        # puts the new run on the latest turn, which under AllAwait may be a sibling's.
+        latest = execution_model.current_turn
+        latest_run = latest.run
+        hedge_run = self._start_run(execution_model)
+        latest.run = latest_run
+        turn.run = run
+        hedge = asyncio.create_task(self._run_leased(key, extra_tools, execution_model, hedge_run, options))
+        if self.logger_service:
+            self.logger_service.print(f"[Run hedged] after={hedge_after:.1f}s")
+
+        runs = {primary: run, hedge: hedge_run}
+        committed = asyncio.Event()
+
+        def on_change():
+            if run.has_side_effects or hedge_run.has_side_effects:
+                committed.set()
+
+        unsubscribe = execution_model.changes.subscribe(on_change, every_change=True)
+        commit = asyncio.create_task(committed.wait())
+        # The branch whose error is raised if neither succeeds.
+        kept = primary
+        winner = None
+        pending = {primary, hedge}
+        watching = {commit}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending | watching, return_when=asyncio.FIRST_COMPLETED)
+                for task in done & pending:
+                    pending.discard(task)
+                    if task.exception() is None:
+                        winner = task
+                        return task.result()
+                if commit in done:
+                    watching = set()
+                    if len(pending) > 1:
+                        kept = hedge if hedge_run.has_side_effects and not run.has_side_effects else primary
+                        pending = {kept}
+                        (hedge if kept is primary else primary).cancel()
+            return kept.result()
+        finally:
+            unsubscribe()
+            commit.cancel()
+            for task in runs:
+                if not task.done():
+                    task.cancel()
+            for task in runs:
+                with suppress(asyncio.CancelledError, Exception):
+                    await task
+            shown = runs[winner if winner is not None else kept]
+            turn.run = shown
+            if execution_model.run_archive is not None:
+                execution_model.run_archive.untrack(hedge_run if shown is run else run)
+
+    async def _run_leased(
+        self,
+        key: SessionKey,
+        extra_tools: list[Tool],
+        execution_model: ExecutionModel,
+        run: Run,
+        options: dict[str, str],
+    ):
+        """Lease a session for `key`, run the query in it and return the session to the pool.
+
+        A session whose run failed or was cancelled may still be busy, so it is
+        aborted and discarded instead of being returned.
+        """
+        pooled = await self.client.sessions.acquire(
+            key, lambda entry: self._create_session(entry, extra_tools), owner=execution_model
+        )
+        pooled.execution_model = execution_model
+        started = monotonic()
+        try:
+            result = await self._run_in_session(pooled.session, execution_model, run, options)
+        except BaseException:
+            with suppress(Exception):
+                await pooled.session.abort()
+            await self.client.sessions.discard(pooled)
+            raise
+
+        self.latencies.record(monotonic() - started)
+        await self.client.sessions.release(pooled)
+        return result
+
+    async def _fail_with_timeout(self, execution_model: ExecutionModel, run: Run) -> str:
+        run.status = RunStatus.ERROR
+        run.end_time = datetime.now(UTC)
+        execution_model.notify_run_changed(run)
+        await execution_model.dismiss_all_overlays()
+
+        if self.logger_service:
+            self.logger_service.print(f"[Run error] shutdown_reason={ShutdownReason.TIMEOUT}")
+
+        return ""
+
+    def _timeouts(self, execution_model: ExecutionModel, options: dict[str, str]) -> tuple[float, float]:
+        """Resolve the (total, idle) timeouts in seconds for the next run.
+
+        `@effect run timeout=.. idle_timeout=..` options win over the front-matter
+        keys of the same name, which win over AppConfig. An idle timeout of 0
+        disables stall detection.
+        """
+        timeout = self.app_config.run_timeout
+        idle_timeout = self.app_config.run_idle_timeout
+        for source in (execution_model.metadata, options):
+            timeout = _seconds(source.get("timeout"), timeout)
+            idle_timeout = _seconds(source.get("idle_timeout"), idle_timeout)
+        return timeout, idle_timeout
+
+    async def _run_in_session(self, session, execution_model: ExecutionModel, run: Run, options: dict[str, str]) -> str:
+        """Send the context window to `session` and record the streamed events on `run`.
+
+        Raises:
+            TimeoutError: The session did not become idle in time, or sent no events
+                for the idle timeout while no tool call or user prompt was pending.
+            Exception: The session reported an error or the connection failed.
+        """
+        timeout, idle_timeout = self._timeouts(execution_model, options)
+        last_event_at = monotonic()
+        budget_abort: asyncio.Future | None = None
+
         def handle_event(event):
+            nonlocal last_event_at, budget_abort
+            last_event_at = monotonic()
             d = event.data
 
             if event.type in SESSION_EVENT_TYPE_MAP:
-                execution_model.current_run.event_name = SESSION_EVENT_TYPE_MAP[event.type]
+                run.event_name = SESSION_EVENT_TYPE_MAP[event.type]
 
             if event.type == SessionEventType.SESSION_START:
                 run.session_id = d.session_id
@@ -246,31 +511,33 @@ class CopilotQuery(QueryService):
                     run.context.repository_name = d.repository.name
 
             elif event.type == SessionEventType.ASSISTANT_REASONING_DELTA:
+                # The delta goes to the turn's buffer and to the current content block; both keep a reference
+                # to the same string, so the chunk itself is not copied.
                 if run.reasoning is None:
-                    run.reasoning = [""]
-                run.reasoning[-1] += d.delta_content
+                    run.reasoning = [TextBuffer()]
+                run.reasoning[-1].append(d.delta_content)
                 if not run.content_blocks or run.content_blocks[-1].type != ContentBlockType.REASONING:
                     run.content_blocks.append(ContentBlock(type=ContentBlockType.REASONING))
-                run.content_blocks[-1].text += d.delta_content
+                run.content_blocks[-1].append(d.delta_content)
 
             elif event.type == SessionEventType.ASSISTANT_MESSAGE_DELTA:
                 if run.responses is None:
-                    run.responses = [""]
-                run.responses[-1] += d.delta_content
+                    run.responses = [TextBuffer()]
+                run.responses[-1].append(d.delta_content)
                 if not run.content_blocks or run.content_blocks[-1].type != ContentBlockType.RESPONSE:
                     run.content_blocks.append(ContentBlock(type=ContentBlockType.RESPONSE))
-                run.content_blocks[-1].text += d.delta_content
+                run.content_blocks[-1].append(d.delta_content)
 
             elif event.type == SessionEventType.ASSISTANT_TURN_END or event.type == SessionEventType.ASSISTANT_MESSAGE:
                 # Start a new entry for the next turn
                 if run.responses is not None:
                     if self.logger_service:
                         self.logger_service.print(f"[response] {run.responses[-1]}")
-                    run.responses.append("")
+                    run.responses.append(TextBuffer())
                 if run.reasoning is not None:
                     if self.logger_service:
                         self.logger_service.print(f"[reasoning] {run.reasoning[-1]}")
-                    run.reasoning.append("")
+                    run.reasoning.append(TextBuffer())
             elif event.type == SessionEventType.SESSION_USAGE_INFO:
                 pass
             elif event.type == SessionEventType.ASSISTANT_USAGE:
@@ -294,6 +561,13 @@ class CopilotQuery(QueryService):
                     if d.cost:
                         mu.cost += d.cost
 
+                run_budget = execution_model.budget.run
+                if budget_abort is None and run_budget.usage_fraction(run.tokens.total_tokens, run.total_cost) >= 1:
+                    run.errors.append(
+                        RunError(message="Run budget exceeded; the run was aborted", code="budget", error_type="budget")
+                    )
+                    budget_abort = asyncio.ensure_future(session.abort())
+
             elif event.type == SessionEventType.TOOL_EXECUTION_START:
                 if d.tool_name == "report_intent":
                     # This is an internal tool used for logging the agent's intent,
@@ -313,7 +587,7 @@ class CopilotQuery(QueryService):
                         )
                     )
                 else:
-                    run.tool_calls.append(
+                    run.start_tool_call(
                         ToolCall(
                             tool_name=d.tool_name,
                             tool_call_id=d.tool_call_id,
@@ -328,25 +602,26 @@ class CopilotQuery(QueryService):
                     )
 
             elif event.type == SessionEventType.TOOL_EXECUTION_COMPLETE:
-                for tc in reversed(run.tool_calls):
-                    if tc.tool_call_id == d.tool_call_id:
-                        tc.result = d.result.content if d.result else None
-                        tc.success = d.success
-                        tc.duration_ms = d.duration
-                        if self.logger_service:
-                            self.logger_service.print(f"[Tool call - {tc.tool_name}]: {tc.result}")
-                        break
+                tc = run.complete_tool_call(
+                    d.tool_call_id,
+                    result=d.result.content if d.result else None,
+                    success=d.success,
+                    duration_ms=d.duration,
+                )
+                if tc and self.logger_service:
+                    self.logger_service.print(f"[Tool call - {tc.tool_name}]: {tc.result}")
 
             elif event.type == SessionEventType.SESSION_MODEL_CHANGE:
                 run.model = d.new_model
 
             elif event.type == SessionEventType.SESSION_ERROR:
+                rate_limited = classify_session_error(d.error_type, d.message, d.status_code) == ERROR_RATE_LIMIT
                 run.errors.append(
                     RunError(
                         message=d.message or "Unknown error",
                         code=d.error_type,
                         stack=d.stack,
-                        error_type=d.error_type,
+                        error_type=ERROR_RATE_LIMIT if rate_limited else d.error_type,
                     )
                 )
 
@@ -372,42 +647,74 @@ class CopilotQuery(QueryService):
             elif event.type == SessionEventType.SESSION_IDLE:
                 pass
 
-        unsubscribe = self.client.session.on(handle_event)
+            execution_model.notify_run_changed(run)
 
-        try:
-            response = await self.client.session.send_and_wait(
-                MessageOptions(prompt=execution_model.context.window), timeout=300
+        def is_waiting_on_tools() -> bool:
+            # A long tool call or an unanswered prompt is busy, not stalled.
+            return (
+                run.tool_calls_started > run.tool_calls_completed
+                or execution_model.pending_input is not None
+                or execution_model.pending_permission is not None
             )
 
-            if run.status != RunStatus.COMPLETED:
-                run.end_time = datetime.now(UTC)
-                run.status = RunStatus.COMPLETED
-            if run.start_time and run.end_time:
-                run.duration_ms = (run.end_time - run.start_time).total_seconds() * 1000
-
-            if self.logger_service:
-                self.logger_service.print(
-                    f"[Run completed]"
-                    f" duration={(run.duration_ms or 0) / 1000:.1f}s"
-                    f" status={run.status.value}"
-                    f" shutdown_reason={run.shutdown_reason}"
-                )
-
-            execution_model.current_run.result = response.data.content if response else None
-
+        unsubscribe = session.on(handle_event)
+        send = asyncio.create_task(
+            session.send_and_wait(MessageOptions(prompt=execution_model.context.window), timeout=timeout)
+        )
+        try:
+            while True:
+                wait = idle_timeout - (monotonic() - last_event_at) if idle_timeout > 0 else None
+                done, _ = await asyncio.wait({send}, timeout=max(wait, 0) if wait is not None else None)
+                if done:
+                    # An aborted session may end the wait with an error; the run simply ends early.
+                    response = None if budget_abort is not None and send.exception() else send.result()
+                    break
+                if is_waiting_on_tools():
+                    last_event_at = monotonic()
+                elif monotonic() - last_event_at >= idle_timeout:
+                    raise TimeoutError(f"No session events for {idle_timeout:g}s")
+        finally:
             unsubscribe()
-        except TimeoutError:
-            run.status = RunStatus.ERROR
+            if not send.done():
+                send.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await send
+            if budget_abort is not None:
+                with suppress(Exception):
+                    await budget_abort
+
+        if run.status != RunStatus.COMPLETED:
             run.end_time = datetime.now(UTC)
-            execution_model.dismiss_all_overlays()
-            unsubscribe()
+            run.status = RunStatus.COMPLETED
+        if run.start_time and run.end_time:
+            run.duration_ms = (run.end_time - run.start_time).total_seconds() * 1000
+        execution_model.notify_run_changed(run)
 
-            if self.logger_service:
-                self.logger_service.print(f"[Run error] shutdown_reason={ShutdownReason.TIMEOUT}")
+        if self.logger_service:
+            self.logger_service.print(
+                f"[Run completed]"
+                f" duration={(run.duration_ms or 0) / 1000:.1f}s"
+                f" status={run.status.value}"
+                f" shutdown_reason={run.shutdown_reason}"
+            )
 
-            return ""
+        run.result = response.data.content if response else None
 
-        return response.data.content
+        return run.result or ""
 
     async def clear_session(self):
-        await self.client.destroy_current_session()
+        await self.client.destroy_sessions()
+
+
+def _qualified_name(obj) -> str:
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+
+
+def _seconds(value, default: float) -> float:
+    """Parse a timeout option (number or quoted string) in seconds, keeping `default` when absent or invalid."""
+    if value is None:
+        return default
+    try:
+        return float(str(value).strip('"').strip("'"))
+    except ValueError:
+        return default
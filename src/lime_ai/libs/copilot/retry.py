@@ -0,0 +1,114 @@
+import random
+from collections import deque
+from dataclasses import dataclass
+
+from lime_ai.app.config import AppConfig
+from lime_ai.entities.run import RATE_LIMIT_ERROR_TYPE
+
+ERROR_TIMEOUT = "timeout"
+ERROR_RATE_LIMIT = RATE_LIMIT_ERROR_TYPE
+ERROR_SESSION = "session_error"
+
+_RATE_LIMIT_MARKERS = ("rate limit", "rate_limit", "ratelimit", "429", "too many requests", "quota")
+
+
+def classify_error(error: BaseException) -> str:
+    """Map an exception raised while waiting for a Copilot run to a retry category.
+
+    Args:
+        error (BaseException): The exception raised by send_and_wait.
+
+    Returns:
+        One of ERROR_TIMEOUT, ERROR_RATE_LIMIT or ERROR_SESSION.
+    """
+    if isinstance(error, TimeoutError):
+        return ERROR_TIMEOUT
+    if _mentions_rate_limit(str(error)):
+        return ERROR_RATE_LIMIT
+    return ERROR_SESSION
+
+
+def classify_session_error(error_type: str | None, message: str | None, status_code: int | None) -> str:
+    """Map a SESSION_ERROR event reported by the Copilot session to a retry category.
+
+    Providers report rate limits with their own errorType (e.g. "quota_exceeded"), so the
+    status code and the event text are checked as well.
+
+    Args:
+        error_type (str | None): The event's errorType.
+        message (str | None): The event's message.
+        status_code (int | None): The HTTP status code of the failed provider call, if any.
+
+    Returns:
+        ERROR_RATE_LIMIT or ERROR_SESSION.
+    """
+    if status_code == 429 or _mentions_rate_limit(f"{error_type or ''} {message or ''}"):
+        return ERROR_RATE_LIMIT
+    return ERROR_SESSION
+
+
+def _mentions_rate_limit(text: str) -> bool:
+    text = text.lower()
+    return any(marker in text for marker in _RATE_LIMIT_MARKERS)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often, and how long after, a failed Copilot run is attempted again.
+
+    The delay before attempt n+1 is `backoff * 2**(n-1)` seconds, capped at
+    `backoff_max`, with up to 25% random jitter so parallel runs that failed
+    together do not retry together.
+    """
+
+    max_attempts: int = 3
+    backoff: float = 2.0
+    backoff_max: float = 30.0
+    retry_on: frozenset[str] = frozenset({ERROR_TIMEOUT, ERROR_RATE_LIMIT})
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "RetryPolicy":
+        return cls(
+            max_attempts=max(app_config.run_max_attempts, 1),
+            backoff=app_config.run_retry_backoff,
+            backoff_max=app_config.run_retry_backoff_max,
+            retry_on=frozenset(app_config.run_retry_on),
+        )
+
+    def should_retry(self, attempt: int, error_kind: str) -> bool:
+        """Whether another attempt should follow the failed `attempt` (1-based)."""
+        return attempt < self.max_attempts and error_kind in self.retry_on
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after the failed `attempt` (1-based)."""
+        base = min(self.backoff * 2 ** (attempt - 1), self.backoff_max)
+        return base * (1 + random.uniform(0, 0.25))
+
+
+class LatencyTracker:
+    """Rolling window of successful run durations, used to decide when to hedge.
+
+    Examples
+    >>> tracker = LatencyTracker(min_samples=2)
+    >>> tracker.record(1.0); tracker.record(3.0)
+    >>> tracker.percentile(0.5)
+    1.0
+    """
+
+    def __init__(self, window: int = 100, min_samples: int = 10):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """The `fraction` percentile (0-1) of recorded durations, or None until `min_samples` exist."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(int(fraction * len(ordered)), len(ordered) - 1)
+        return ordered[index]
@@ -0,0 +1,299 @@
+import asyncio
+import hashlib
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from lime_ai.core.agents.models import ExecutionModel
+
+
+@dataclass(frozen=True)
+class SessionKey:
+    """Identifies the configuration a Copilot session was created with.
+
+    Sessions are only reused for runs whose model, system message and tool set
+    match exactly, because none of these can be changed on a live session.
+    """
+
+    model: str
+    system_message: str
+    tools_signature: str
+
+    @staticmethod
+    def hash_tools(signatures: list[str]) -> str:
+        """Hash an ordered list of tool signatures into a short, stable digest.
+
+        Args:
+            signatures (list[str]): One descriptor string per tool exposed to the session.
+        """
+        return hashlib.sha256("\n".join(signatures).encode()).hexdigest()[:16]
+
+
+@dataclass
+class PooledSession:
+    """A Copilot session owned by the pool, plus the execution it is currently leased to.
+
+    Session callbacks (permission/input handlers and the state tools) read
+    `execution_model` at call time, so a warm session can be handed to a
+    different execution without re-registering its handlers.
+
+    `owner` weakly references the execution that leased the session. The
+    session holds that execution's conversation, so it is never handed to
+    another execution, not even once the owner is gone: then it is destroyed.
+    """
+
+    key: SessionKey
+    session: Any = None
+    execution_model: ExecutionModel | None = None
+    owner: weakref.ref | None = None
+    in_use: bool = False
+    last_used: float = 0.0
+    created_at: float = field(default_factory=monotonic)
+    # Set while prewarm() is still creating `session`; resolves to whether creation succeeded.
+    ready: asyncio.Future | None = field(default=None, repr=False)
+
+    @property
+    def is_pending(self) -> bool:
+        """Whether prewarm() is still creating this entry's session."""
+        return self.session is None and self.ready is not None and not self.ready.done()
+
+    @property
+    def is_orphaned(self) -> bool:
+        """Whether the execution that leased this session is gone, leaving a conversation nobody may continue."""
+        return self.owner is not None and self.owner() is None
+
+    def is_available_to(self, owner: Any) -> bool:
+        """Whether an idle session may be leased by `owner` without leaking another execution's conversation.
+
+        Only a session that was never leased by an execution, e.g. a prewarmed one, goes to a new owner.
+        """
+        return self.owner is None or self.owner() is owner
+
+
+SessionFactory = Callable[[PooledSession], Awaitable[Any]]
+
+
+class CopilotSessionPool:
+    """Pool of warm Copilot sessions keyed by SessionKey.
+
+    - acquire() leases an idle session with a matching key, or creates one.
+      A leased session is never handed to a second caller until released, so
+      concurrent runs (AllAwait children, parallel sub-executions) each get
+      their own session and their LLM calls proceed in parallel.
+    - Sessions stick to the execution that leased them: an execution gets
+      its own session back on the next run, and never one another execution
+      used. Sessions of executions that are gone are destroyed.
+    - prewarm() creates idle sessions ahead of time in the background. A run
+      that starts while one is still being created waits for it rather than
+      creating a session of its own.
+    - Idle sessions are destroyed after `idle_timeout` seconds, and at most
+      `max_size` sessions are retained; leases beyond that are still granted
+      but the surplus is destroyed on release (least recently used first).
+    """
+
+    def __init__(self, max_size: int = 8, idle_timeout: float = 600.0):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._entries: list[PooledSession] = []
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def size(self) -> int:
+        """Number of sessions currently owned by the pool (idle and leased)."""
+        return len(self._entries)
+
+    def idle_count(self, key: SessionKey | None = None, owner: Any = None) -> int:
+        """Number of idle sessions, optionally restricted to a single key and to those `owner` may lease."""
+        return len(
+            [
+                e
+                for e in self._entries
+                if not e.in_use and (key is None or e.key == key) and (owner is None or e.is_available_to(owner))
+            ]
+        )
+
+    async def acquire(self, key: SessionKey, factory: SessionFactory, owner: Any = None) -> PooledSession:
+        """Lease a session for `key`, creating one with `factory` if none is idle.
+
+        The owner's previous session is preferred so that consecutive runs of
+        the same execution keep their conversation; otherwise a session no
+        execution has leased yet (e.g. a prewarmed one) is used.
+
+        Args:
+            key (SessionKey): The configuration the session must match.
+            factory (SessionFactory): Creates the underlying session for a new pool entry.
+            owner (Any): The execution leasing the session. None leases any idle session.
+        """
+        await self.evict_idle()
+
+        async with self._lock:
+            candidates = [
+                e
+                for e in self._entries
+                if e.key == key
+                and not e.in_use
+                and (e.session is not None or e.is_pending)
+                and (owner is None or e.is_available_to(owner))
+            ]
+            entry = None
+            if candidates:
+                # Ready sessions first, then the owner's own, then the most recently used.
+                entry = max(
+                    candidates,
+                    key=lambda e: (e.session is not None, e.owner is not None and e.owner() is owner, e.last_used),
+                )
+                entry.in_use = True
+                entry.owner = _weak(owner)
+
+        if entry is not None:
+            if entry.session is not None:
+                return entry
+            # A prewarm is creating this session: wait for it instead of creating a second one.
+            try:
+                created = await asyncio.shield(entry.ready)
+            except BaseException:
+                entry.in_use = False
+                raise
+            if created:
+                return entry
+            # The prewarm failed and dropped its entry; create the session ourselves.
+
+        entry = PooledSession(key=key, owner=_weak(owner), in_use=True)
+        async with self._lock:
+            self._entries.append(entry)
+
+        try:
+            entry.session = await factory(entry)
+        except BaseException:
+            async with self._lock:
+                if entry in self._entries:
+                    self._entries.remove(entry)
+            raise
+
+        return entry
+
+    async def release(self, entry: PooledSession):
+        """Return a leased session to the pool.
+
+        Args:
+            entry (PooledSession): The entry returned by acquire().
+        """
+        entry.in_use = False
+        entry.execution_model = None
+        entry.last_used = monotonic()
+
+        if entry not in self._entries:
+            # The pool was cleared while this session was leased.
+            await self._destroy(entry)
+            return
+
+        await self._trim()
+
+    async def discard(self, entry: PooledSession):
+        """Remove a leased session from the pool and destroy it.
+
+        Used when a session is known to be unhealthy and must not be reused.
+
+        Args:
+            entry (PooledSession): The entry returned by acquire().
+        """
+        if entry in self._entries:
+            self._entries.remove(entry)
+        await self._destroy(entry)
+
+    async def prewarm(
+        self, key: SessionKey, factory: SessionFactory, count: int = 1, owner: Any = None
+    ) -> asyncio.Task | None:
+        """Create idle sessions for `key` in the background until `count` are available.
+
+        Args:
+            key (SessionKey): The configuration to warm sessions for.
+            factory (SessionFactory): Creates the underlying session for a new pool entry.
+            count (int): Desired number of idle sessions for the key.
+            owner (Any): The execution the sessions are warmed for; sessions it may not lease are not counted.
+
+        Returns:
+            The background task, or None if enough sessions are already idle.
+        """
+        missing = min(count - self.idle_count(key, owner), self.max_size - self.size)
+        if missing <= 0:
+            return None
+
+        async def _warm():
+            for _ in range(missing):
+                async with self._lock:
+                    entry = PooledSession(key=key, ready=asyncio.get_running_loop().create_future())
+                    self._entries.append(entry)
+                try:
+                    entry.session = await factory(entry)
+                except Exception:
+                    async with self._lock:
+                        if entry in self._entries:
+                            self._entries.remove(entry)
+                    return
+                finally:
+                    # Wakes an acquire() that claimed the entry, also when the warm-up was cancelled.
+                    if not entry.ready.done():
+                        entry.ready.set_result(entry.session is not None)
+
+        task = asyncio.create_task(_warm())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def evict_idle(self, now: float | None = None) -> int:
+        """Destroy idle sessions that have not been used for `idle_timeout` seconds or whose owner is gone.
+
+        Args:
+            now (float | None): Override for the current monotonic time (tests).
+
+        Returns:
+            The number of sessions evicted.
+        """
+        now = monotonic() if now is None else now
+        expired = [
+            e
+            for e in self._entries
+            if not e.in_use
+            and e.session is not None
+            and (e.is_orphaned or now - max(e.last_used, e.created_at) > self.idle_timeout)
+        ]
+        for entry in expired:
+            self._entries.remove(entry)
+            await self._destroy(entry)
+        return len(expired)
+
+    async def clear(self):
+        """Destroy every idle session and detach leased ones so they are destroyed on release."""
+        for task in list(self._tasks):
+            task.cancel()
+
+        entries, self._entries = self._entries, []
+        for entry in entries:
+            if not entry.in_use:
+                await self._destroy(entry)
+
+    async def _trim(self):
+        idle = sorted((e for e in self._entries if not e.in_use and e.session is not None), key=lambda e: e.last_used)
+        while len(self._entries) > self.max_size and idle:
+            entry = idle.pop(0)
+            self._entries.remove(entry)
+            await self._destroy(entry)
+
+    @staticmethod
+    async def _destroy(entry: PooledSession):
+        session, entry.session = entry.session, None
+        if session is None:
+            return
+        try:
+            await session.destroy()
+        except Exception:
+            # The session may already be gone (client stopped, connection lost).
+            pass
+
+
+def _weak(owner: Any) -> weakref.ref | None:
+    return weakref.ref(owner) if owner is not None else None
@@ -1,22 +1,82 @@
+from collections.abc import Callable
+
 from copilot import define_tool
 from pydantic import BaseModel
 
 from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.libs.copilot.tools.state_projection import ProjectionError, describe, page, project
 
 
 class GetVariableFromState(BaseModel):
     """Pydantic model for the get_variable tool parameters.
 
     Used by the Copilot tools layer to request variables from the agent state.
+    `variables` reads several variables in one call; `path`, `offset` and
+    `limit` apply to each of them.
     """
 
-    variable: str
+    variable: str | None = None
+    variables: list[str] | None = None
+    path: str | None = None
+    offset: int = 0
+    limit: int | None = None
+
+
+class ListVariablesInState(BaseModel):
+    """Pydantic model for the list_variables tool parameters."""
+
+    prefix: str | None = None
 
 
-async def create_get_variable_tool(execution_model: ExecutionModel):
-    @define_tool(description="Get a variable from the shared state")
+async def create_get_variable_tool(resolve_execution_model: Callable[[], ExecutionModel]):
+    """Create the get_variable tool.
+
+    Args:
+        resolve_execution_model: Returns the execution model the session is currently serving.
+    """
+
+    @define_tool(
+        description=(
+            "Get one or more variables from the shared state. Use `path` to select part of a value"
+            " (e.g. '$.files[*].name', 'plan.steps[0:5]') and `offset`/`limit` to page through long lists."
+        )
+    )
     async def get_variable(params: GetVariableFromState) -> dict:
-        value = execution_model.context.get_variable_value(params.variable)
-        return {params.variable: value}
+        execution_model = resolve_execution_model()
+        names = list(params.variables or [])
+        if params.variable:
+            names.insert(0, params.variable)
+
+        result: dict = {}
+        for name in names:
+            value = execution_model.context.get_variable_value(name)
+            try:
+                value = project(value, params.path)
+            except ProjectionError as error:
+                return {"error": str(error)}
+            value, paging = page(value, params.offset, params.limit)
+            result[name] = value
+            if paging:
+                result.setdefault("_paging", {})[name] = paging
+        return result
 
     return get_variable
+
+
+async def create_list_variables_tool(resolve_execution_model: Callable[[], ExecutionModel]):
+    """Create the list_variables tool.
+
+    Args:
+        resolve_execution_model: Returns the execution model the session is currently serving.
+    """
+
+    @define_tool(description="List the variables in the shared state with their type and size, without their values")
+    async def list_variables(params: ListVariablesInState) -> dict:
+        execution_model = resolve_execution_model()
+        return {
+            name: describe(value)
+            for name, value in execution_model.context.data.items()
+            if not params.prefix or name.startswith(params.prefix)
+        }
+
+    return list_variables
@@ -1,3 +1,6 @@
+from collections.abc import Callable
+from typing import Any
+
 from copilot import define_tool
 from pydantic import BaseModel
 
@@ -8,24 +11,42 @@ class SetVariableFromState(BaseModel):
     """Pydantic model representing parameters for the set_variable tool.
 
     Fields correspond to the expected API for storing variables in the agent's
-    state from within the LLM tool call.
+    state from within the LLM tool call. `values` sets several variables in
+    one call.
     """
 
-    name: str
-    value: str | list | dict | int | float | bool | None
+    name: str | None = None
+    value: str | list | dict | int | float | bool | None = None
+    values: dict[str, Any] | None = None
+
 
+async def create_set_variable_tool(resolve_execution_model: Callable[[], ExecutionModel]):
+    """Create the set_variable tool.
+
+    Args:
+        resolve_execution_model: Returns the execution model the session is currently serving.
+    """
 
-async def create_set_variable_tool(execution_model: ExecutionModel):
     @define_tool(
-        description="Set a variable in the shared state, for putting it in a var",
+        description=(
+            "Set a variable in the shared state, for putting it in a var."
+            " Pass `values` ({name: value, ...}) to set several variables at once."
+        ),
     )
     async def set_variable(params: SetVariableFromState) -> dict:
+        execution_model = resolve_execution_model()
+        updates = dict(params.values or {})
+        if params.name:
+            updates[params.name] = params.value
+
         memory = execution_model.memory
-        if memory is not None and params.name in memory.get_items():
-            memory.set(params.name, params.value)
-            value = execution_model.context.set_variable(params.name, params.value)
-        else:
-            value = execution_model.context.set_variable(params.name, params.value)
-        return {"value": value}
+        for name, value in updates.items():
+            if memory is not None and name in memory.get_items():
+                memory.set(name, value)
+            execution_model.context.set_variable(name, value)
+
+        if params.values is None:
+            return {"value": None}
+        return {"updated": list(updates)}
 
     return set_variable
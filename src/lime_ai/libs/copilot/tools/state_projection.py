@@ -0,0 +1,99 @@
+import json
+import re
+from typing import Any
+
+_SEGMENT = re.compile(r"\.?([A-Za-z_][\w-]*)|\[(\*|-?\d+|-?\d*:-?\d*)\]")
+
+
+class ProjectionError(ValueError):
+    """Raised when a projection path is malformed."""
+
+
+def project(value: Any, path: str | None) -> Any:
+    """Select part of a state value with a small JSONPath-like path.
+
+    Supported segments: `.key` (or a leading `key`), `[0]`, `[-1]`, `[2:10]`
+    and `[*]`, which applies the rest of the path to every item. A leading
+    `$` is optional. Missing keys and out-of-range indexes yield None.
+
+    Args:
+        value (Any): The variable value.
+        path (str | None): The path to select; None or "" returns the value unchanged.
+
+    Raises:
+        ProjectionError: The path contains an unsupported segment.
+
+    Examples
+    >>> project({"files": [{"name": "a"}, {"name": "b"}]}, "$.files[*].name")
+    ['a', 'b']
+    """
+    if not path:
+        return value
+    return _apply(value, _parse(path.strip().removeprefix("$")))
+
+
+def page(value: Any, offset: int = 0, limit: int | None = None) -> tuple[Any, dict]:
+    """Slice a list (or string) value and describe the slice.
+
+    Returns:
+        The sliced value and paging info with `total` and, when more items follow, `next_offset`.
+        Other values are returned unchanged with empty paging info.
+    """
+    if not isinstance(value, list | tuple | str) or (offset == 0 and limit is None):
+        return value, {}
+
+    end = None if limit is None else offset + max(limit, 0)
+    info: dict[str, Any] = {"total": len(value), "offset": offset}
+    if end is not None and end < len(value):
+        info["next_offset"] = end
+    return value[offset:end], info
+
+
+def describe(value: Any) -> dict:
+    """Type and size hints for a value, so the model can decide whether to page or project it."""
+    hint: dict[str, Any] = {"type": type(value).__name__}
+    if isinstance(value, list | tuple | dict | str):
+        hint["length"] = len(value)
+    if isinstance(value, dict):
+        keys = list(value)
+        hint["keys"] = keys[:20] + (["..."] if len(keys) > 20 else [])
+    hint["chars"] = len(json.dumps(value, default=str))
+    return hint
+
+
+def _parse(path: str) -> list[tuple[str, Any]]:
+    segments = []
+    position = 0
+    while position < len(path):
+        match = _SEGMENT.match(path, position)
+        if match is None:
+            raise ProjectionError(f"Unsupported path segment at '{path[position:]}'")
+        key, index = match.groups()
+        if key is not None:
+            segments.append(("key", key))
+        elif index == "*":
+            segments.append(("all", None))
+        elif ":" in index:
+            start, end = index.split(":")
+            segments.append(("slice", slice(int(start) if start else None, int(end) if end else None)))
+        else:
+            segments.append(("index", int(index)))
+        position = match.end()
+    return segments
+
+
+def _apply(value: Any, segments: list[tuple[str, Any]]) -> Any:
+    for position, (kind, argument) in enumerate(segments):
+        if value is None:
+            return None
+        if kind == "all":
+            items = value.values() if isinstance(value, dict) else value
+            return [_apply(item, segments[position + 1 :]) for item in items]
+        if kind == "key":
+            value = value.get(argument) if isinstance(value, dict) else getattr(value, argument, None)
+        else:
+            try:
+                value = value[argument]
+            except (IndexError, KeyError, TypeError):
+                return None
+    return value
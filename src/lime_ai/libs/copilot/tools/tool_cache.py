@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from copilot import define_tool
+from copilot.types import Tool
+
+
+class ToolDefinitionCache:
+    """LRU cache of compiled Copilot SDK tools.
+
+    `define_tool` inspects the handler and regenerates the pydantic JSON schema
+    on every call. Agents that run in a loop expose the same functions on every
+    `@effect run`, so the compiled Tool is cached by handler identity, parameter
+    type, name and description. Re-importing a module produces new function
+    objects, which naturally miss the cache.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._tools: OrderedDict[tuple, Tool] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def get(self, name: str, description: str, handler: Callable[..., Any], params_type: type) -> Tool:
+        """Return the compiled tool for the given definition, compiling it on a miss.
+
+        Args:
+            name (str): The tool name exposed to the model.
+            description (str): The tool description exposed to the model.
+            handler (Callable): The function invoked when the tool is called.
+            params_type (type): The pydantic model describing the tool parameters.
+        """
+        key = (name, description, handler, params_type)
+        tool = self._tools.get(key)
+        if tool is not None:
+            self._tools.move_to_end(key)
+            return tool
+
+        tool = define_tool(name=name, description=description, params_type=params_type, handler=handler)
+        self._tools[key] = tool
+        if len(self._tools) > self.max_size:
+            self._tools.popitem(last=False)
+        return tool
+
+    def clear(self):
+        self._tools.clear()
@@ -0,0 +1,19 @@
+from wireup import injectable
+
+from lime_ai.app.config import AppConfig
+from lime_ai.app.paths import func_cache_dir
+from lime_ai.core.agents.services.func_cache import FuncResultCache
+
+
+@injectable
+def get_func_result_cache(app_config: AppConfig) -> FuncResultCache:
+    """Create the process-wide cache for `@effect func cached` results.
+
+    Args:
+        app_config (AppConfig): Provides the LRU size, the default TTL and whether results are kept on disk.
+    """
+    return FuncResultCache(
+        max_size=app_config.func_cache_size,
+        directory=func_cache_dir() if app_config.func_cache_disk else None,
+        ttl=app_config.func_cache_ttl or None,
+    )
@@ -0,0 +1,15 @@
+from wireup import injectable
+
+from lime_ai.app.config import AppConfig
+from lime_ai.app.paths import run_archive_dir
+from lime_ai.core.agents.services.run_archive import RunArchive
+
+
+@injectable
+def get_run_archive(app_config: AppConfig) -> RunArchive:
+    """Create the archive that spills finished runs to disk.
+
+    Args:
+        app_config (AppConfig): Provides how many runs stay in memory; 0 keeps every run in memory.
+    """
+    return RunArchive(keep=app_config.run_archive_keep, directory=run_archive_dir())
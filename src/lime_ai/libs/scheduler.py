@@ -0,0 +1,17 @@
+from wireup import injectable
+
+from lime_ai.app.config import AppConfig
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
+
+
+@injectable
+def get_request_scheduler(app_config: AppConfig) -> RequestScheduler:
+    """Create the process-wide RequestScheduler from the app settings.
+
+    Args:
+        app_config (AppConfig): Provides the concurrency cap and tokens-per-minute budget.
+    """
+    return RequestScheduler(
+        max_concurrency=app_config.max_concurrent_requests,
+        tokens_per_minute=app_config.tokens_per_minute,
+    )
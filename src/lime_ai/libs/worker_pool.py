@@ -0,0 +1,14 @@
+from wireup import injectable
+
+from lime_ai.app.config import AppConfig
+from lime_ai.core.agents.services.worker_pool import WorkerPool
+
+
+@injectable
+def get_worker_pool(app_config: AppConfig) -> WorkerPool:
+    """Create the process-wide WorkerPool for tool handlers and @effect func calls.
+
+    Args:
+        app_config (AppConfig): Provides the worker mode (thread, process or inline) and pool size.
+    """
+    return WorkerPool(mode=app_config.worker_mode, max_workers=app_config.worker_max_workers)
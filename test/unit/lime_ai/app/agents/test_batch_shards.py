@@ -0,0 +1,46 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+import lime_ai.app.cli.agents.batch_shards as batch_shards_module
+from lime_ai.entities.batch import BatchJob, BatchJobStatus
+
+# Stands in for `lime-ai execute-batch ... --shard I/N`: shard 0 reports its jobs, shard 1 crashes.
+_FAKE_WORKER = """
+import json, sys
+shard, count = map(int, sys.argv[sys.argv.index("--shard") + 1].split("/"))
+if shard == 1:
+    sys.exit(3)
+print("some stray output")
+for index in range(shard, 4, count):
+    print(json.dumps({"index": index, "status": "completed", "tokens": 10, "results": [f"job {index}"]}))
+"""
+
+
+def _create_jobs(count: int) -> list[BatchJob]:
+    return [BatchJob(index=index, file=Path("agent.mgx")) for index in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_run_shards_should_aggregate_streamed_results_and_fail_jobs_of_crashed_workers(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(batch_shards_module, "worker_command", lambda: [sys.executable, "-c", _FAKE_WORKER])
+    jobs = _create_jobs(4)
+    reported = []
+
+    # Act
+    summary = await batch_shards_module.run_shards(jobs, 2, ["execute-batch"], on_result=reported.append)
+
+    # Assert
+    assert [result.status for result in summary.results] == [
+        BatchJobStatus.COMPLETED,
+        BatchJobStatus.FAILED,
+        BatchJobStatus.COMPLETED,
+        BatchJobStatus.FAILED,
+    ]
+    assert summary.results[2].results == ["job 2"]
+    assert "exited with code 3" in summary.results[1].error
+    assert json.loads(json.dumps(summary.to_dict()))["tokens"] == 20
+    assert len(reported) == 4
@@ -1,12 +1,18 @@
+import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 from click.testing import CliRunner
 
 import lime_ai.app.cli.agents.execute as execute_module
+import lime_ai.app.cli.agents.execute_local as execute_local_module
 import lime_ai.app.lifecycle as lifecycle_module
 from lime_ai.app.config import AppConfig
+from lime_ai.core.agents.services.func_cache import FuncResultCache
 from lime_ai.core.agents.services.memory import MemoryService
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.core.agents.services.worker_pool import WorkerPool
 from lime_ai.core.interfaces.logger import LoggerService
 from lime_ai.core.interfaces.prompt_integrity import PromptIntegrity
 from lime_ai.core.interfaces.query_service import QueryService
@@ -61,6 +67,14 @@ def _patch_execute_container_get(monkeypatch, prompt_integrity=None):
             return logger_service
         if interface is MemoryService:
             return _FakeMemoryService()
+        if interface is RequestScheduler:
+            return RequestScheduler()
+        if interface is WorkerPool:
+            return WorkerPool(mode="inline")
+        if interface is FuncResultCache:
+            return FuncResultCache()
+        if interface is RunArchive:
+            return RunArchive(keep=0)
         if interface is PromptIntegrity:
             if prompt_integrity is None:
                 raise AssertionError("PromptIntegrity was requested unexpectedly.")
@@ -68,7 +82,7 @@ def _patch_execute_container_get(monkeypatch, prompt_integrity=None):
 
         raise AssertionError(f"Unexpected container dependency: {interface}")
 
-    monkeypatch.setattr(execute_module.container, "get", _fake_get)
+    monkeypatch.setattr(execute_local_module.container, "get", _fake_get)
     return requested_interfaces
 
 
@@ -101,7 +115,7 @@ def _patch_execute_operation_with_fake(monkeypatch):
             }
             return None
 
-    monkeypatch.setattr(execute_module, "ExecuteAgentOperation", FakeExecuteAgentOperation)
+    monkeypatch.setattr(execute_local_module, "ExecuteAgentOperation", FakeExecuteAgentOperation)
     return operation_calls
 
 
@@ -282,3 +296,22 @@ def test_execute_should_pass_allow_unverified_to_operation_when_flag_is_set(tmp_
     assert result.exit_code == 0
     assert PromptIntegrity not in requested_interfaces
     assert operation_calls["init_kwargs"]["allow_unverified"] is True
+
+
+def test_execute_should_stream_ndjson_without_tui_when_output_is_ndjson(tmp_path, monkeypatch):
+    # Arrange
+    _patch_lifecycle_with_noop(monkeypatch)
+    _patch_execute_operation_with_fake(monkeypatch)
+    requested_interfaces = _patch_execute_container_get(monkeypatch)
+    monkeypatch.chdir(tmp_path)
+    sut = execute_module.execute
+    runner = CliRunner()
+    mgx_path = _write_mgx_file(tmp_path)
+
+    # Act
+    result = runner.invoke(sut, [str(mgx_path), "--output", "ndjson", "--coalesce-ms", "0"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert UI not in requested_interfaces
+    assert json.loads(result.output.splitlines()[-1])["type"] == "done"
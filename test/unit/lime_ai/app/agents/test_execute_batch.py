@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from click import ClickException
+from click.testing import CliRunner
+
+import lime_ai.app.cli.agents.execute_batch as execute_batch_module
+import lime_ai.app.lifecycle as lifecycle_module
+from lime_ai.app.config import AppConfig
+from lime_ai.entities.batch import BatchJob, BatchJobResult, BatchJobStatus, BatchSummary
+
+
+def _patch_lifecycle_with_noop(monkeypatch):
+    async def _noop(_container):
+        return None
+
+    monkeypatch.setattr(lifecycle_module, "startup", _noop)
+    monkeypatch.setattr(lifecycle_module, "shutdown", _noop)
+
+
+def _patch_container_get(monkeypatch):
+    """Resolve every shared service to a mock; the batch operation is faked anyway."""
+
+    async def _fake_get(interface, **kwargs):
+        if interface is AppConfig:
+            return AppConfig(run_archive_keep=0)
+        return MagicMock()
+
+    monkeypatch.setattr(execute_batch_module.container, "get", _fake_get)
+
+
+def _write_mgx_file(project_root: Path, file_name: str = "run.mgx") -> Path:
+    mgx_path = project_root / file_name
+    mgx_path.write_text("")
+    return mgx_path
+
+
+def _patch_batch_operation_with_fake(monkeypatch):
+    """Patch the batch operation so CLI tests only cover job building and result writing."""
+    calls: dict = {}
+
+    class FakeExecuteBatchOperation:
+        def __init__(self, operation_factory, workers, run_archive):
+            calls["workers"] = workers
+            self.run_archive = run_archive
+
+        async def execute_async(self, jobs, on_result=None):
+            calls["jobs"] = jobs
+            results = [BatchJobResult(job=job, status=BatchJobStatus.COMPLETED, tokens=3) for job in jobs]
+            for result in results:
+                on_result(result)
+            return BatchSummary(results=results)
+
+    monkeypatch.setattr(execute_batch_module, "ExecuteBatchOperation", FakeExecuteBatchOperation)
+    return calls
+
+
+def test_execute_batch_should_run_one_job_per_row_and_write_results_when_matrix_is_given(tmp_path, monkeypatch):
+    # Arrange
+    _patch_lifecycle_with_noop(monkeypatch)
+    _patch_container_get(monkeypatch)
+    calls = _patch_batch_operation_with_fake(monkeypatch)
+    monkeypatch.chdir(tmp_path)
+    mgx_path = _write_mgx_file(tmp_path)
+    matrix_path = tmp_path / "rows.csv"
+    matrix_path.write_text("topic,depth\nrust,1\npython,2\n")
+    runner = CliRunner()
+
+    # Act
+    result = runner.invoke(
+        execute_batch_module.execute_batch,
+        [str(mgx_path), "--matrix", str(matrix_path), "--workers", "8", "--output-dir", "out"],
+    )
+
+    # Assert
+    assert result.exit_code == 0, result.output
+    assert calls["workers"] == 8
+    assert [job.inputs for job in calls["jobs"]] == [{"topic": "rust", "depth": "1"}, {"topic": "python", "depth": "2"}]
+    summary = json.loads((tmp_path / "out" / "summary.json").read_text())
+    assert summary["jobs"] == 2 and summary["completed"] == 2 and summary["tokens"] == 6
+    assert (tmp_path / "out" / "0001-run.json").is_file()
+
+
+def test_build_jobs_should_fail_when_matrix_is_given_with_several_files(tmp_path):
+    # Arrange
+    first, second = _write_mgx_file(tmp_path, "a.mgx"), _write_mgx_file(tmp_path, "b.mgx")
+    matrix_path = tmp_path / "rows.json"
+    matrix_path.write_text('[{"topic": "x"}]')
+
+    # Act / Assert
+    with pytest.raises(ClickException):
+        execute_batch_module.build_jobs((str(first), str(second)), str(matrix_path))
+
+
+def test_load_matrix_should_reject_json_when_rows_are_not_objects(tmp_path):
+    # Arrange
+    matrix_path = tmp_path / "rows.json"
+    matrix_path.write_text("[1, 2]")
+
+    # Act / Assert
+    with pytest.raises(ClickException):
+        execute_batch_module.load_matrix(matrix_path)
+
+
+def test_shard_jobs_should_take_every_nth_job_when_shard_is_given(tmp_path):
+    # Arrange
+    jobs = [BatchJob(index=index, file=tmp_path / "run.mgx") for index in range(5)]
+
+    # Act
+    shard = execute_batch_module.shard_jobs(jobs, "1/2")
+
+    # Assert
+    assert [job.index for job in shard] == [1, 3]
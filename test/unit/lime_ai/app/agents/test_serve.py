@@ -0,0 +1,296 @@
+import asyncio
+import io
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import click
+import pytest
+
+from lime_ai.app.cli.agents.remote import open_connection, parse_address, run_remote, start_server, write_token
+from lime_ai.app.cli.agents.serve import PromptPolicyCheck, RunServer, _SocketStream
+from lime_ai.app.paths import serve_token_path
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.operations.execute_batch_operation import ExecuteBatchOperation
+from lime_ai.core.agents.plugins.import_plugin import ImportPlugin
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.entities.prompt_integrity import PromptHashMismatchError
+from lime_ai.entities.run import ContentBlock, ContentBlockType, RunStatus
+
+
+class _FakeOperation:
+    """Answers with a greeting for the `name` in the initial state."""
+
+    def __init__(self, model: ExecutionModel):
+        self.model = model
+
+    async def execute_async(self, mgx_file: str, base_path: Path | None = None):
+        self.model.start_turn()
+        run = self.model.start_run(mgx_file, "copilot", RunStatus.RUNNING, datetime.now())
+        run.result = f"hello {self.model.context.data['name']}"
+        run.content_blocks.append(ContentBlock(type=ContentBlockType.RESPONSE, text=run.result))
+        run.status = RunStatus.COMPLETED
+        self.model.notify_run_changed(run)
+        self.model.done = True
+
+
+def _create_batch() -> ExecuteBatchOperation:
+    return ExecuteBatchOperation(operation_factory=_FakeOperation)
+
+
+async def _start_server(token: str | None = None, **options) -> tuple[object, str]:
+    sut = RunServer(batch=_create_batch(), coalesce_ms=0, token=token, **options)
+    server = await start_server(sut.handle, "127.0.0.1:0")
+    port = server.sockets[0].getsockname()[1]
+    return server, f"127.0.0.1:{port}"
+
+
+def _write_mgx_file(project_root: Path) -> Path:
+    mgx_path = project_root / "agent.mgx"
+    mgx_path.write_text("@effect run")
+    return mgx_path
+
+
+@pytest.mark.asyncio
+async def test_run_remote_should_stream_events_and_result_when_server_runs_the_file(tmp_path):
+    # Arrange
+    server, address = await _start_server()
+    output = io.StringIO()
+
+    # Act
+    async with server:
+        code = await run_remote(address, str(_write_mgx_file(tmp_path)), {"name": "Ada"}, "ndjson", output)
+
+    # Assert
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert code == 0
+    assert [event["type"] for event in events][-2:] == ["done", "result"]
+    assert {"type": "delta", "text": "hello Ada"}.items() <= next(e for e in events if e["type"] == "delta").items()
+    assert events[-1]["results"] == ["hello Ada"]
+
+
+@pytest.mark.asyncio
+async def test_run_remote_should_exit_with_failure_when_file_cannot_be_read(tmp_path):
+    # Arrange
+    server, address = await _start_server()
+    output = io.StringIO()
+
+    # Act
+    async with server:
+        code = await run_remote(address, str(tmp_path / "missing.mgx"), {}, "text", output)
+
+    # Assert
+    assert code == 1
+    assert "failed" in output.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_handle_should_answer_pong_when_request_is_ping():
+    # Arrange
+    server, address = await _start_server()
+
+    # Act
+    async with server:
+        reader, writer = await open_connection(address)
+        writer.write(b'{"type": "ping"}\n')
+        reply = json.loads(await reader.readline())
+        writer.close()
+
+    # Assert
+    assert reply["type"] == "pong"
+
+
+def test_parse_address_should_distinguish_tcp_and_unix_socket_when_parsing():
+    # Act / Assert
+    assert parse_address(":8765") == ("127.0.0.1", 8765)
+    assert parse_address("localhost:9000") == ("localhost", 9000)
+    assert parse_address("/home/me/.lime/lime.sock") == "/home/me/.lime/lime.sock"
+
+
+@pytest.mark.asyncio
+async def test_handle_should_reject_request_when_token_is_missing():
+    # Arrange
+    server, address = await _start_server(token="secret")
+
+    # Act
+    async with server:
+        reader, writer = await open_connection(address)
+        writer.write(b'{"type": "ping"}\n')
+        reply = json.loads(await reader.readline())
+        writer.close()
+
+    # Assert
+    assert reply == {"type": "error", "message": "Invalid or missing token."}
+
+
+@pytest.mark.asyncio
+async def test_run_remote_should_send_token_when_daemon_wrote_one(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setenv("HOME", str(tmp_path))
+    server, address = await _start_server(token="secret")
+    write_token(serve_token_path(parse_address(address)[1]), "secret")
+    output = io.StringIO()
+
+    # Act
+    async with server:
+        code = await run_remote(address, str(_write_mgx_file(tmp_path)), {"name": "Ada"}, "text", output)
+
+    # Assert
+    assert code == 0
+    assert "hello Ada" in output.getvalue()
+    assert serve_token_path(parse_address(address)[1]).stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.asyncio
+async def test_handle_should_reject_run_when_client_runs_in_another_directory(tmp_path):
+    # Arrange
+    server, address = await _start_server()
+    request = {"type": "run", "file": str(_write_mgx_file(tmp_path)), "state": {}, "cwd": str(tmp_path)}
+
+    # Act
+    async with server:
+        reader, writer = await open_connection(address)
+        writer.write(json.dumps(request).encode() + b"\n")
+        reply = json.loads(await reader.readline())
+        writer.close()
+
+    # Assert
+    assert reply["type"] == "error"
+    assert str(tmp_path) in reply["message"]
+
+
+@pytest.mark.asyncio
+async def test_handle_should_report_error_when_prompt_check_fails_for_a_request(tmp_path):
+    # Arrange
+    def failing_check():
+        raise click.ClickException("Prompt 'agent.mgx' drifted from the lock file.")
+
+    server, address = await _start_server(check_prompts=failing_check)
+    output = io.StringIO()
+
+    # Act
+    async with server:
+        code = await run_remote(address, str(_write_mgx_file(tmp_path)), {}, "ndjson", output)
+
+    # Assert
+    assert code == 1
+    assert json.loads(output.getvalue())["message"] == "Prompt 'agent.mgx' drifted from the lock file."
+
+
+@pytest.mark.asyncio
+async def test_handle_should_share_batch_and_give_each_request_its_own_closed_archive_when_runs_finish(tmp_path):
+    # Arrange
+    archives = []
+    archived_by = {}
+
+    class _RecordingArchive(RunArchive):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    def create_archive() -> RunArchive:
+        archives.append(_RecordingArchive(keep=1))
+        return archives[-1]
+
+    batch = _create_batch()
+    batch.operation_factory = lambda model: archived_by.setdefault(model.run_archive, _FakeOperation(model))
+    sut = RunServer(batch=batch, create_archive=create_archive, coalesce_ms=0)
+    server = await start_server(sut.handle, "127.0.0.1:0")
+    address = f"127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+    # Act
+    async with server:
+        for name in ("Ada", "Bob"):
+            await run_remote(address, str(_write_mgx_file(tmp_path)), {"name": name}, "text", io.StringIO())
+
+    # Assert
+    assert len(archives) == 2
+    assert list(archived_by) == archives
+    assert all(archive.closed for archive in archives)
+    assert list(batch._sources) == [tmp_path / "agent.mgx"]
+
+
+def test_prompt_policy_check_should_reload_policy_only_when_policy_files_change(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "prompts.toml").write_text("v1")
+    prompt_integrity = MagicMock()
+    sut = PromptPolicyCheck(prompt_integrity)
+
+    # Act
+    sut.check()
+    sut.check()
+    os.utime(tmp_path / "prompts.toml", ns=(0, 0))
+    sut.check()
+
+    # Assert
+    assert prompt_integrity.load_policy.call_count == 2
+    assert prompt_integrity.check_against_lock.call_count == 3
+
+
+def test_prompt_policy_check_should_raise_click_exception_when_prompts_drift(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    prompt_integrity = MagicMock()
+    prompt_integrity.check_against_lock.side_effect = PromptHashMismatchError("Prompt hash mismatch for 'a.md'.")
+    sut = PromptPolicyCheck(prompt_integrity)
+
+    # Act / Assert
+    with pytest.raises(click.ClickException, match="Prompt hash mismatch"):
+        sut.check()
+
+
+@pytest.mark.asyncio
+async def test_socket_stream_should_disconnect_client_when_it_falls_too_far_behind():
+    # Arrange
+    class _StalledWriter:
+        def __init__(self):
+            self.closed = False
+            self.written = []
+            self.disconnected = asyncio.Event()
+
+        def is_closing(self):
+            return self.closed
+
+        def write(self, data):
+            self.written.append(data)
+
+        async def drain(self):
+            await self.disconnected.wait()
+            raise ConnectionResetError()
+
+        def close(self):
+            self.closed = True
+            self.disconnected.set()
+
+    writer = _StalledWriter()
+    stream = _SocketStream(writer, max_pending=10)
+    stream.write("0123456789\n")
+    await asyncio.sleep(0)
+
+    # Act
+    stream.write("abcdef\n")
+    stream.write("ghijkl\n")
+    await stream.aclose()
+
+    # Assert
+    assert writer.closed
+    assert writer.written == [b"0123456789\n"]
+
+
+@pytest.mark.asyncio
+async def test_handle_should_clear_import_cache_when_run_is_requested(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(ImportPlugin, "_cache", {("import stale", str(tmp_path)): object()})
+    server, address = await _start_server()
+
+    # Act
+    async with server:
+        await run_remote(address, str(_write_mgx_file(tmp_path)), {"name": "Ada"}, "text", io.StringIO())
+
+    # Assert
+    assert ImportPlugin._cache == {}
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from lime_ai.app.cli_main import cli
+
+# Generous enough for a cold CI machine; a regression that pulls in the SDK or the UI blows well past it.
+IMPORT_BUDGET_MS = 400
+
+# Modules only the commands that run agents (or render the UI) may load.
+HEAVY_MODULES = ("textual", "rich", "copilot", "pydantic", "wireup", "loguru", "lime_ai.app.container")
+
+
+def _import_profile(module: str) -> tuple[set[str], dict[str, int]]:
+    """Import `module` in a fresh interpreter; return the loaded modules and each one's cumulative import time (µs)."""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return set(result.stdout.split()), cumulative
+
+
+def _report(cumulative: dict[str, int], top: int = 15) -> str:
+    slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:top]
+    return "\n".join(f"{us / 1000:8.1f} ms  {name}" for name, us in slowest)
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "lime_ai.app.cli_main",
+        "lime_ai.app.cli.agents.execute",
+        "lime_ai.app.cli.agents.remote",
+        "lime_ai.app.cli.prompts.commands",
+    ],
+)
+def test_cli_module_should_not_import_heavy_dependencies_when_imported(module):
+    # Act
+    loaded, cumulative = _import_profile(module)
+
+    # Assert
+    heavy = [name for name in HEAVY_MODULES if name in loaded]
+    assert not heavy, f"{module} imports {heavy}; slowest imports:\n{_report(cumulative)}"
+    assert cumulative[module] / 1000 < IMPORT_BUDGET_MS, f"{module} is over budget:\n{_report(cumulative)}"
+
+
+def test_prompts_check_should_not_import_copilot_when_resolving_prompt_integrity(tmp_path):
+    # Arrange
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from lime_ai.app.cli_main import cli\n"
+        "result = CliRunner().invoke(cli, ['prompts', 'check'])\n"
+        "print(result.output, file=sys.stderr)\n"
+        "print('\\n'.join(sys.modules))"
+    )
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=tmp_path)
+
+    # Assert
+    loaded = set(result.stdout.split())
+    assert "lime_ai.libs.prompt_integrity.filesystem_integrity_service" in loaded, result.stderr
+    assert not [name for name in loaded if name == "copilot" or name.startswith(("copilot.", "lime_ai.libs.copilot"))]
+
+
+def test_cli_should_list_lazy_subcommands_when_asked_for_help():
+    # Act
+    result = CliRunner().invoke(cli, ["--help"])
+
+    # Assert
+    assert result.exit_code == 0
+    for command in ("execute", "execute-batch", "serve", "prompts"):
+        assert command in result.output
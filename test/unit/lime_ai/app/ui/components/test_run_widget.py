@@ -1,11 +1,13 @@
 import io
 
 from rich.console import Console, Group
+from rich.markdown import Markdown
 
 from lime_ai.app.config import AppConfig
+from lime_ai.app.ui.components.run_widget.incremental_markdown import IncrementalMarkdown
 from lime_ai.app.ui.components.run_widget.run_widget_content import RunWidgetContent
-from lime_ai.entities.function import FunctionCall
 from lime_ai.entities.run import ContentBlock, ContentBlockType, Run, RunStatus, TokenUsage
+from lime_ai.entities.text_buffer import TextBuffer
 
 
 def _create_writer() -> RunWidgetContent:
@@ -99,9 +101,6 @@ def test_render_run_should_skip_reasoning_blocks():
     assert "Public response" in output
 
 
-# --- render_function_calls ---
-
-
 def test_render_run_should_include_logging_blocks():
     # Arrange
     writer = _create_writer()
@@ -120,71 +119,95 @@ def test_render_run_should_include_logging_blocks():
     assert "Log message" in output
 
 
-def test_render_function_calls_should_include_method_name():
+def test_should_render_should_return_false_when_run_unchanged():
     # Arrange
     writer = _create_writer()
-    function_calls = [FunctionCall(method="my_func", params='{"x": 1}', result="42")]
+    run = Run(status=RunStatus.RUNNING, provider="local", tool_calls=[])
+    run.content_blocks.append(ContentBlock(type=ContentBlockType.RESPONSE, text="Hi"))
 
     # Act
-    parts = writer.render_function_calls(function_calls)
+    first = writer.should_render(run)
+    second = writer.should_render(run)
+    run.content_blocks[-1].append(" there")
+    third = writer.should_render(run)
 
     # Assert
-    output = _render_parts_to_str(parts)
-    assert "my_func" in output
+    assert (first, second, third) == (True, False, True)
 
 
-def test_render_function_calls_should_include_params():
+def test_render_sections_should_reuse_unchanged_sections_when_last_block_streams():
     # Arrange
     writer = _create_writer()
-    function_calls = [FunctionCall(method="my_func", params='{"x": 1}', result="42")]
+    logging = ContentBlock(type=ContentBlockType.LOGGING, text="started")
+    response = ContentBlock(type=ContentBlockType.RESPONSE, text="Hello")
+    run = Run(status=RunStatus.RUNNING, provider="local", content_blocks=[logging, response])
+    first = dict(writer.render_sections(run, AppConfig()))
 
     # Act
-    parts = writer.render_function_calls(function_calls)
+    response.append(" world")
+    second = dict(writer.render_sections(run, AppConfig()))
 
     # Assert
-    output = _render_parts_to_str(parts)
-    assert '"x": 1' in output
+    assert second["block-0"] is first["block-0"]
+    assert second["block-1"] is not first["block-1"]
 
 
-def test_render_function_calls_should_include_result():
+def test_incremental_markdown_should_keep_completed_paragraphs_when_text_grows():
     # Arrange
-    writer = _create_writer()
-    function_calls = [FunctionCall(method="my_func", params='{"x": 1}', result="Result value")]
+    buffer = TextBuffer("# Title\n\nFirst paragraph\n\nSecond")
+    markdown = IncrementalMarkdown()
+    first = markdown.update(buffer)
 
     # Act
-    parts = writer.render_function_calls(function_calls)
+    buffer.append(" paragraph keeps growing")
+    second = markdown.update(buffer)
 
     # Assert
-    output = _render_parts_to_str(parts)
-    assert "Result value" in output
+    assert len(second) == 2
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert "keeps growing" in _render_parts_to_str(second)
 
 
-def test_render_function_calls_should_handle_empty_list():
+def test_incremental_markdown_should_not_split_inside_code_fence_when_fence_has_blank_line():
     # Arrange
-    writer = _create_writer()
-    function_calls = []
+    buffer = TextBuffer("```python\nx = 1\n\ny = 2\n")
+    markdown = IncrementalMarkdown()
 
     # Act
-    parts = writer.render_function_calls(function_calls)
+    parts = markdown.update(buffer)
 
     # Assert
-    assert parts == []
+    assert len(parts) == 1
 
 
-def test_render_function_calls_should_handle_multiple_calls():
+def test_incremental_markdown_should_keep_list_continuation_in_list_when_paragraph_is_indented():
     # Arrange
-    writer = _create_writer()
-    function_calls = [
-        FunctionCall(method="func1", params='{"a": 1}', result="result1"),
-        FunctionCall(method="func2", params='{"b": 2}', result="result2"),
+    text = "- first item\n\n  continued paragraph\n\n- second item\n\nAfter the list\n"
+    markdown = IncrementalMarkdown()
+    buffer = TextBuffer()
+
+    # Act
+    for character in text:
+        buffer.append(character)
+        parts = markdown.update(buffer)
+
+    # Assert
+    assert [part.markup for part in parts] == [
+        "- first item\n\n  continued paragraph\n\n- second item\n\n",
+        "After the list\n",
     ]
 
+
+def test_incremental_markdown_should_render_whole_text_when_final():
+    # Arrange
+    buffer = TextBuffer("# Title\n\nFirst paragraph\n\nSecond\n")
+    markdown = IncrementalMarkdown()
+    markdown.update(buffer)
+
     # Act
-    parts = writer.render_function_calls(function_calls)
+    parts = markdown.update(buffer, final=True)
 
     # Assert
-    output = _render_parts_to_str(parts)
-    assert "func1" in output
-    assert "func2" in output
-    assert "result1" in output
-    assert "result2" in output
+    assert len(parts) == 1
+    assert _render_parts_to_str(parts) == _render_parts_to_str([Markdown(buffer.text)])
@@ -0,0 +1,204 @@
+from datetime import datetime
+
+import pytest
+from textual.widgets import Static
+
+from lime_ai.app.config import AppConfig
+from lime_ai.app.ui.app import LimeApp
+from lime_ai.app.ui.components.run_widget import RunWidget
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.entities.run import ContentBlock, ContentBlockType, RunStatus, TokenUsage
+
+
+def _create_app() -> tuple[LimeApp, ExecutionModel]:
+    model = ExecutionModel()
+    return LimeApp(model, AppConfig(ui_max_fps=1000)), model
+
+
+@pytest.mark.asyncio
+async def test_app_should_mount_run_widget_when_model_publishes_new_run(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    app, model = _create_app()
+
+    async with app.run_test() as pilot:
+        # Act
+        model.start_turn()
+        run = model.start_run("prompt", "local", RunStatus.RUNNING, datetime.now())
+        run.content_blocks.append(ContentBlock(type=ContentBlockType.RESPONSE, text="hello"))
+        model.notify_run_changed(run)
+        await pilot.pause(0.05)
+
+        # Assert
+        assert len(app._run_widgets) == 1
+        assert app._run_widgets[0]._run is run
+
+
+@pytest.mark.asyncio
+async def test_app_should_not_render_frames_when_model_does_not_change(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    app, model = _create_app()
+    frames = []
+
+    async with app.run_test() as pilot:
+        original = app._render_frame
+
+        async def counting_render_frame(full: bool = False):
+            frames.append(full)
+            await original(full)
+
+        monkeypatch.setattr(app, "_render_frame", counting_render_frame)
+
+        # Act
+        await pilot.pause(0.2)
+
+        # Assert
+        assert frames == []
+
+
+@pytest.mark.asyncio
+async def test_app_should_only_update_streaming_section_when_response_grows(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    app, model = _create_app()
+
+    async with app.run_test() as pilot:
+        model.start_turn()
+        run = model.start_run("prompt", "local", RunStatus.RUNNING, datetime.now())
+        run.add_log("started")
+        response = ContentBlock(type=ContentBlockType.RESPONSE, text="Hello")
+        run.content_blocks.append(response)
+        model.notify_run_changed(run)
+        await pilot.pause(0.05)
+        widget = app._run_widgets[0]
+        log_static, log_parts = widget._section_widgets["block-0"]
+
+        # Act
+        response.append(" world")
+        model.notify_run_changed(run)
+        await pilot.pause(0.05)
+
+        # Assert
+        assert widget._section_widgets["block-0"] == (log_static, log_parts)
+        assert len(widget.query_one("#run-content").children) == 2
+
+
+@pytest.mark.asyncio
+async def test_app_should_mount_only_window_of_runs_when_session_has_many_runs(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    model = ExecutionModel()
+    app = LimeApp(model, AppConfig(ui_max_fps=1000, ui_max_mounted_runs=4))
+
+    async with app.run_test() as pilot:
+        # Act
+        runs = []
+        for _ in range(10):
+            model.start_turn()
+            runs.append(model.start_run("prompt", "local", RunStatus.COMPLETED, datetime.now()))
+        await pilot.pause(0.05)
+
+        # Assert
+        assert len(app.query(RunWidget)) == 4
+        assert [widget._run for widget in app._widget_pool] == runs[6:]
+        assert app.query_one("#runs-before").display
+
+
+@pytest.mark.asyncio
+async def test_app_should_rebind_pooled_widgets_when_earlier_runs_are_requested(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    model = ExecutionModel()
+    app = LimeApp(model, AppConfig(ui_max_fps=1000, ui_max_mounted_runs=4))
+
+    async with app.run_test() as pilot:
+        runs = []
+        for _ in range(10):
+            model.start_turn()
+            runs.append(model.start_run("prompt", "local", RunStatus.COMPLETED, datetime.now()))
+        await pilot.pause(0.05)
+        pool = list(app._widget_pool)
+
+        # Act
+        await app._on_runs_before_clicked()
+        await pilot.pause(0.05)
+
+        # Assert
+        assert app._widget_pool == pool
+        assert [widget._run for widget in app._widget_pool] == runs[4:8]
+        assert app.query_one("#runs-after").display
+
+
+@pytest.mark.asyncio
+async def test_run_widget_should_drop_rendered_content_when_finished_run_is_collapsed(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    app, model = _create_app()
+
+    async with app.run_test() as pilot:
+        model.start_turn()
+        run = model.start_run("prompt", "local", RunStatus.RUNNING, datetime.now())
+        run.add_log("working")
+        model.notify_run_changed(run)
+        await pilot.pause(0.05)
+        widget = app._run_widgets[0]
+        assert widget._section_widgets
+
+        # Act
+        run.status = RunStatus.COMPLETED
+        run.is_expanded = False
+        model.notify_run_changed(run)
+        await pilot.pause(0.05)
+
+        # Assert
+        assert widget._section_widgets == {}
+        assert len(widget.query_one("#run-content").children) == 0
+
+
+@pytest.mark.asyncio
+async def test_app_should_show_completed_status_when_displayed_runs_finish(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    app, model = _create_app()
+
+    async with app.run_test() as pilot:
+        model.start_turn()
+        run = model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now())
+        await pilot.pause(0.05)
+        assert app._status_snippet is not None
+
+        # Act
+        run.tokens = TokenUsage(input_tokens=100, cache_read_tokens=25)
+        run.status = RunStatus.COMPLETED
+        model.notify_run_changed(run)
+        await pilot.pause(0.05)
+
+        # Assert
+        status = str(app.query_one("#status-line", Static).content)
+        assert "All turns completed" in status
+        assert "25% prompt cache hits" in status
+        assert app._status_snippet is None
+
+
+@pytest.mark.asyncio
+async def test_app_should_ignore_hedged_run_when_turn_shows_another_run(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("lime_ai.app.ui.app.save_app_config", lambda config: None)
+    app, model = _create_app()
+
+    async with app.run_test() as pilot:
+        turn = model.start_turn()
+        primary = model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now())
+        hedge = model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now())
+        turn.run = primary
+        await pilot.pause(0.05)
+
+        # Act
+        primary.status = RunStatus.COMPLETED
+        model.notify_run_changed(primary)
+        model.notify_run_changed(hedge)
+        await pilot.pause(0.05)
+
+        # Assert
+        assert "All turns completed" in str(app.query_one("#status-line", Static).content)
@@ -0,0 +1,113 @@
+import asyncio
+import io
+import json
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+
+from lime_ai.app.cli.writers.ndjson import NdjsonWriter
+from lime_ai.core.agents.models import ExecutionModel, InputRequest
+from lime_ai.entities.run import ContentBlock, ContentBlockType, RunError, RunStatus, ToolCall
+
+
+def _create_model() -> ExecutionModel:
+    model = ExecutionModel()
+    model.start()
+    return model
+
+
+def _start_run(model: ExecutionModel):
+    model.start_turn()
+    return model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now())
+
+
+def _events(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_render_ui_should_stream_run_lifecycle_as_ndjson_when_run_completes():
+    # Arrange
+    stream = io.StringIO()
+    sut = NdjsonWriter(stream, coalesce_ms=0)
+    model = _create_model()
+    task = asyncio.create_task(sut.render_ui(model))
+    await asyncio.sleep(0)
+
+    # Act
+    run = _start_run(model)
+    run.content_blocks.append(ContentBlock(type=ContentBlockType.RESPONSE, text="Hel"))
+    model.notify_run_changed(run)
+    await asyncio.sleep(0.01)
+    run.content_blocks[-1].append("lo")
+    run.start_tool_call(ToolCall(tool_name="grep", tool_call_id="t1", arguments={"q": "x"}))
+    run.errors.append(RunError(message="boom"))
+    model.notify_run_changed(run)
+    await asyncio.sleep(0.01)
+    run.complete_tool_call("t1", success=True, result="found", duration_ms=5.0)
+    run.status = RunStatus.COMPLETED
+    model.done = True
+    await asyncio.wait_for(task, timeout=1)
+
+    # Assert
+    events = _events(stream)
+    types = [event["type"] for event in events]
+    assert types == ["run_start", "delta", "delta", "tool_call", "error", "tool_result", "usage", "run_end", "done"]
+    assert [event["text"] for event in events if event["type"] == "delta"] == ["Hel", "lo"]
+    assert events[3]["arguments"] == {"q": "x"}
+    assert events[5]["result"] == "found"
+    assert events[7]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_render_ui_should_coalesce_deltas_when_changes_arrive_within_window():
+    # Arrange
+    stream = io.StringIO()
+    sut = NdjsonWriter(stream, coalesce_ms=20)
+    model = _create_model()
+    run = _start_run(model)
+    block = ContentBlock(type=ContentBlockType.RESPONSE)
+    run.content_blocks.append(block)
+    task = asyncio.create_task(sut.render_ui(model))
+    await asyncio.sleep(0)
+
+    # Act
+    for word in ["a", "b", "c"]:
+        block.append(word)
+        model.notify_run_changed(run)
+    await asyncio.sleep(0.05)
+    model.done = True
+    await asyncio.wait_for(task, timeout=1)
+
+    # Assert
+    deltas = [event for event in _events(stream) if event["type"] == "delta"]
+    assert [delta["text"] for delta in deltas] == ["abc"]
+
+
+def test_flush_should_report_pending_input_when_execution_needs_user():
+    # Arrange
+    stream = io.StringIO()
+    sut = NdjsonWriter(stream)
+    model = _create_model()
+    sut._model = model
+
+    # Act
+    model.pending_input = InputRequest(prompt="Name?")
+    sut.flush()
+
+    # Assert
+    assert _events(stream)[-1]["type"] == "input_requested"
+    assert _events(stream)[-1]["prompt"] == "Name?"
+
+
+def test_ndjson_writer_should_not_import_textual():
+    # Arrange
+    code = "import sys, lime_ai.app.cli.agents.execute_local; print('textual' in sys.modules)"
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    # Assert
+    assert result.stdout.strip() == "False"
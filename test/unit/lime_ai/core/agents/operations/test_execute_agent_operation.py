@@ -6,6 +6,7 @@ import pytest
 from lime_ai.core.agents.models import ExecutionModel
 from lime_ai.core.agents.operations import execute_agent_operation as operation_module
 from lime_ai.core.agents.operations.execute_agent_operation import ExecuteAgentOperation
+from lime_ai.core.agents.plugins.exec import ExecPlugin
 from lime_ai.core.agents.services.memory import MemoryService
 from lime_ai.core.interfaces.agent_plugin import AgentPlugin
 from lime_ai.entities.context import Context
@@ -890,3 +891,167 @@ async def test_execute_async_should_call_all_await_all_effects_regardless_of_ord
     # Assert
     assert ("x", "foo") in handled
     assert ("y", "bar") in handled
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_place_stable_text_first_when_prefix_cache_assembly_is_enabled(tmp_path):
+    # Arrange
+    operation = _create_operation()
+    operation.execution_model.context.set_variable("items", ["a", "b"])
+    operation.execution_model.context.set_variable("goal", "ship")
+    (tmp_path / "rules.mg").write_text("<<Follow the rules.>>")
+    mgx_content = """---
+context_assembly: prefix_cache
+---
+<<Goal: ${goal}>>
+for item in items:
+    <<Item: ${item}>>
+[[ rules.mg ]]
+<<You are a careful reviewer.>>
+"""
+
+    # Act
+    await operation.execute_async(mgx_content, base_path=tmp_path)
+
+    # Assert
+    context = operation.execution_model.context
+    assert context.window == "Follow the rules.\nYou are a careful reviewer.\nGoal: ship\nItem: a\nItem: b\n"
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_keep_document_order_when_prefix_cache_assembly_is_not_enabled():
+    # Arrange
+    operation = _create_operation()
+    operation.execution_model.context.set_variable("goal", "ship")
+    mgx_content = """<<Goal: ${goal}>>
+<<You are a careful reviewer.>>
+"""
+
+    # Act
+    await operation.execute_async(mgx_content)
+
+    # Assert
+    assert operation.execution_model.context.window == "Goal: ship\nYou are a careful reviewer.\n"
+
+
+class BudgetSpendingPlugin(AgentPlugin):
+    """Mock run plugin that records a costly run and enforces budgets like RunAgentPlugin."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_match(self, token: str) -> bool:
+        return token == "run"
+
+    async def handle(self, params: str, execution_model: ExecutionModel):
+        execution_model.apply_budget()
+        self.calls += 1
+        execution_model.current_run.total_cost += 1.0
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_stop_cleanly_when_budget_is_exceeded():
+    # Arrange
+    plugin = BudgetSpendingPlugin()
+    operation = _create_operation(plugins=[plugin])
+    operation.execution_model.context.set_variable("items", [1, 2, 3, 4])
+    mgx_content = """---
+max_cost: 2
+---
+for item in items:
+    @effect run
+"""
+
+    # Act
+    await operation.execute_async(mgx_content)
+
+    # Assert
+    assert plugin.calls == 2
+    assert operation.execution_model.done is True
+    assert "execution budget exceeded" in operation.execution_model.warnings[0]
+
+
+def _create_operation_with_exec(plugin: BudgetSpendingPlugin) -> ExecuteAgentOperation:
+    exec_plugin = ExecPlugin(plugin_factory=lambda: [plugin, exec_plugin], memory_service=MockMemoryService())
+    return _create_operation(plugins=[plugin, exec_plugin])
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_stop_parent_when_sub_execution_exceeds_parent_budget(tmp_path):
+    # Arrange
+    plugin = BudgetSpendingPlugin()
+    operation = _create_operation_with_exec(plugin)
+    operation.execution_model.context.set_variable("items", [1, 2, 3])
+    (tmp_path / "child.mgx").write_text("@effect run\n@effect run\n")
+    mgx_content = """---
+max_cost: 2
+---
+for item in items:
+    @effect exec child.mgx
+@effect run
+"""
+
+    # Act
+    await operation.execute_async(mgx_content, base_path=tmp_path)
+
+    # Assert
+    sub_executions = [
+        t.run for t in operation.execution_model.turns if t.run and t.run.is_sub_run and t.run.provider == "local"
+    ]
+    assert plugin.calls == 2
+    assert len(sub_executions) == 2
+    assert operation.execution_model.done is True
+    assert len(operation.execution_model.warnings) == 1
+    assert "execution budget exceeded" in operation.execution_model.warnings[0]
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_report_sub_execution_budget_stop_on_parent_when_child_budget_is_spent(tmp_path):
+    # Arrange
+    plugin = BudgetSpendingPlugin()
+    operation = _create_operation_with_exec(plugin)
+    (tmp_path / "child.mgx").write_text("---\nmax_cost: 1\n---\n@effect run\n@effect run\n")
+    mgx_content = """@effect exec child.mgx
+@effect run
+"""
+
+    # Act
+    await operation.execute_async(mgx_content, base_path=tmp_path)
+
+    # Assert
+    assert plugin.calls == 2
+    assert operation.execution_model.warnings == [
+        "exec: child.mgx: Stopping: execution budget exceeded (0 tokens, $1.00 used; limits - tokens, $1.0)"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_consume_async_generator_lazily_and_close_it_when_loop_breaks():
+    # Arrange
+    operation = _create_operation()
+    produced = []
+    closed = []
+
+    async def rows():
+        try:
+            for row in ["a", "b", "c", "d"]:
+                produced.append(row)
+                yield row
+        finally:
+            closed.append(True)
+
+    operation.execution_model.context.set_variable("rows", rows())
+    mgx_content = """
+for row in rows:
+    <<Row: ${row}>>
+    if row == "b":
+        break
+"""
+
+    # Act
+    await operation.execute_async(mgx_content)
+
+    # Assert
+    assert operation.execution_model.context.window == "Row: a\nRow: b\n"
+    assert produced == ["a", "b"]
+    assert closed == [True]
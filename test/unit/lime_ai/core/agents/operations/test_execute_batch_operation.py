@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from lime_ai.core.agents.models import ExecutionModel, InputRequest
+from lime_ai.core.agents.operations.execute_batch_operation import ExecuteBatchOperation
+from lime_ai.entities.batch import BatchJob, BatchJobStatus
+from lime_ai.entities.run import RunStatus, TokenUsage
+
+
+class _FakeOperation:
+    """Runs one agent turn that copies the `topic` input into its result, or follows the job's `mode`."""
+
+    active = 0
+    max_active = 0
+
+    def __init__(self, model: ExecutionModel):
+        self.model = model
+
+    async def execute_async(self, mgx_file: str, base_path: Path | None = None):
+        _FakeOperation.active += 1
+        _FakeOperation.max_active = max(_FakeOperation.max_active, _FakeOperation.active)
+        try:
+            await asyncio.sleep(0.01)
+            mode = self.model.context.data.get("mode")
+            if mode == "fail":
+                raise ValueError("bad agent")
+            if mode == "input":
+                await self.model.request_input(InputRequest(prompt="Name?"))
+
+            self.model.start_turn()
+            run = self.model.start_run(mgx_file, "copilot", RunStatus.RUNNING, datetime.now())
+            run.tokens = TokenUsage(input_tokens=10, output_tokens=5)
+            run.result = f"about {self.model.context.data.get('topic')}"
+            run.status = RunStatus.COMPLETED
+            self.model.context.set_variable("answer", run.result)
+        finally:
+            _FakeOperation.active -= 1
+
+
+def _create_jobs(tmp_path: Path, rows: list[dict]) -> list[BatchJob]:
+    mgx_path = tmp_path / "agent.mgx"
+    mgx_path.write_text("@effect run")
+    return [BatchJob(index=index, file=mgx_path, inputs=row) for index, row in enumerate(rows)]
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_seed_state_and_collect_results_when_jobs_complete(tmp_path):
+    # Arrange
+    sut = ExecuteBatchOperation(operation_factory=_FakeOperation, workers=2)
+    jobs = _create_jobs(tmp_path, [{"topic": "a"}, {"topic": "b"}])
+
+    # Act
+    summary = await sut.execute_async(jobs)
+
+    # Assert
+    assert [result.results for result in summary.results] == [["about a"], ["about b"]]
+    assert summary.results[1].state == {"topic": "b", "answer": "about b"}
+    assert summary.results[0].tokens == 15
+    assert summary.succeeded
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_limit_concurrency_when_workers_is_set(tmp_path):
+    # Arrange
+    _FakeOperation.max_active = 0
+    sut = ExecuteBatchOperation(operation_factory=_FakeOperation, workers=2)
+    jobs = _create_jobs(tmp_path, [{"topic": str(index)} for index in range(6)])
+
+    # Act
+    await sut.execute_async(jobs)
+
+    # Assert
+    assert _FakeOperation.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_async_should_report_failures_and_blocked_jobs_when_jobs_do_not_complete(tmp_path):
+    # Arrange
+    sut = ExecuteBatchOperation(operation_factory=_FakeOperation, workers=4)
+    jobs = _create_jobs(tmp_path, [{"mode": "fail"}, {"mode": "input"}, {"topic": "ok"}])
+    reported = []
+
+    # Act
+    summary = await asyncio.wait_for(sut.execute_async(jobs, on_result=reported.append), timeout=2)
+
+    # Assert
+    assert [result.status for result in summary.results] == [
+        BatchJobStatus.FAILED,
+        BatchJobStatus.NEEDS_INPUT,
+        BatchJobStatus.COMPLETED,
+    ]
+    assert summary.results[0].error == "bad agent"
+    assert len(reported) == 3
+    assert summary.to_dict()["failed"] == 1
+    assert not summary.succeeded
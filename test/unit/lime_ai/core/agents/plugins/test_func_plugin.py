@@ -1,9 +1,12 @@
+import inspect
 from datetime import datetime
 
 import pytest
 
 from lime_ai.core.agents.models import ExecutionModel
 from lime_ai.core.agents.plugins.func import FuncPlugin
+from lime_ai.core.agents.services.func_cache import FuncResultCache
+from lime_ai.core.agents.services.worker_pool import WorkerPool
 from lime_ai.entities.run import RunStatus
 
 
@@ -84,3 +87,125 @@ async def test_handle_should_run_func_when_valid():
     # The call result should be set and the context should contain the result variable
     assert call.result == 5
     assert execution_model.context.get_variable_value("sum_result") == 5
+
+
+@pytest.mark.asyncio
+async def test_handle_should_run_sync_function_on_worker_thread_when_worker_pool_is_given():
+    # Arrange
+    execution_model = _create_execution_model()
+    execution_model.context.set_variable("x", 4)
+    exec(
+        "import threading\ndef where(x, scale=1):\n    return threading.current_thread().name, x * scale",
+        execution_model.globals_dict,
+    )
+    pool = WorkerPool(mode="thread")
+    plugin = FuncPlugin(worker_pool=pool)
+
+    # Act
+    await plugin.handle("where(x, scale=2) => result", execution_model=execution_model)
+    pool.shutdown()
+
+    # Assert
+    thread_name, value = execution_model.context.get_variable_value("result")
+    assert thread_name.startswith("lime-worker")
+    assert value == 8
+
+
+@pytest.mark.asyncio
+async def test_handle_should_await_coroutine_function_when_worker_pool_is_given():
+    # Arrange
+    execution_model = _create_execution_model()
+    exec("async def fetch():\n    return 'data'", execution_model.globals_dict)
+    plugin = FuncPlugin(worker_pool=WorkerPool(mode="thread"))
+
+    # Act
+    await plugin.handle("fetch() => result", execution_model=execution_model)
+
+    # Assert
+    assert execution_model.context.get_variable_value("result") == "data"
+
+
+@pytest.mark.asyncio
+async def test_handle_should_consume_async_generator_into_list_when_result_is_async_generator():
+    # Arrange
+    execution_model = _create_execution_model()
+    exec("async def numbers(n):\n    for i in range(n):\n        yield i", execution_model.globals_dict)
+    execution_model.context.set_variable("n", 3)
+    plugin = FuncPlugin()
+
+    # Act
+    await plugin.handle("numbers(n) => values", execution_model=execution_model)
+
+    # Assert
+    assert execution_model.context.get_variable_value("values") == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_handle_should_advance_sync_generator_on_worker_thread_when_worker_pool_is_given():
+    # Arrange
+    execution_model = _create_execution_model()
+    exec(
+        "import threading\ndef names():\n    for _ in range(2):\n        yield threading.current_thread().name",
+        execution_model.globals_dict,
+    )
+    pool = WorkerPool(mode="process")
+    plugin = FuncPlugin(worker_pool=pool)
+
+    # Act
+    await plugin.handle("names() => values", execution_model=execution_model)
+    pool.shutdown()
+
+    # Assert
+    values = execution_model.context.get_variable_value("values")
+    assert len(values) == 2
+    assert all(name.startswith("lime-worker") for name in values)
+
+
+@pytest.mark.asyncio
+async def test_handle_should_store_generator_unconsumed_when_result_is_marked_stream():
+    # Arrange
+    execution_model = _create_execution_model()
+    exec("def numbers():\n    yield 1\n    yield 2", execution_model.globals_dict)
+    plugin = FuncPlugin()
+
+    # Act
+    await plugin.handle("numbers() => values stream", execution_model=execution_model)
+
+    # Assert
+    values = execution_model.context.get_variable_value("values")
+    assert inspect.isgenerator(values)
+    assert list(values) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_handle_should_reuse_result_when_cached_call_repeats_with_same_arguments():
+    # Arrange
+    execution_model = _create_execution_model()
+    execution_model.context.set_variable("folder", "docs")
+    exec("calls = []\ndef load(folder):\n    calls.append(folder)\n    return [folder]", execution_model.globals_dict)
+    plugin = FuncPlugin(cache=FuncResultCache())
+
+    # Act
+    await plugin.handle("cached load(folder) => files", execution_model=execution_model)
+    await plugin.handle("cached load(folder) => files", execution_model=execution_model)
+
+    # Assert
+    assert execution_model.globals_dict["calls"] == ["docs"]
+    assert execution_model.context.get_variable_value("files") == ["docs"]
+
+
+@pytest.mark.asyncio
+async def test_handle_should_call_function_again_when_cache_is_invalidated():
+    # Arrange
+    execution_model = _create_execution_model()
+    execution_model.context.set_variable("folder", "docs")
+    exec("calls = []\ndef load(folder):\n    calls.append(folder)\n    return [folder]", execution_model.globals_dict)
+    plugin = FuncPlugin(cache=FuncResultCache())
+    await plugin.handle("cached ttl=600 load(folder) => files", execution_model=execution_model)
+
+    # Act
+    await plugin.handle("invalidate load", execution_model=execution_model)
+    await plugin.handle("cached ttl=600 load(folder) => files", execution_model=execution_model)
+
+    # Assert
+    assert execution_model.globals_dict["calls"] == ["docs", "docs"]
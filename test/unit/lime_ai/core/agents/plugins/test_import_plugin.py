@@ -1,4 +1,7 @@
+import importlib
 import json
+import os
+import sys
 from os.path import join
 
 from lime_ai.core.agents.models import ExecutionModel
@@ -11,6 +14,29 @@ def _create_execution_model():
     return execution_model
 
 
+def _count_import_module_calls(monkeypatch) -> list[str]:
+    calls = []
+    import_module = importlib.import_module
+
+    def counting_import_module(name, *args, **kwargs):
+        calls.append(name)
+        return import_module(name, *args, **kwargs)
+
+    monkeypatch.setattr(importlib, "import_module", counting_import_module)
+    return calls
+
+
+def _create_cwd_package(root, name):
+    """A package whose body appends a line to `loads.txt` every time it runs."""
+    package = root / name
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "import os\nwith open(os.path.join(os.path.dirname(__file__), 'loads.txt'), 'a') as f:\n    f.write('x\\n')\n"
+    )
+    (package / "helpers.py").write_text("VALUE = 42\n")
+    return package
+
+
 def test_execute_import_should_import_module_when_import_statement():
     # Arrange
     execution_model = _create_execution_model()
@@ -70,3 +96,101 @@ def test_execute_import_should_add_error_when_invalid_statement():
     # Assert
     assert len(execution_model.import_errors) == 1
     assert "Only import statements are allowed" in execution_model.import_errors[0]
+
+
+def test_execute_import_should_resolve_statement_once_when_imported_repeatedly(monkeypatch):
+    # Arrange
+    ImportPlugin.clear_cache()
+    calls = _count_import_module_calls(monkeypatch)
+    first, second = _create_execution_model(), _create_execution_model()
+
+    # Act
+    ImportPlugin.execute_import("import json as cached_json", first)
+    ImportPlugin.execute_import("import json as cached_json", second)
+
+    # Assert
+    assert calls == ["json"]
+    assert first.globals_dict["cached_json"] is json
+    assert second.globals_dict["cached_json"] is json
+
+
+def test_execute_import_should_replay_errors_without_retrying_when_failed_import_is_repeated(tmp_path, monkeypatch):
+    # Arrange
+    ImportPlugin.clear_cache()
+    monkeypatch.chdir(tmp_path)
+    calls = _count_import_module_calls(monkeypatch)
+    first, second = _create_execution_model(), _create_execution_model()
+
+    # Act
+    ImportPlugin.execute_import("import nonexistent_module_xyz", first)
+    ImportPlugin.execute_import("import nonexistent_module_xyz", second)
+
+    # Assert
+    assert calls.count("nonexistent_module_xyz") == 1
+    assert first.import_errors == second.import_errors
+    assert len(second.import_errors) == 1
+
+
+def test_execute_import_should_retry_when_package_is_created_after_failed_import(tmp_path, monkeypatch):
+    # Arrange
+    ImportPlugin.clear_cache()
+    monkeypatch.chdir(tmp_path)
+    first, second = _create_execution_model(), _create_execution_model()
+    ImportPlugin.execute_import("from lime_cwd_retry.helpers import VALUE", first)
+    _create_cwd_package(tmp_path, "lime_cwd_retry")
+
+    # Act
+    try:
+        ImportPlugin.execute_import("from lime_cwd_retry.helpers import VALUE", second)
+    finally:
+        sys.modules.pop("lime_cwd_retry", None)
+        sys.modules.pop("lime_cwd_retry.helpers", None)
+
+    # Assert
+    assert len(first.import_errors) == 1
+    assert second.import_errors == []
+    assert second.globals_dict["VALUE"] == 42
+
+
+def test_load_package_from_cwd_should_reuse_loaded_modules_when_loaded_again(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    package = _create_cwd_package(tmp_path, "lime_cwd_helpers")
+
+    # Act
+    try:
+        first = ImportPlugin._load_package_from_cwd("lime_cwd_helpers", "lime_cwd_helpers.helpers")
+        second = ImportPlugin._load_package_from_cwd("lime_cwd_helpers", "lime_cwd_helpers.helpers")
+    finally:
+        sys.modules.pop("lime_cwd_helpers", None)
+        sys.modules.pop("lime_cwd_helpers.helpers", None)
+
+    # Assert
+    assert first is second
+    assert first.VALUE == 42
+    assert (package / "loads.txt").read_text() == "x\n"
+
+
+def test_execute_import_should_execute_module_again_when_its_file_was_edited(tmp_path, monkeypatch):
+    # Arrange
+    ImportPlugin.clear_cache()
+    monkeypatch.chdir(tmp_path)
+    package = _create_cwd_package(tmp_path, "lime_cwd_edited")
+    first, second = _create_execution_model(), _create_execution_model()
+    helpers = package / "helpers.py"
+
+    # Act
+    try:
+        ImportPlugin.execute_import("from lime_cwd_edited.helpers import VALUE", first)
+        helpers.write_text("VALUE = 43\n")
+        stat = helpers.stat()
+        os.utime(helpers, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        ImportPlugin.execute_import("from lime_cwd_edited.helpers import VALUE", second)
+    finally:
+        sys.modules.pop("lime_cwd_edited", None)
+        sys.modules.pop("lime_cwd_edited.helpers", None)
+
+    # Assert
+    assert first.globals_dict["VALUE"] == 42
+    assert second.globals_dict["VALUE"] == 43
+    assert (package / "loads.txt").read_text() == "x\n"
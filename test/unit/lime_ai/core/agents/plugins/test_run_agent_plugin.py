@@ -1,10 +1,14 @@
+import asyncio
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
 from lime_ai.core.agents.models import ExecutionModel
 from lime_ai.core.agents.plugins.run_agent import RunAgentPlugin
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
 from lime_ai.core.interfaces.query_service import QueryService
+from lime_ai.entities.run import RATE_LIMIT_ERROR_TYPE, RunError, RunStatus
 
 
 def _create_mock_agent_service():
@@ -52,5 +56,100 @@ async def test_handle_should_call_execute_query_and_start_turn_when_called():
     await plugin.handle("", execution_model=execution_model)
 
     # Assert
-    mock_service.execute_query.assert_awaited_once_with(execution_model=execution_model)
+    mock_service.execute_query.assert_awaited_once_with(execution_model=execution_model, options={})
     assert len(execution_model.turns) == initial_turn_count + 1
+
+
+@pytest.mark.asyncio
+async def test_handle_should_report_run_errors_to_scheduler_when_scheduled():
+    # Arrange
+    scheduler = RequestScheduler(max_concurrency=4)
+    execution_model = _create_execution_model()
+    execution_model.start_turn()
+    mock_service = _create_mock_agent_service()
+
+    async def _execute_query(execution_model, options=None):
+        run = execution_model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now(UTC))
+        run.errors.append(RunError(message="rate limited", code="429", error_type=RATE_LIMIT_ERROR_TYPE))
+
+    mock_service.execute_query.side_effect = _execute_query
+    plugin = RunAgentPlugin(agent_service=mock_service, scheduler=scheduler)
+
+    # Act
+    await plugin.handle("", execution_model=execution_model)
+
+    # Assert
+    assert scheduler.limit == 2
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_handle_should_not_throttle_scheduler_when_run_fails_for_other_reasons():
+    # Arrange
+    scheduler = RequestScheduler(max_concurrency=4)
+    execution_model = _create_execution_model()
+    execution_model.start_turn()
+    mock_service = _create_mock_agent_service()
+
+    async def _execute_query(execution_model, options=None):
+        run = execution_model.start_run("prompt", "copilot", RunStatus.ERROR, datetime.now(UTC))
+        run.errors.append(RunError(message="Run budget exceeded", code="budget", error_type="budget"))
+
+    mock_service.execute_query.side_effect = _execute_query
+    plugin = RunAgentPlugin(agent_service=mock_service, scheduler=scheduler)
+
+    # Act
+    await plugin.handle("", execution_model=execution_model)
+
+    # Assert
+    assert scheduler.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_handle_should_throttle_scheduler_when_rate_limited_query_raises():
+    # Arrange
+    scheduler = RequestScheduler(max_concurrency=4)
+    execution_model = _create_execution_model()
+    execution_model.start_turn()
+    mock_service = _create_mock_agent_service()
+
+    async def _execute_query(execution_model, options=None):
+        run = execution_model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now(UTC))
+        run.errors.append(RunError(message="429 Too Many Requests", code="429", error_type=RATE_LIMIT_ERROR_TYPE))
+        raise RuntimeError("429 Too Many Requests")
+
+    mock_service.execute_query.side_effect = _execute_query
+    plugin = RunAgentPlugin(agent_service=mock_service, scheduler=scheduler)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        await plugin.handle("", execution_model=execution_model)
+
+    # Assert
+    assert scheduler.limit == 2
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_handle_should_pass_each_call_its_own_options_when_runs_are_concurrent():
+    # Arrange
+    mock_service = _create_mock_agent_service()
+    seen: dict[str, dict] = {}
+
+    async def _execute_query(execution_model, options=None):
+        await asyncio.sleep(0.01 if options["timeout"] == "60" else 0)
+        seen[options["timeout"]] = dict(options)
+
+    mock_service.execute_query.side_effect = _execute_query
+    plugin = RunAgentPlugin(agent_service=mock_service)
+    execution_model = _create_execution_model()
+
+    # Act
+    await asyncio.gather(
+        plugin.handle("timeout=60 idle_timeout='15' oops", execution_model=execution_model),
+        plugin.handle("timeout=5", execution_model=execution_model),
+    )
+
+    # Assert
+    assert seen == {"60": {"timeout": "60", "idle_timeout": "15"}, "5": {"timeout": "5"}}
+    assert execution_model.warnings == ["Ignoring invalid @effect run option 'oops', expected key=value"]
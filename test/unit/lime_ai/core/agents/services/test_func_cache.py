@@ -0,0 +1,118 @@
+from lime_ai.core.agents.services.func_cache import FuncResultCache
+
+
+def _load(path: str) -> list[str]:
+    return [path]
+
+
+def _other(path: str) -> list[str]:
+    return []
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_should_return_stored_value_when_key_matches_same_function_and_arguments():
+    # Arrange
+    cache = FuncResultCache()
+    cache.set(cache.key_for(_load, ("docs",), {}), ["a.md"])
+
+    # Act
+    hit, value = cache.get(cache.key_for(_load, ("docs",), {}))
+
+    # Assert
+    assert hit is True
+    assert value == ["a.md"]
+
+
+def test_key_for_should_differ_when_arguments_or_function_differ():
+    # Arrange
+    cache = FuncResultCache()
+
+    # Act
+    keys = {
+        cache.key_for(_load, ("docs",), {}),
+        cache.key_for(_load, ("src",), {}),
+        cache.key_for(_other, ("docs",), {}),
+    }
+
+    # Assert
+    assert len(keys) == 3
+
+
+def test_key_for_should_return_none_when_arguments_cannot_be_pickled():
+    # Arrange
+    cache = FuncResultCache()
+
+    # Act
+    key = cache.key_for(_load, (lambda: None,), {})
+
+    # Assert
+    assert key is None
+
+
+def test_get_should_miss_when_entry_has_expired():
+    # Arrange
+    clock = _FakeClock()
+    cache = FuncResultCache(ttl=60, clock=clock)
+    key = cache.key_for(_load, ("docs",), {})
+    cache.set(key, ["a.md"])
+
+    # Act
+    clock.now += 61
+    hit, _ = cache.get(key)
+
+    # Assert
+    assert hit is False
+    assert len(cache) == 0
+
+
+def test_set_should_evict_least_recently_used_entry_when_cache_is_full():
+    # Arrange
+    cache = FuncResultCache(max_size=2)
+    first, second, third = (cache.key_for(_load, (name,), {}) for name in ("a", "b", "c"))
+    cache.set(first, 1)
+    cache.set(second, 2)
+    cache.get(first)
+
+    # Act
+    cache.set(third, 3)
+
+    # Assert
+    assert cache.get(first) == (True, 1)
+    assert cache.get(second) == (False, None)
+
+
+def test_get_should_read_entry_from_disk_when_cache_is_recreated(tmp_path):
+    # Arrange
+    key = FuncResultCache(directory=tmp_path).key_for(_load, ("docs",), {})
+    FuncResultCache(directory=tmp_path).set(key, ["a.md"])
+
+    # Act
+    hit, value = FuncResultCache(directory=tmp_path).get(key)
+
+    # Assert
+    assert hit is True
+    assert value == ["a.md"]
+
+
+def test_invalidate_should_remove_memory_and_disk_entries_of_named_function_only(tmp_path):
+    # Arrange
+    cache = FuncResultCache(directory=tmp_path)
+    load_key = cache.key_for(_load, ("docs",), {})
+    other_key = cache.key_for(_other, ("docs",), {})
+    cache.set(load_key, ["a.md"])
+    cache.set(other_key, [])
+
+    # Act
+    removed = cache.invalidate("_load")
+
+    # Assert
+    assert removed == 1
+    assert cache.get(load_key) == (False, None)
+    assert FuncResultCache(directory=tmp_path).get(other_key) == (True, [])
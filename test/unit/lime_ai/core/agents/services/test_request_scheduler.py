@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
+
+
+class FakeClock:
+    """Manually advanced clock for the token window."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _hold_slot(scheduler: RequestScheduler, priority: int, order: list[int], release: asyncio.Event):
+    async with scheduler.slot(priority=priority):
+        order.append(priority)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_slot_should_cap_in_flight_requests_when_limit_is_reached():
+    # Arrange
+    scheduler = RequestScheduler(max_concurrency=2)
+    release = asyncio.Event()
+    order: list[int] = []
+
+    # Act
+    tasks = [asyncio.create_task(_hold_slot(scheduler, 0, order, release)) for _ in range(3)]
+    await asyncio.sleep(0)
+    in_flight, queued = scheduler.in_flight, scheduler.queued
+    release.set()
+    await asyncio.gather(*tasks)
+
+    # Assert
+    assert (in_flight, queued) == (2, 1)
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_should_grant_lower_priority_value_first_when_queued():
+    # Arrange
+    scheduler = RequestScheduler(max_concurrency=1)
+    release = asyncio.Event()
+    order: list[int] = []
+    blocker = asyncio.create_task(_hold_slot(scheduler, 0, order, release))
+    await asyncio.sleep(0)
+
+    # Act
+    sub_run = asyncio.create_task(_hold_slot(scheduler, 1, order, release))
+    await asyncio.sleep(0)
+    parent_run = asyncio.create_task(_hold_slot(scheduler, 0, order, release))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocker, sub_run, parent_run)
+
+    # Assert
+    assert order == [0, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_release_should_halve_limit_when_throttled_and_grow_additively_when_successful():
+    # Arrange
+    scheduler = RequestScheduler(max_concurrency=8)
+
+    # Act
+    async with scheduler.slot() as ticket:
+        ticket.throttled = True
+    after_throttle = scheduler.limit
+    async with scheduler.slot():
+        pass
+
+    # Assert
+    assert after_throttle == 4
+    assert scheduler.limit == pytest.approx(4.25)
+
+
+@pytest.mark.asyncio
+async def test_slot_should_wait_when_tokens_per_minute_budget_is_spent():
+    # Arrange
+    clock = FakeClock()
+    scheduler = RequestScheduler(max_concurrency=4, tokens_per_minute=100, clock=clock)
+    async with scheduler.slot(estimated_tokens=10) as ticket:
+        ticket.tokens = 90
+
+    # Act
+    waiter = asyncio.create_task(_hold_slot_with_tokens(scheduler, 20))
+    await asyncio.sleep(0)
+    blocked = not waiter.done()
+    clock.now = 61.0
+    scheduler._dispatch()
+    await waiter
+
+    # Assert
+    assert blocked is True
+    assert scheduler.tokens_in_window() == 20
+
+
+async def _hold_slot_with_tokens(scheduler: RequestScheduler, tokens: int):
+    async with scheduler.slot(estimated_tokens=tokens):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_slot_should_free_queue_position_when_waiter_is_cancelled():
+    # Arrange
+    scheduler = RequestScheduler(max_concurrency=1)
+    release = asyncio.Event()
+    order: list[int] = []
+    blocker = asyncio.create_task(_hold_slot(scheduler, 0, order, release))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_hold_slot(scheduler, 1, order, release))
+    await asyncio.sleep(0)
+
+    # Act
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    release.set()
+    await blocker
+
+    # Assert
+    assert scheduler.queued == 0
+    assert scheduler.in_flight == 0
+    assert order == [0]
@@ -0,0 +1,115 @@
+from datetime import datetime
+
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.entities.run import ContentBlock, ContentBlockType, Run, RunStatus, ToolCall
+
+
+def _create_run(text: str = "answer", status: RunStatus = RunStatus.COMPLETED) -> Run:
+    run = Run(prompt="context " * 100, status=status, result=text, title=text)
+    run.content_blocks.append(ContentBlock(type=ContentBlockType.RESPONSE, text=text))
+    run.start_tool_call(ToolCall(tool_name="grep", tool_call_id="t1", result="found", success=True))
+    return run
+
+
+def test_spill_should_keep_summary_and_drop_content_when_more_runs_than_keep(tmp_path):
+    # Arrange
+    sut = RunArchive(keep=1, directory=tmp_path)
+    old, new = _create_run("old"), _create_run("new")
+    sut.track(old)
+    sut.track(new)
+
+    # Act
+    spilled = sut.spill()
+
+    # Assert
+    assert spilled == 1
+    assert old.archived is not None
+    assert old.content_blocks == [] and old.prompt is None and old.tool_calls == []
+    assert old.result == "old" and old.status == RunStatus.COMPLETED
+    assert new.archived is None and new.content_blocks[0].text == "new"
+    assert sut.journal_size > 0
+
+
+def test_spill_should_keep_run_in_memory_when_it_is_still_running(tmp_path):
+    # Arrange
+    sut = RunArchive(keep=1, directory=tmp_path)
+    running = _create_run(status=RunStatus.RUNNING)
+    sut.track(running)
+    sut.track(_create_run())
+
+    # Act
+    spilled = sut.spill()
+
+    # Assert
+    assert spilled == 0
+    assert running.content_blocks
+
+
+def test_ensure_content_should_restore_spilled_content_when_run_is_archived(tmp_path):
+    # Arrange
+    sut = RunArchive(keep=1, directory=tmp_path)
+    run = _create_run("old")
+    sut.track(run)
+    sut.track(_create_run("new"))
+    sut.spill()
+
+    # Act
+    run.ensure_content()
+
+    # Assert
+    assert run.archived is None
+    assert run.prompt.startswith("context")
+    assert run.content_blocks[0].text == "old"
+    assert run.get_tool_call("t1").result == "found"
+
+
+def test_spill_should_reuse_journal_record_when_restored_run_is_unchanged(tmp_path):
+    # Arrange
+    sut = RunArchive(keep=1, directory=tmp_path)
+    run = _create_run("old")
+    sut.track(run)
+    sut.track(_create_run("new"))
+    sut.spill()
+    record = run.archived
+    run.ensure_content()
+    sut.track(_create_run("newer"))
+
+    # Act
+    sut.spill()
+
+    # Assert
+    assert run.archived is record
+
+
+def test_spill_should_do_nothing_when_keep_is_zero(tmp_path):
+    # Arrange
+    sut = RunArchive(keep=0, directory=tmp_path)
+    run = _create_run()
+    sut.track(run)
+
+    # Act
+    spilled = sut.spill()
+
+    # Assert
+    assert spilled == 0
+    assert run.archived is None
+
+
+def test_start_run_should_spill_older_finished_runs_when_model_has_archive(tmp_path):
+    # Arrange
+    model = ExecutionModel()
+    model.run_archive = RunArchive(keep=2, directory=tmp_path)
+    runs = []
+    for _ in range(3):
+        model.start_turn()
+        run = model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now())
+        run.status = RunStatus.COMPLETED
+        runs.append(run)
+
+    # Act
+    model.start_turn()
+    model.start_run("prompt", "copilot", RunStatus.RUNNING, datetime.now())
+
+    # Assert
+    assert [run.archived is not None for run in runs] == [True, True, False]
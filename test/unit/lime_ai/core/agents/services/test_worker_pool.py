@@ -0,0 +1,152 @@
+import asyncio
+import gc
+import os
+import threading
+import weakref
+
+import pytest
+
+from lime_ai.core.agents.services.worker_pool import WorkerPool
+
+
+def _current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def _worker_pid(_payload) -> int:
+    return os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_call_should_run_sync_function_in_worker_thread_when_mode_is_thread():
+    # Arrange
+    pool = WorkerPool(mode="thread", max_workers=2)
+
+    # Act
+    thread_name = await pool.call(_current_thread_name)
+    pool.shutdown()
+
+    # Assert
+    assert thread_name.startswith("lime-worker")
+
+
+@pytest.mark.asyncio
+async def test_call_should_keep_event_loop_responsive_when_function_blocks():
+    # Arrange
+    pool = WorkerPool(mode="thread")
+    release = threading.Event()
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while not release.is_set():
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    # Act
+    ticker = asyncio.create_task(tick())
+    blocked = asyncio.create_task(pool.call(release.wait, 1))
+    await asyncio.sleep(0.02)
+    release.set()
+    await asyncio.gather(ticker, blocked)
+    pool.shutdown()
+
+    # Assert
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_call_should_await_coroutine_function_on_event_loop():
+    # Arrange
+    pool = WorkerPool(mode="thread")
+
+    async def fetch(value):
+        return _current_thread_name(), value
+
+    # Act
+    thread_name, value = await pool.call(fetch, 3)
+
+    # Assert
+    assert thread_name == threading.current_thread().name
+    assert value == 3
+
+
+@pytest.mark.asyncio
+async def test_call_should_fall_back_to_threads_when_function_cannot_be_pickled_in_process_mode():
+    # Arrange
+    pool = WorkerPool(mode="process", max_workers=1)
+
+    # Act
+    result = await pool.call(lambda: _current_thread_name())
+    pool.shutdown()
+
+    # Assert
+    assert result.startswith("lime-worker")
+
+
+@pytest.mark.asyncio
+async def test_call_should_run_in_worker_process_when_job_can_be_pickled_in_process_mode():
+    # Arrange
+    pool = WorkerPool(mode="process", max_workers=1)
+
+    # Act
+    pid = await pool.call(_worker_pid, list(range(1000)))
+    pool.shutdown()
+
+    # Assert
+    assert pid != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_call_should_fall_back_to_threads_when_arguments_cannot_be_pickled_in_process_mode():
+    # Arrange
+    pool = WorkerPool(mode="process", max_workers=1)
+
+    # Act
+    pid = await pool.call(_worker_pid, threading.Lock())
+    pool.shutdown()
+
+    # Assert
+    assert pid == os.getpid()
+
+
+def test_wrap_should_return_same_async_wrapper_when_called_twice():
+    # Arrange
+    pool = WorkerPool(mode="thread")
+
+    # Act
+    first = pool.wrap(_square)
+    second = pool.wrap(_square)
+
+    # Assert
+    assert first is second
+    assert asyncio.iscoroutinefunction(first)
+    assert first.__wrapped__ is _square
+
+
+def test_init_should_raise_when_mode_is_unknown():
+    # Act / Assert
+    with pytest.raises(ValueError, match="Unknown worker pool mode"):
+        WorkerPool(mode="fibers")
+
+
+def test_wrap_should_not_keep_function_alive_when_function_is_released():
+    # Arrange
+    pool = WorkerPool(mode="thread")
+
+    def helper():
+        return 1
+
+    pool.wrap(helper)
+    reference = weakref.ref(helper)
+
+    # Act
+    del helper
+    gc.collect()
+
+    # Assert
+    assert reference() is None
@@ -3,7 +3,10 @@ from datetime import datetime
 
 import pytest
 
-from lime_ai.core.agents.models import ExecutionModel, Turn
+from lime_ai.core.agents.models import ExecutionModel, InputRequest, Turn
+from lime_ai.core.agents.plugins.exec import _MirroredTurnList, _SubExecutionModel
+from lime_ai.entities.budget import Budget, BudgetExceeded, BudgetPolicy
+from lime_ai.entities.change_feed import ChangeKind
 from lime_ai.entities.run import RunStatus
 
 
@@ -127,3 +130,106 @@ async def test_add_import_error_should_append_error_when_called():
     assert len(model.import_errors) == 2
     assert model.import_errors[0] == "ModuleNotFoundError: No module named 'foo'"
     assert model.import_errors[1] == "ImportError: cannot import name 'bar'"
+
+
+def _add_run(model: ExecutionModel, tokens: int, cost: float = 0.0):
+    model.start_turn()
+    run = model.start_run("prompt", "copilot", RunStatus.COMPLETED, datetime.now())
+    run.tokens.input_tokens = tokens
+    run.total_cost = cost
+
+
+def test_apply_budget_should_raise_when_execution_budget_is_exceeded():
+    # Arrange
+    model = _create_execution_model()
+    model.budget = BudgetPolicy(execution=Budget(max_cost=1.0))
+    _add_run(model, tokens=10, cost=1.2)
+
+    # Act / Assert
+    with pytest.raises(BudgetExceeded, match="execution budget exceeded"):
+        model.apply_budget()
+
+
+def test_apply_budget_should_switch_to_fallback_model_when_budget_is_nearly_spent():
+    # Arrange
+    model = _create_execution_model()
+    model.metadata = {"model": "gpt-5"}
+    model.budget = BudgetPolicy(execution=Budget(max_tokens=1000), fallback_model="gpt-5-mini")
+    _add_run(model, tokens=850)
+
+    # Act
+    model.apply_budget()
+
+    # Assert
+    assert model.model == "gpt-5-mini"
+    assert len(model.warnings) == 1
+
+
+def test_apply_budget_should_only_count_runs_since_loop_start_when_checking_loop_budget():
+    # Arrange
+    model = _create_execution_model()
+    model.budget = BudgetPolicy(loop=Budget(max_tokens=100))
+    _add_run(model, tokens=500)
+    model.loop_starts.append(len(model.turns))
+    _add_run(model, tokens=60)
+
+    # Act
+    model.apply_budget()
+    _add_run(model, tokens=60)
+
+    # Assert
+    with pytest.raises(BudgetExceeded, match="loop budget"):
+        model.apply_budget()
+
+
+def test_apply_budget_should_enforce_parent_budget_when_called_on_sub_execution():
+    # Arrange
+    parent = _create_execution_model()
+    parent.budget = BudgetPolicy(execution=Budget(max_tokens=100))
+    _add_run(parent, tokens=50)
+    child = _SubExecutionModel("exec: child.mgx", parent_model=parent)
+    child.turns = _MirroredTurnList(parent.turns)
+    _add_run(child, tokens=60)
+
+    # Act / Assert
+    with pytest.raises(BudgetExceeded):
+        child.apply_budget()
+
+
+def test_start_run_should_publish_run_added_with_run_when_run_starts():
+    # Arrange
+    model = _create_execution_model()
+    model.start_turn()
+
+    # Act
+    run = model.start_run("prompt", "local", RunStatus.RUNNING, datetime.now())
+
+    # Assert
+    changes = model.changes.drain()
+    assert ChangeKind.RUN_ADDED in changes.kinds
+    assert list(changes.runs.values()) == [run]
+
+
+def test_pending_input_should_publish_overlay_change_when_set():
+    # Arrange
+    model = _create_execution_model()
+
+    # Act
+    model.pending_input = InputRequest(prompt="Name?")
+
+    # Assert
+    assert model.changes.drain().kinds == {ChangeKind.OVERLAY}
+
+
+def test_sub_execution_should_publish_on_parent_feed_when_run_starts():
+    # Arrange
+    parent = _create_execution_model()
+    child = _SubExecutionModel(exec_title="exec: child.mgx", parent_model=parent)
+    child.turns = _MirroredTurnList(parent.turns)
+    child.start_turn()
+
+    # Act
+    child.start_run("prompt", "local", RunStatus.RUNNING, datetime.now())
+
+    # Assert
+    assert ChangeKind.RUN_ADDED in parent.changes.drain().kinds
@@ -0,0 +1,36 @@
+import pytest
+
+from lime_ai.entities.budget import Budget, BudgetPolicy
+
+
+def test_from_metadata_should_parse_quoted_front_matter_values():
+    # Arrange
+    metadata = {"max_tokens": '"100000"', "max_run_cost": "0.5", "max_loop_tokens": "2e4", "fallback_model": "'mini'"}
+
+    # Act
+    policy = BudgetPolicy.from_metadata(metadata)
+
+    # Assert
+    assert policy.execution == Budget(max_tokens=100000)
+    assert policy.run == Budget(max_cost=0.5)
+    assert policy.loop == Budget(max_tokens=20000)
+    assert policy.fallback_model == "mini"
+    assert policy.degrade_at == 0.8
+
+
+def test_from_metadata_should_raise_when_value_is_not_a_number():
+    # Act / Assert
+    with pytest.raises(ValueError, match="max_cost"):
+        BudgetPolicy.from_metadata({"max_cost": "a lot"})
+
+
+def test_usage_fraction_should_return_largest_share_of_any_limit():
+    # Arrange
+    budget = Budget(max_tokens=1000, max_cost=2.0)
+
+    # Act
+    fraction = budget.usage_fraction(tokens=500, cost=1.8)
+
+    # Assert
+    assert fraction == pytest.approx(0.9)
+    assert Budget().usage_fraction(tokens=10**9, cost=10**6) == 0
@@ -0,0 +1,61 @@
+from lime_ai.entities.change_feed import ChangeFeed, ChangeKind
+from lime_ai.entities.run import Run
+
+
+def test_publish_should_wake_subscriber_once_when_changes_arrive_before_drain():
+    # Arrange
+    feed = ChangeFeed()
+    wakes = []
+    feed.subscribe(lambda: wakes.append(1))
+
+    # Act
+    for _ in range(100):
+        feed.publish(ChangeKind.RUN_UPDATED)
+
+    # Assert
+    assert wakes == [1]
+
+
+def test_publish_should_wake_subscriber_again_when_changes_were_drained():
+    # Arrange
+    feed = ChangeFeed()
+    wakes = []
+    feed.subscribe(lambda: wakes.append(1))
+    feed.publish(ChangeKind.HEADER)
+    feed.drain()
+
+    # Act
+    feed.publish(ChangeKind.OVERLAY)
+
+    # Assert
+    assert wakes == [1, 1]
+
+
+def test_drain_should_return_changed_runs_and_clear_pending_changes():
+    # Arrange
+    feed = ChangeFeed()
+    run = Run()
+    feed.publish(ChangeKind.RUN_ADDED, run)
+    feed.publish(ChangeKind.RUN_UPDATED, run)
+
+    # Act
+    changes = feed.drain()
+
+    # Assert
+    assert changes.kinds == {ChangeKind.RUN_ADDED, ChangeKind.RUN_UPDATED}
+    assert list(changes.runs.values()) == [run]
+    assert not feed.drain()
+
+
+def test_subscribe_should_return_function_that_stops_notifications():
+    # Arrange
+    feed = ChangeFeed()
+    wakes = []
+    unsubscribe = feed.subscribe(lambda: wakes.append(1))
+
+    # Act
+    unsubscribe()
+    feed.publish(ChangeKind.DONE)
+
+    # Assert
+    assert wakes == []
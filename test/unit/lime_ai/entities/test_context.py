@@ -313,3 +313,20 @@ def test_replace_variables_in_content_should_leave_malformed_placeholder_unchang
 
     # Assert
     assert result == "Value: ${1invalid}"
+
+
+def test_window_should_order_stable_fragments_first_when_prefix_cache_enabled():
+    # Arrange
+    context = Context()
+    context.add_to_context_window("variant 1 ", stable=False)
+    context.add_to_context_window("stable ", stable=True)
+    context.add_to_context_window("variant 2", stable=False)
+
+    # Act
+    document_order = context.window
+    context.prefix_cache = True
+    cache_order = context.window
+
+    # Assert
+    assert document_order == "variant 1 stable variant 2"
+    assert cache_order == "stable variant 1 variant 2"
@@ -1,4 +1,4 @@
-from lime_ai.entities.run import TokenUsage
+from lime_ai.entities.run import ContentBlock, ContentBlockType, Run, TokenUsage, ToolCall
 
 
 def _create_token_usage(
@@ -49,3 +49,72 @@ def test_accumulate_should_add_values_when_called():
     assert usage.output_tokens == 60
     assert usage.cache_read_tokens == 20
     assert usage.cache_write_tokens == 10
+
+
+def test_content_block_append_should_extend_text_when_streaming():
+    # Arrange
+    block = ContentBlock(type=ContentBlockType.RESPONSE, text="Hello")
+
+    # Act
+    block.append(", ")
+    block.append("world")
+
+    # Assert
+    assert block.text == "Hello, world"
+    assert len(block.buffer) == 12
+
+
+def test_complete_tool_call_should_update_index_and_counters():
+    # Arrange
+    run = Run()
+    run.start_tool_call(ToolCall(tool_name="read", tool_call_id="a"))
+    run.start_tool_call(ToolCall(tool_name="write", tool_call_id="b"))
+
+    # Act
+    completed = run.complete_tool_call("a", result="ok", success=True, duration_ms=12.0)
+    run.complete_tool_call("b", result=None, success=False, duration_ms=3.0)
+    run.complete_tool_call("b", result=None, success=False, duration_ms=3.0)
+
+    # Assert
+    assert completed is run.get_tool_call("a")
+    assert completed.result == "ok"
+    assert run.tool_calls_started == 2
+    assert run.tool_calls_completed == 2
+    assert run.tool_calls_failed == 1
+    assert run.tool_calls_duration_ms == 15.0
+
+
+def test_complete_tool_call_should_return_none_when_id_unknown():
+    # Arrange
+    run = Run()
+
+    # Act
+    result = run.complete_tool_call("missing", result=None, success=True, duration_ms=None)
+
+    # Assert
+    assert result is None
+    assert run.tool_calls_completed == 0
+
+
+def test_run_should_index_tool_calls_when_constructed_with_them():
+    # Arrange
+    tool_call = ToolCall(tool_name="read", tool_call_id="a", success=True, duration_ms=5.0)
+
+    # Act
+    run = Run(tool_calls=[tool_call])
+
+    # Assert
+    assert run.get_tool_call("a") is tool_call
+    assert run.tool_calls_completed == 1
+
+
+def test_cache_hit_ratio_should_be_none_without_input_and_share_of_prompt_otherwise():
+    # Arrange
+    empty = TokenUsage()
+    inclusive = TokenUsage(input_tokens=1000, cache_read_tokens=800)
+    exclusive = TokenUsage(input_tokens=200, cache_read_tokens=800)
+
+    # Act / Assert
+    assert empty.cache_hit_ratio is None
+    assert inclusive.cache_hit_ratio == 0.8
+    assert exclusive.cache_hit_ratio == 0.8
@@ -0,0 +1,61 @@
+from lime_ai.entities.text_buffer import TextBuffer
+
+
+def test_append_should_accumulate_text_and_length():
+    # Arrange
+    buffer = TextBuffer("Hel")
+
+    # Act
+    buffer.append("lo")
+    buffer.append(" world")
+
+    # Assert
+    assert buffer.text == "Hello world"
+    assert len(buffer) == 11
+    assert buffer == "Hello world"
+
+
+def test_text_should_be_cached_until_next_append():
+    # Arrange
+    buffer = TextBuffer()
+    buffer.append("a")
+    buffer.append("b")
+
+    # Act
+    first = buffer.text
+    second = buffer.text
+    buffer.append("c")
+    third = buffer.text
+
+    # Assert
+    assert first is second
+    assert third == "abc"
+
+
+def test_tail_should_return_only_new_text_when_offset_given():
+    # Arrange
+    buffer = TextBuffer()
+    for chunk in ["one ", "two ", "three"]:
+        buffer.append(chunk)
+
+    # Act
+    from_offset = buffer.tail(6)
+    from_end = buffer.tail(-3)
+    past_end = buffer.tail(100)
+
+    # Assert
+    assert from_offset == "o three"
+    assert from_end == "ree"
+    assert past_end == ""
+
+
+def test_bool_should_be_false_when_empty():
+    # Arrange
+    buffer = TextBuffer()
+
+    # Act
+    buffer.append("")
+
+    # Assert
+    assert not buffer
+    assert str(buffer) == ""
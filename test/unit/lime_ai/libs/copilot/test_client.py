@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+import lime_ai.libs.copilot.client as client_module
+from lime_ai.libs.copilot.client import GithubCopilotClient
+
+
+class FakeCopilotClient:
+    """Test double for the SDK client that records process lifecycle calls."""
+
+    instances: list["FakeCopilotClient"] = []
+
+    def __init__(self):
+        self.started = False
+        self.stopped = False
+        FakeCopilotClient.instances.append(self)
+
+    async def start(self):
+        self.started = True
+
+    async def force_stop(self):
+        self.stopped = True
+
+    async def create_session(self, config):
+        return object()
+
+
+@pytest.fixture(autouse=True)
+def _patch_sdk_client(monkeypatch):
+    FakeCopilotClient.instances = []
+    monkeypatch.setattr(client_module, "CopilotClient", FakeCopilotClient)
+
+
+@pytest.mark.asyncio
+async def test_start_connecting_should_not_spawn_client_until_loop_yields():
+    # Arrange
+    client = GithubCopilotClient()
+
+    # Act
+    client.start_connecting()
+    spawned_before_yield = len(FakeCopilotClient.instances)
+    await asyncio.sleep(0)
+
+    # Assert
+    assert spawned_before_yield == 0
+    assert FakeCopilotClient.instances[0].started is True
+
+
+@pytest.mark.asyncio
+async def test_disconnect_should_never_spawn_client_when_connect_has_not_run():
+    # Arrange
+    client = GithubCopilotClient()
+    client.start_connecting()
+
+    # Act
+    await client.disconnect()
+
+    # Assert
+    assert FakeCopilotClient.instances == []
+    assert client.con is None
+
+
+@pytest.mark.asyncio
+async def test_create_session_should_wait_for_background_connection():
+    # Arrange
+    client = GithubCopilotClient()
+    client.start_connecting()
+
+    # Act
+    session = await client.create_session({})
+
+    # Assert
+    assert session is not None
+    assert len(FakeCopilotClient.instances) == 1
+    assert client.con.started is True
@@ -1,9 +1,11 @@
+import asyncio
 from types import SimpleNamespace
 
 import pytest
 
 from lime_ai.core.agents.models import ExecutionModel
 from lime_ai.libs.copilot.copilot_agent import CopilotQuery
+from lime_ai.libs.copilot.session_pool import CopilotSessionPool
 
 
 class FakeSession:
@@ -45,6 +47,10 @@ class FakeClient:
 
     def __init__(self):
         self.con = FakeCon()
+        self.sessions = CopilotSessionPool()
+
+    async def ensure_connected(self):
+        return
 
 
 @pytest.mark.asyncio
@@ -87,3 +93,44 @@ async def test_execute_query_forwards_model_from_execution_model(monkeypatch):
 
     # Assert
     assert fake_client.con.received_model == "custom-model"
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_run_concurrently_when_called_for_different_executions(monkeypatch):
+    # Arrange
+    in_flight: list[int] = []
+    peak = 0
+
+    class SlowSession(FakeSession):
+        async def send_and_wait(self, msg, timeout=0):
+            nonlocal peak
+            in_flight.append(id(self))
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(id(self))
+            return SimpleNamespace(data=SimpleNamespace(content="ok"))
+
+    fake_client = FakeClient()
+
+    async def create_session(config):
+        return SlowSession()
+
+    fake_client.con.create_session = create_session
+
+    async def fake_tool(resolve_execution_model):
+        return "tool"
+
+    monkeypatch.setattr("lime_ai.libs.copilot.copilot_agent.create_get_variable_tool", fake_tool)
+    monkeypatch.setattr("lime_ai.libs.copilot.copilot_agent.create_set_variable_tool", fake_tool)
+    query = CopilotQuery(fake_client)
+    models = [ExecutionModel() for _ in range(3)]
+    for model in models:
+        model.start_turn()
+
+    # Act
+    results = await asyncio.gather(*(query.execute_query(model) for model in models))
+
+    # Assert
+    assert results == ["ok", "ok", "ok"]
+    assert peak == 3
+    assert fake_client.sessions.size == 3
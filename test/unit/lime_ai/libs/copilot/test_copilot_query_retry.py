@@ -0,0 +1,299 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from copilot.generated.session_events import SessionEventType
+
+from lime_ai.app.config import AppConfig
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.core.agents.plugins.run_agent import RunAgentPlugin
+from lime_ai.core.agents.services.request_scheduler import RequestScheduler
+from lime_ai.core.agents.services.run_archive import RunArchive
+from lime_ai.entities.run import RunStatus
+from lime_ai.libs.copilot.copilot_agent import CopilotQuery
+from lime_ai.libs.copilot.session_pool import CopilotSessionPool
+
+
+class ScriptedSession:
+    """Copilot session double whose send_and_wait follows a script of outcomes.
+
+    An outcome is an exception to raise, `(delay, content)`, or `(delay, content, tool_at)` to also start a
+    tool call `tool_at` seconds in; `content` may be an exception raised after the delay.
+    """
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.aborted = False
+        self.destroyed = False
+        self.handler = None
+
+    def on(self, handler):
+        self.handler = handler
+        return lambda: None
+
+    async def send_and_wait(self, msg, timeout=0):
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        delay, content, *tool_at = self.outcome
+        if tool_at:
+            await asyncio.sleep(tool_at[0])
+            self.handler(_tool_started_event())
+            delay -= tool_at[0]
+        await asyncio.sleep(delay)
+        if isinstance(content, BaseException):
+            raise content
+        return SimpleNamespace(data=SimpleNamespace(content=content))
+
+    async def abort(self):
+        self.aborted = True
+
+    async def destroy(self):
+        self.destroyed = True
+
+
+class SessionErrorSession(ScriptedSession):
+    """Session double that reports a SESSION_ERROR event and then finishes without content."""
+
+    async def send_and_wait(self, msg, timeout=0):
+        self.handler(SimpleNamespace(type=SessionEventType.SESSION_ERROR, data=self.outcome))
+        return None
+
+
+class ScriptedClient:
+    """Copilot client double that hands out one scripted session per create_session call."""
+
+    def __init__(self, outcomes: list, session_type: type[ScriptedSession] = ScriptedSession):
+        self.outcomes = list(outcomes)
+        self.session_type = session_type
+        self.created: list[ScriptedSession] = []
+        self.sessions = CopilotSessionPool()
+
+    async def ensure_connected(self):
+        return
+
+    async def create_session(self, config):
+        session = self.session_type(self.outcomes.pop(0))
+        self.created.append(session)
+        return session
+
+
+def _tool_started_event():
+    data = SimpleNamespace(tool_name="set_variable", tool_call_id="call-1", arguments={"name": "x"})
+    return SimpleNamespace(type=SessionEventType.TOOL_EXECUTION_START, data=data)
+
+
+def _create_query(client: ScriptedClient, monkeypatch, **config) -> CopilotQuery:
+    async def fake_tool(resolve_execution_model):
+        return "tool"
+
+    monkeypatch.setattr("lime_ai.libs.copilot.copilot_agent.create_get_variable_tool", fake_tool)
+    monkeypatch.setattr("lime_ai.libs.copilot.copilot_agent.create_set_variable_tool", fake_tool)
+    monkeypatch.setattr("lime_ai.libs.copilot.retry.random.uniform", lambda a, b: 0)
+    return CopilotQuery(client, app_config=AppConfig(run_retry_backoff=0.0, **config))
+
+
+def _create_execution_model() -> ExecutionModel:
+    execution_model = ExecutionModel()
+    execution_model.start_turn()
+    return execution_model
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_retry_on_new_session_when_attempt_times_out(monkeypatch):
+    # Arrange
+    client = ScriptedClient([TimeoutError("stuck"), (0, "ok")])
+    query = _create_query(client, monkeypatch)
+    execution_model = _create_execution_model()
+
+    # Act
+    result = await query.execute_query(execution_model)
+
+    # Assert
+    assert result == "ok"
+    assert client.created[0].aborted and client.created[0].destroyed
+    assert execution_model.current_run.status == RunStatus.COMPLETED
+    assert execution_model.current_run.errors[0].error_type == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_mark_run_error_when_all_attempts_time_out(monkeypatch):
+    # Arrange
+    client = ScriptedClient([TimeoutError("stuck"), TimeoutError("stuck")])
+    query = _create_query(client, monkeypatch, run_max_attempts=2)
+    execution_model = _create_execution_model()
+
+    # Act
+    result = await query.execute_query(execution_model)
+
+    # Assert
+    assert result == ""
+    assert execution_model.current_run.status == RunStatus.ERROR
+    assert len(client.created) == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_raise_without_retry_when_error_is_not_retryable(monkeypatch):
+    # Arrange
+    client = ScriptedClient([Exception("Session error: bad request"), (0, "ok")])
+    query = _create_query(client, monkeypatch)
+    execution_model = _create_execution_model()
+
+    # Act / Assert
+    with pytest.raises(Exception, match="bad request"):
+        await query.execute_query(execution_model)
+    assert len(client.created) == 1
+    assert [error.error_type for error in execution_model.current_run.errors] == ["session_error"]
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_keep_hedge_result_when_primary_is_slow(monkeypatch):
+    # Arrange
+    client = ScriptedClient([(1.0, "slow"), (0, "fast")])
+    query = _create_query(client, monkeypatch, hedge_percentile=0.9)
+    query.latencies.min_samples = 1
+    query.latencies.record(0.01)
+    execution_model = _create_execution_model()
+
+    # Act
+    result = await query.execute_query(execution_model)
+
+    # Assert
+    assert result == "fast"
+    assert execution_model.current_run.result == "fast"
+    assert client.created[0].aborted is True
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_time_out_when_session_sends_no_events_for_idle_timeout(monkeypatch):
+    # Arrange
+    client = ScriptedClient([(5.0, "stalled")])
+    query = _create_query(client, monkeypatch, run_max_attempts=1)
+    execution_model = _create_execution_model()
+
+    # Act
+    result = await query.execute_query(execution_model, options={"idle_timeout": "0.01"})
+
+    # Assert
+    assert result == ""
+    assert execution_model.current_run.status == RunStatus.ERROR
+    assert client.created[0].aborted is True
+
+
+def test_timeouts_should_prefer_run_options_over_front_matter_over_app_config(monkeypatch):
+    # Arrange
+    query = _create_query(ScriptedClient([]), monkeypatch, run_timeout=300, run_idle_timeout=120)
+    execution_model = _create_execution_model()
+    execution_model.metadata = {"timeout": '"600"', "idle_timeout": "30"}
+
+    # Act
+    timeouts = query._timeouts(execution_model, {"idle_timeout": "5"})
+
+    # Assert
+    assert timeouts == (600.0, 5.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_not_hedge_when_primary_already_called_a_tool(monkeypatch):
+    # Arrange
+    client = ScriptedClient([(0.1, "slow", 0), (0, "fast")])
+    query = _create_query(client, monkeypatch, hedge_percentile=0.9)
+    query.latencies.min_samples = 1
+    query.latencies.record(0.01)
+    execution_model = _create_execution_model()
+
+    # Act
+    result = await query.execute_query(execution_model)
+
+    # Assert
+    assert result == "slow"
+    assert len(client.created) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_cancel_hedge_and_untrack_its_run_when_primary_calls_a_tool(monkeypatch):
+    # Arrange
+    client = ScriptedClient([(0.3, "slow", 0.05), (0.1, "fast")])
+    query = _create_query(client, monkeypatch, hedge_percentile=0.9)
+    query.latencies.min_samples = 1
+    query.latencies.record(0.01)
+    execution_model = _create_execution_model()
+    execution_model.run_archive = RunArchive(keep=5)
+
+    # Act
+    result = await query.execute_query(execution_model)
+
+    # Assert
+    assert result == "slow"
+    assert client.created[1].aborted is True
+    assert execution_model.current_run.tool_calls_started == 1
+    assert list(execution_model.run_archive._resident.values()) == [execution_model.current_run]
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_not_retry_when_failed_attempt_called_a_tool(monkeypatch):
+    # Arrange
+    client = ScriptedClient([(0, TimeoutError("stuck"), 0), (0, "ok")])
+    query = _create_query(client, monkeypatch)
+    execution_model = _create_execution_model()
+
+    # Act
+    result = await query.execute_query(execution_model)
+
+    # Assert
+    assert result == ""
+    assert len(client.created) == 1
+    assert execution_model.current_run.status == RunStatus.ERROR
+    assert execution_model.current_run.tool_calls_started == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_raise_without_retrying_when_failed_attempt_called_a_tool(monkeypatch):
+    # Arrange
+    client = ScriptedClient([(0, RuntimeError("429 Too Many Requests"), 0), (0, "ok")])
+    query = _create_query(client, monkeypatch)
+    execution_model = _create_execution_model()
+
+    # Act
+    with pytest.raises(RuntimeError):
+        await query.execute_query(execution_model)
+
+    # Assert
+    assert len(client.created) == 1
+    assert [error.error_type for error in execution_model.current_run.errors] == ["rate_limit"]
+
+
+@pytest.mark.asyncio
+async def test_execute_query_should_fail_its_own_run_when_a_sibling_started_a_later_turn(monkeypatch):
+    # Arrange
+    client = ScriptedClient([(0.05, TimeoutError("stuck"))])
+    query = _create_query(client, monkeypatch, run_max_attempts=1)
+    execution_model = _create_execution_model()
+
+    async def start_sibling():
+        await asyncio.sleep(0.01)
+        execution_model.start_turn()
+        return execution_model.start_run("sibling", "copilot", RunStatus.RUNNING, None)
+
+    # Act
+    _, sibling = await asyncio.gather(query.execute_query(execution_model), start_sibling())
+
+    # Assert
+    assert execution_model.turns[0].run.status == RunStatus.ERROR
+    assert sibling.status == RunStatus.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_handle_should_throttle_scheduler_when_session_reports_provider_rate_limit(monkeypatch):
+    # Arrange
+    error = SimpleNamespace(error_type="provider_error", message="Request failed", stack=None, status_code=429)
+    client = ScriptedClient([error], session_type=SessionErrorSession)
+    scheduler = RequestScheduler(max_concurrency=4)
+    plugin = RunAgentPlugin(agent_service=_create_query(client, monkeypatch), scheduler=scheduler)
+    execution_model = _create_execution_model()
+
+    # Act
+    await plugin.handle("", execution_model=execution_model)
+
+    # Assert
+    assert [e.error_type for e in execution_model.turns[0].run.errors] == ["rate_limit"]
+    assert scheduler.limit == 2
@@ -0,0 +1,77 @@
+from lime_ai.libs.copilot.retry import (
+    ERROR_RATE_LIMIT,
+    ERROR_SESSION,
+    ERROR_TIMEOUT,
+    LatencyTracker,
+    RetryPolicy,
+    classify_error,
+    classify_session_error,
+)
+
+
+def test_classify_error_should_map_timeouts_rate_limits_and_other_errors():
+    # Act
+    kinds = [
+        classify_error(TimeoutError("Timeout after 300s")),
+        classify_error(Exception("Session error: 429 Too Many Requests")),
+        classify_error(Exception("Session error: model not found")),
+    ]
+
+    # Assert
+    assert kinds == [ERROR_TIMEOUT, ERROR_RATE_LIMIT, ERROR_SESSION]
+
+
+def test_classify_session_error_should_detect_rate_limits_by_status_code_or_provider_text():
+    # Act
+    kinds = [
+        classify_session_error("provider_error", "Request failed", 429),
+        classify_session_error("quota_exceeded", "You have exceeded your monthly quota", None),
+        classify_session_error("model_error", "Model not found", 404),
+    ]
+
+    # Assert
+    assert kinds == [ERROR_RATE_LIMIT, ERROR_RATE_LIMIT, ERROR_SESSION]
+
+
+def test_should_retry_should_stop_when_attempts_exhausted_or_error_not_retryable():
+    # Arrange
+    policy = RetryPolicy(max_attempts=2)
+
+    # Act
+    results = [
+        policy.should_retry(1, ERROR_TIMEOUT),
+        policy.should_retry(2, ERROR_TIMEOUT),
+        policy.should_retry(1, ERROR_SESSION),
+    ]
+
+    # Assert
+    assert results == [True, False, False]
+
+
+def test_delay_should_grow_exponentially_and_respect_cap():
+    # Arrange
+    policy = RetryPolicy(backoff=1.0, backoff_max=3.0)
+
+    # Act
+    delays = [policy.delay(attempt) for attempt in (1, 2, 3)]
+
+    # Assert
+    assert 1.0 <= delays[0] <= 1.25
+    assert 2.0 <= delays[1] <= 2.5
+    assert 3.0 <= delays[2] <= 3.75
+
+
+def test_percentile_should_return_none_until_enough_samples():
+    # Arrange
+    tracker = LatencyTracker(min_samples=3)
+    tracker.record(1.0)
+    tracker.record(2.0)
+
+    # Act
+    before = tracker.percentile(0.9)
+    tracker.record(10.0)
+    after = tracker.percentile(0.9)
+
+    # Assert
+    assert before is None
+    assert after == 10.0
@@ -0,0 +1,284 @@
+import asyncio
+import gc
+
+import pytest
+
+from lime_ai.libs.copilot.session_pool import CopilotSessionPool, PooledSession, SessionKey
+
+
+class FakeSession:
+    """Test double for a Copilot session that records destruction."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.destroyed = False
+
+    async def destroy(self):
+        self.destroyed = True
+
+
+def _create_key(model: str = "gpt-5-mini", tools: list[str] | None = None) -> SessionKey:
+    return SessionKey(model=model, system_message="append:", tools_signature=SessionKey.hash_tools(tools or []))
+
+
+def _create_factory():
+    created: list[FakeSession] = []
+
+    async def factory(entry: PooledSession):
+        session = FakeSession(f"{entry.key.model}-{len(created)}")
+        created.append(session)
+        return session
+
+    return factory, created
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_reuse_session_when_key_matches_and_released():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, created = _create_factory()
+    key = _create_key()
+
+    # Act
+    first = await pool.acquire(key, factory)
+    await pool.release(first)
+    second = await pool.acquire(key, factory)
+
+    # Assert
+    assert second is first
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_create_new_session_when_tools_or_model_change():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, created = _create_factory()
+
+    # Act
+    first = await pool.acquire(_create_key(), factory)
+    await pool.release(first)
+    with_tools = await pool.acquire(_create_key(tools=["add|int"]), factory)
+    await pool.release(with_tools)
+    other_model = await pool.acquire(_create_key(model="gpt-4"), factory)
+
+    # Assert
+    assert len({id(first.session), id(with_tools.session), id(other_model.session)}) == 3
+    assert len(created) == 3
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_not_share_session_when_already_leased():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, _ = _create_factory()
+    key = _create_key()
+
+    # Act
+    first = await pool.acquire(key, factory)
+    second = await pool.acquire(key, factory)
+
+    # Assert
+    assert first.session is not second.session
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_prewarm_should_create_idle_session_that_acquire_uses():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, created = _create_factory()
+    key = _create_key()
+
+    # Act
+    task = await pool.prewarm(key, factory)
+    await task
+    entry = await pool.acquire(key, factory)
+
+    # Assert
+    assert len(created) == 1
+    assert entry.session is created[0]
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_wait_for_pending_prewarm_when_session_is_still_being_created():
+    # Arrange
+    pool = CopilotSessionPool()
+    key = _create_key()
+    release_factory = asyncio.Event()
+    created: list[FakeSession] = []
+
+    async def slow_factory(entry: PooledSession):
+        await release_factory.wait()
+        created.append(FakeSession(f"session-{len(created)}"))
+        return created[-1]
+
+    task = await pool.prewarm(key, slow_factory)
+    await asyncio.sleep(0)
+
+    # Act
+    acquiring = asyncio.create_task(pool.acquire(key, slow_factory))
+    await asyncio.sleep(0)
+    release_factory.set()
+    entry = await acquiring
+    await task
+
+    # Assert
+    assert len(created) == 1
+    assert entry.session is created[0]
+    assert entry.in_use
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_create_session_when_pending_prewarm_fails():
+    # Arrange
+    pool = CopilotSessionPool()
+    key = _create_key()
+    factory, created = _create_factory()
+    fail = asyncio.Event()
+
+    async def failing_factory(entry: PooledSession):
+        await fail.wait()
+        raise RuntimeError("CLI not available")
+
+    task = await pool.prewarm(key, failing_factory)
+    await asyncio.sleep(0)
+
+    # Act
+    acquiring = asyncio.create_task(pool.acquire(key, factory))
+    await asyncio.sleep(0)
+    fail.set()
+    entry = await acquiring
+    await task
+
+    # Assert
+    assert entry.session is created[0]
+    assert pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_prewarm_should_do_nothing_when_idle_session_exists():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, _ = _create_factory()
+    key = _create_key()
+    await pool.release(await pool.acquire(key, factory))
+
+    # Act
+    task = await pool.prewarm(key, factory)
+
+    # Assert
+    assert task is None
+
+
+@pytest.mark.asyncio
+async def test_evict_idle_should_destroy_sessions_past_idle_timeout():
+    # Arrange
+    pool = CopilotSessionPool(idle_timeout=10)
+    factory, created = _create_factory()
+    entry = await pool.acquire(_create_key(), factory)
+    await pool.release(entry)
+
+    # Act
+    evicted = await pool.evict_idle(now=entry.last_used + 11)
+
+    # Assert
+    assert evicted == 1
+    assert created[0].destroyed is True
+    assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_release_should_destroy_least_recently_used_when_over_max_size():
+    # Arrange
+    pool = CopilotSessionPool(max_size=1)
+    factory, created = _create_factory()
+    first = await pool.acquire(_create_key(model="a"), factory)
+    second = await pool.acquire(_create_key(model="b"), factory)
+
+    # Act
+    await pool.release(first)
+    await pool.release(second)
+
+    # Assert
+    assert pool.size == 1
+    assert created[0].destroyed is True
+    assert created[1].destroyed is False
+
+
+@pytest.mark.asyncio
+async def test_clear_should_destroy_leased_session_on_release():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, created = _create_factory()
+    entry = await pool.acquire(_create_key(), factory)
+
+    # Act
+    await pool.clear()
+    destroyed_before_release = created[0].destroyed
+    await pool.release(entry)
+
+    # Assert
+    assert destroyed_before_release is False
+    assert created[0].destroyed is True
+    assert pool.size == 0
+
+
+class FakeOwner:
+    """Stands in for an ExecutionModel leasing sessions."""
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_return_owners_session_when_several_are_idle():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, _ = _create_factory()
+    key = _create_key()
+    first_owner, second_owner = FakeOwner(), FakeOwner()
+    first = await pool.acquire(key, factory, owner=first_owner)
+    second = await pool.acquire(key, factory, owner=second_owner)
+    await pool.release(second)
+    await pool.release(first)
+
+    # Act
+    leased = await pool.acquire(key, factory, owner=second_owner)
+
+    # Assert
+    assert leased is second
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_not_reuse_session_when_owned_by_another_live_execution():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, created = _create_factory()
+    key = _create_key()
+    first_owner = FakeOwner()
+    await pool.release(await pool.acquire(key, factory, owner=first_owner))
+
+    # Act
+    leased = await pool.acquire(key, factory, owner=FakeOwner())
+
+    # Assert
+    assert leased.session is created[1]
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_acquire_should_create_fresh_session_and_destroy_old_one_when_previous_owner_is_gone():
+    # Arrange
+    pool = CopilotSessionPool()
+    factory, created = _create_factory()
+    key = _create_key()
+    owner = FakeOwner()
+    await pool.release(await pool.acquire(key, factory, owner=owner))
+    del owner
+    gc.collect()
+
+    # Act
+    leased = await pool.acquire(key, factory, owner=FakeOwner())
+
+    # Assert
+    assert leased.session is created[1]
+    assert created[0].destroyed is True
+    assert pool.size == 1
@@ -0,0 +1,74 @@
+import pytest
+
+from lime_ai.libs.copilot.tools.state_projection import ProjectionError, describe, page, project
+
+
+def test_project_should_map_rest_of_path_over_items_when_path_has_wildcard():
+    # Arrange
+    value = {"files": [{"name": "a.py", "size": 1}, {"name": "b.py", "size": 2}]}
+
+    # Act
+    names = project(value, "$.files[*].name")
+
+    # Assert
+    assert names == ["a.py", "b.py"]
+
+
+def test_project_should_apply_index_and_slice_when_path_has_brackets():
+    # Arrange
+    value = {"plan": {"steps": ["one", "two", "three"]}}
+
+    # Act
+    last = project(value, "plan.steps[-1]")
+    first_two = project(value, "plan.steps[0:2]")
+
+    # Assert
+    assert last == "three"
+    assert first_two == ["one", "two"]
+
+
+def test_project_should_return_none_when_key_or_index_is_missing():
+    # Arrange
+    value = {"items": [1]}
+
+    # Act & Assert
+    assert project(value, "missing.key") is None
+    assert project(value, "items[5]") is None
+
+
+def test_project_should_raise_projection_error_when_path_is_malformed():
+    # Arrange & Act & Assert
+    with pytest.raises(ProjectionError):
+        project({"a": 1}, "a[?]")
+
+
+def test_page_should_return_slice_and_next_offset_when_more_items_follow():
+    # Arrange
+    value = list(range(10))
+
+    # Act
+    items, info = page(value, offset=2, limit=3)
+
+    # Assert
+    assert items == [2, 3, 4]
+    assert info == {"total": 10, "offset": 2, "next_offset": 5}
+
+
+def test_page_should_return_value_unchanged_when_value_is_not_a_sequence():
+    # Arrange & Act
+    value, info = page({"a": 1}, offset=0, limit=5)
+
+    # Assert
+    assert value == {"a": 1}
+    assert info == {}
+
+
+def test_describe_should_report_type_length_and_keys_when_value_is_dict():
+    # Arrange & Act
+    hint = describe({"a": 1, "b": [1, 2]})
+
+    # Assert
+    assert hint["type"] == "dict"
+    assert hint["length"] == 2
+    assert hint["keys"] == ["a", "b"]
+    assert hint["chars"] > 0
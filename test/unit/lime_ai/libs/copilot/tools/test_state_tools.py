@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from lime_ai.core.agents.models import ExecutionModel
+from lime_ai.libs.copilot.tools.get_variable_from_state import create_get_variable_tool, create_list_variables_tool
+from lime_ai.libs.copilot.tools.set_variable_in_state import create_set_variable_tool
+
+
+async def _invoke(tool, arguments: dict) -> dict:
+    result = await tool.handler({"arguments": arguments})
+    return json.loads(result["textResultForLlm"])
+
+
+def _create_execution_model() -> ExecutionModel:
+    model = ExecutionModel()
+    model.context.set_variable("files", [{"name": f"f{i}.py"} for i in range(5)])
+    model.context.set_variable("status", "green")
+    return model
+
+
+@pytest.mark.asyncio
+async def test_get_variable_should_return_projected_page_when_path_and_limit_are_given():
+    # Arrange
+    model = _create_execution_model()
+    tool = await create_get_variable_tool(lambda: model)
+
+    # Act
+    result = await _invoke(tool, {"variable": "files", "path": "[*].name", "offset": 0, "limit": 2})
+
+    # Assert
+    assert result["files"] == ["f0.py", "f1.py"]
+    assert result["_paging"]["files"] == {"total": 5, "offset": 0, "next_offset": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_variable_should_return_all_requested_variables_when_batch_is_given():
+    # Arrange
+    model = _create_execution_model()
+    tool = await create_get_variable_tool(lambda: model)
+
+    # Act
+    result = await _invoke(tool, {"variables": ["status", "missing"]})
+
+    # Assert
+    assert result == {"status": "green", "missing": None}
+
+
+@pytest.mark.asyncio
+async def test_set_variable_should_set_every_variable_when_values_are_given():
+    # Arrange
+    model = _create_execution_model()
+    tool = await create_set_variable_tool(lambda: model)
+
+    # Act
+    result = await _invoke(tool, {"values": {"status": "red", "attempts": 2}})
+
+    # Assert
+    assert result == {"updated": ["status", "attempts"]}
+    assert model.context.get_variable_value("status") == "red"
+    assert model.context.get_variable_value("attempts") == 2
+
+
+@pytest.mark.asyncio
+async def test_list_variables_should_return_size_hints_without_values():
+    # Arrange
+    model = _create_execution_model()
+    tool = await create_list_variables_tool(lambda: model)
+
+    # Act
+    result = await _invoke(tool, {})
+
+    # Assert
+    assert result["files"]["type"] == "list"
+    assert result["files"]["length"] == 5
+    assert result["status"] == {"type": "str", "length": 5, "chars": 7}
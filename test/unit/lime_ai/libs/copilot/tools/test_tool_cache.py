@@ -0,0 +1,58 @@
+from pydantic import BaseModel
+
+from lime_ai.libs.copilot.tools.tool_cache import ToolDefinitionCache
+
+
+class AddParams(BaseModel):
+    """Parameters for the test tool."""
+
+    a: int
+    b: int
+
+
+def add(params: AddParams) -> int:
+    return params.a + params.b
+
+
+def subtract(params: AddParams) -> int:
+    return params.a - params.b
+
+
+def test_get_should_return_same_tool_when_definition_is_unchanged():
+    # Arrange
+    cache = ToolDefinitionCache()
+
+    # Act
+    first = cache.get("add", "Add numbers", add, AddParams)
+    second = cache.get("add", "Add numbers", add, AddParams)
+
+    # Assert
+    assert first is second
+    assert first.parameters["properties"].keys() == {"a", "b"}
+
+
+def test_get_should_compile_new_tool_when_handler_changes():
+    # Arrange
+    cache = ToolDefinitionCache()
+
+    # Act
+    first = cache.get("add", "", add, AddParams)
+    second = cache.get("add", "", subtract, AddParams)
+
+    # Assert
+    assert first is not second
+    assert len(cache) == 2
+
+
+def test_get_should_evict_least_recently_used_when_over_max_size():
+    # Arrange
+    cache = ToolDefinitionCache(max_size=1)
+    first = cache.get("add", "", add, AddParams)
+
+    # Act
+    cache.get("subtract", "", subtract, AddParams)
+    again = cache.get("add", "", add, AddParams)
+
+    # Assert
+    assert len(cache) == 1
+    assert again is not first